@@ -82,6 +82,27 @@ OUTPUT_AUDIO_CODEC = 'aac'
 OUTPUT_AUDIO_BITRATE = '192k'
 OUTPUT_AUDIO_SAMPLE_RATE = 48000
 OUTPUT_PIXEL_FORMAT = 'yuv420p'
+# Keyframe every this many seconds in encoded clips (-g/-keyint_min), so clip
+# boundaries stay keyframe-aligned for stream-copy concat (None = encoder default).
+OUTPUT_KEYFRAME_SECONDS = 1.0
+# Clips rendered at once: ffmpeg cuts and MoviePy overlay clips alike (None = min(4,
+# CPU count)). Lowered automatically so workers x OUTPUT_THREADS <= CPU count.
+CLIP_EXTRACT_WORKERS = None
+# Up to this many overlay-free clips share one ffmpeg process (one seeked input and
+# one output per clip). Batches shrink so every worker still gets one.
+CLIP_BATCH_SIZE = 8
+# Cut overlay-free clips with stream copy (no re-encode). Starts snap back to the previous
+# keyframe, so clips may open up to one GOP early. The reel itself is stream-copied
+# whenever all clips share codec parameters.
+CLIP_STREAM_COPY = False
+# Overlay-free clip windows that overlap or sit within this many seconds of each other
+# are cut as one clip shared by all their events; the clip manifest lists such a clip
+# once, with every covered event under "events" (None = one clip per event).
+CLIP_MERGE_GAP = 2.0
+# Hardware decode for re-encoded cuts and torchcodec sampling: 'cuda', 'vaapi',
+# 'videotoolbox', ... or 'auto' (first method `ffmpeg -hwaccels` lists). None = software.
+# A failed hardware run is redone in software. Encoding still uses OUTPUT_CODEC.
+VIDEO_HWACCEL = None
 
 AUDIO_SAMPLE_RATE = 22050
 GOAL_ENERGY_THRESHOLD = 0.75
@@ -92,6 +113,10 @@ MAX_HIGHLIGHT_CLIPS = 12
 DEFAULT_CLIP_BEFORE_TIME = 15
 DEFAULT_CLIP_AFTER_TIME = 4
 BOX_SCORE_TIME_IS_ELAPSED = True  # Box scores list time elapsed in period
+# Game ID / box score lookups are cached under <data_dir>/box_score_cache; entries
+# older than this are re-fetched so live scores and stat corrections are picked up
+# on reruns (None = keep forever; --refresh / refresh=True bypasses the cache).
+BOX_SCORE_CACHE_TTL_SECONDS = 24 * 60 * 60
 AUTO_UPLOAD_GAME_ARCHIVES_TO_DRIVE = str(
     os.environ.get("AUTO_UPLOAD_GAME_ARCHIVES_TO_DRIVE", "1")
 ).strip().lower() not in {"0", "false", "no", "off"}
@@ -104,12 +129,45 @@ OCR_ENABLE_EASYOCR_FALLBACK = True
 OCR_EASYOCR_LANGS = ["en"]
 OCR_EASYOCR_GPU = False
 
+# Fast path: learn glyph templates from confident backend reads and template-match
+# the clock directly; reads below the confidence floor fall back to the backends.
+OCR_DIGIT_TEMPLATE_FAST_PATH = True
+OCR_DIGIT_TEMPLATE_MIN_CONFIDENCE = 90.0
+OCR_DIGIT_TEMPLATE_LEARN_MIN_CONFIDENCE = 85.0
+
+# Standard preprocessing stretches contrast with a LUT calibrated once per ROI
+# (2nd-98th percentile); any crop with less range than this (checked on every
+# frame) falls back to CLAHE and never calibrates the LUT.
+OCR_CONTRAST_STRETCH_LUT = True
+OCR_CONTRAST_STRETCH_MIN_RANGE = 60
+
 # Health thresholds for hybrid behavior (probe + rerun sampling before failing).
 OCR_MIN_SUCCESS_RATE = 0.05
 OCR_MIN_PERIOD_RATE = 0.20
 OCR_MIN_AVG_CONFIDENCE = 55.0
 OCR_HEALTH_BAD_CONSECUTIVE_SAMPLES_RESET = 10
 
+# Parallel OCR sampling snaps sample times onto keyframes (requires PyAV) so each
+# capture decodes one keyframe instead of seeking and decoding forward.
+OCR_KEYFRAME_ALIGNED_SAMPLING = True
+# Single-frame reads (game start detection, clock refinement, sequential OCR) seek and
+# decode in-process with PyAV instead of through MoviePy's ffmpeg pipe (when installed).
+VIDEO_PYAV_FRAME_ACCESS = True
+# Prefer torchcodec's persistent decoder for those reads when it is installed.
+VIDEO_TORCHCODEC_FRAME_ACCESS = True
+# OCR sampling converts decoded frames into this many recycled RGB buffers instead of
+# allocating a new array per frame (0 = allocate per frame).
+VIDEO_FRAME_POOL_SIZE = 2
+# Decode up to this many OCR sample frames ahead on a background thread while the
+# current one is cropped/hashed (0 = decode inline).
+OCR_PREFETCH_FRAMES = 4
+
+# Frozen clock (intermissions/stoppages): after two identical reads on an unchanged
+# scene, skip this many samples without decoding/OCR (no timestamps are recorded).
+# Scene change is judged by a 64-bit frame hash (max differing bits). 0 disables.
+OCR_FROZEN_CLOCK_SKIP_SAMPLES = 3
+OCR_FROZEN_CLOCK_MAX_HASH_DISTANCE = 4
+
 # Save scorebug-only crops for failed / low-confidence samples so FloHockey OCR
 # issues can be diagnosed without storing full-frame images for every attempt.
 OCR_DEBUG_SAVE_SCOREBUG_CROPS = True
@@ -30,6 +30,8 @@ from .time_utils import (
     seconds_to_time_string,
     period_time_to_absolute_seconds,
     absolute_seconds_to_period_time,
+    period_time_to_absolute_seconds_vec,
+    absolute_seconds_to_period_time_vec,
     format_period,
     parse_period_string,
     PERIOD_LENGTH_MINUTES,
@@ -69,6 +71,8 @@ __all__ = [
     'seconds_to_time_string',
     'period_time_to_absolute_seconds',
     'absolute_seconds_to_period_time',
+    'period_time_to_absolute_seconds_vec',
+    'absolute_seconds_to_period_time_vec',
     'format_period',
     'parse_period_string',
     'PERIOD_LENGTH_MINUTES',
@@ -28,6 +28,14 @@ class BoxScoreFetcher:
     # HockeyTech API base URL
     API_BASE = "https://lscluster.hockeytech.com/feed/"
 
+    # Request-level retries for transient failures (429/5xx, dropped
+    # connections, timeouts). HTTP status retries live only here; the session's
+    # transport retries cover connection setup.
+    REQUEST_ATTEMPTS = 3
+    REQUEST_BACKOFF_SECONDS = 1.0
+    REQUEST_BACKOFF_MAX_SECONDS = 30.0
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
     # League configurations
     LEAGUE_CONFIGS = {
         'MHL': {
@@ -42,16 +50,29 @@ class BoxScoreFetcher:
         }
     }
 
-    def __init__(self, cache_dir: Optional[Path] = None, *, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        *,
+        api_key: Optional[str] = None,
+        cache_ttl_seconds: Optional[float] = None,
+    ):
         """
         Initialize BoxScoreFetcher
 
         Args:
             cache_dir: Directory for caching box score data
+            cache_ttl_seconds: Max age of on-disk cache entries (None = never expire)
         """
         self.cache_dir = cache_dir
         if cache_dir:
             cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_ttl_seconds = cache_ttl_seconds
+        # When True, skip cache reads (results are still written back).
+        self.refresh = False
+        # In-process results keyed by call arguments; reruns in the same process
+        # (batch reprocessing, retries) never repeat a lookup.
+        self._memory_cache: Dict[tuple, Any] = {}
 
         self.api_key = (api_key or os.environ.get("HOCKEYTECH_API_KEY") or "").strip()
 
@@ -61,6 +82,28 @@ class BoxScoreFetcher:
         # Parser for extracting goals from box scores
         self.parser = BoxScoreParser()
 
+    def _read_cache_file(self, cache_file: Path) -> Optional[Any]:
+        """Load a JSON cache entry unless refreshing, missing, or older than the TTL."""
+        if self.refresh or not cache_file.exists():
+            return None
+        try:
+            if self.cache_ttl_seconds is not None:
+                age = time.time() - cache_file.stat().st_mtime
+                if age > float(self.cache_ttl_seconds):
+                    logger.info(f"Cache entry expired ({age:.0f}s old): {cache_file}")
+                    return None
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+            return None
+
+    def _write_cache_file(self, cache_file: Path, data: Any) -> None:
+        try:
+            cache_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            logger.debug(f"Cached to {cache_file}")
+        except OSError as e:
+            logger.warning(f"Failed to write cache file {cache_file}: {e}")
+
     def _require_api_key(self) -> None:
         if not self.api_key:
             raise RuntimeError("Missing HockeyTech API key. Set HOCKEYTECH_API_KEY in your environment.")
@@ -74,11 +117,11 @@ class BoxScoreFetcher:
         """
         session = requests.Session()
 
-        # Configure retry strategy
+        # Configure retry strategy (HTTP status codes are retried by
+        # _get_with_backoff, so they are not retried again here)
         retry_strategy = Retry(
             total=3,                          # Total number of retries
             backoff_factor=1,                 # Wait 1s, 2s, 4s between retries
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these HTTP status codes
             allowed_methods=["HEAD", "GET", "OPTIONS"]   # Only retry safe methods
         )
 
@@ -91,6 +134,45 @@ class BoxScoreFetcher:
 
         return session
 
+    def _is_transient_error(self, exc: Exception) -> bool:
+        """Classify request failures worth retrying (rate limits, outages, network)."""
+        if isinstance(exc, requests.HTTPError):
+            status = getattr(exc.response, "status_code", None)
+            return status in self.RETRYABLE_STATUS_CODES
+        return isinstance(exc, (
+            requests.ConnectionError,
+            requests.Timeout,
+            requests.exceptions.ChunkedEncodingError,
+        ))
+
+    def _get_with_backoff(self, params: Dict[str, Any]) -> requests.Response:
+        """
+        GET the feed endpoint, retrying transient failures with exponential backoff.
+
+        Waits REQUEST_BACKOFF_SECONDS, then doubles (capped at
+        REQUEST_BACKOFF_MAX_SECONDS) for up to REQUEST_ATTEMPTS attempts.
+        Non-transient errors and the final transient error are re-raised.
+        """
+        delay = float(self.REQUEST_BACKOFF_SECONDS)
+        for attempt in range(1, int(self.REQUEST_ATTEMPTS) + 1):
+            try:
+                response = self.session.get(
+                    f"{self.API_BASE}index.php",
+                    params=params,
+                    timeout=(5, 15)  # (connect timeout, read timeout)
+                )
+                response.raise_for_status()
+                return response
+            except Exception as e:
+                if attempt >= self.REQUEST_ATTEMPTS or not self._is_transient_error(e):
+                    raise
+                logger.warning(
+                    "Transient API error (%s); retrying in %.0fs (attempt %d/%d)",
+                    e, delay, attempt + 1, self.REQUEST_ATTEMPTS,
+                )
+                time.sleep(delay)
+                delay = min(delay * 2, float(self.REQUEST_BACKOFF_MAX_SECONDS))
+
     def find_game(
         self,
         league: str,
@@ -110,8 +192,26 @@ class BoxScoreFetcher:
         Returns:
             Game ID string or None if not found
         """
-        try:
-            self._require_api_key()
+        memo_key = ("find_game", str(league).upper(), home_team, away_team, game_date)
+        if not self.refresh and memo_key in self._memory_cache:
+            return self._memory_cache[memo_key]
+
+        cache_file = None
+        if self.cache_dir:
+            slug = "_".join(
+                "".join(ch if ch.isalnum() else "-" for ch in str(part)).strip("-")
+                for part in (league, game_date, home_team, away_team)
+            )
+            cache_file = Path(self.cache_dir) / f"{slug}_game_id.json"
+            cached = self._read_cache_file(cache_file)
+            if isinstance(cached, dict) and cached.get("game_id"):
+                logger.info(f"Loading game ID from cache: {cache_file}")
+                game_id = str(cached["game_id"])
+                self._memory_cache[memo_key] = game_id
+                return game_id
+
+        try:
+            self._require_api_key()
 
             # Get league configuration
             config = self.LEAGUE_CONFIGS.get(league.upper())
@@ -137,12 +237,7 @@ class BoxScoreFetcher:
             logger.info(f"Searching for game: {home_team} vs {away_team} on {game_date}")
 
             # Fetch schedule with retry logic
-            response = self.session.get(
-                f"{self.API_BASE}index.php",
-                params=params,
-                timeout=(5, 15)  # (connect timeout, read timeout)
-            )
-            response.raise_for_status()
+            response = self._get_with_backoff(params)
 
             schedule_data = response.json()
 
@@ -190,6 +285,9 @@ class BoxScoreFetcher:
 
                     game_id = game.get('id') or game.get('game_id')
                     logger.info(f"Found game ID: {game_id}")
+                    self._memory_cache[memo_key] = str(game_id)
+                    if cache_file is not None:
+                        self._write_cache_file(cache_file, {"game_id": str(game_id)})
                     return str(game_id)
 
             logger.warning(f"No game found for {home_team} vs {away_team} on {game_date}")
@@ -210,14 +308,19 @@ class BoxScoreFetcher:
         Returns:
             Box score dictionary or None if failed
         """
+        memo_key = ("fetch_box_score", str(league).upper(), str(game_id))
+        if not self.refresh and memo_key in self._memory_cache:
+            return self._memory_cache[memo_key]
+
         try:
             # Check cache first
             if self.cache_dir:
-                cache_file = self.cache_dir / f"{league}_{game_id}_boxscore.json"
-                if cache_file.exists():
+                cache_file = Path(self.cache_dir) / f"{league}_{game_id}_boxscore.json"
+                cached = self._read_cache_file(cache_file)
+                if isinstance(cached, dict):
                     logger.info(f"Loading box score from cache: {cache_file}")
-                    with open(cache_file, 'r') as f:
-                        return json.load(f)
+                    self._memory_cache[memo_key] = cached
+                    return cached
 
             # Get league configuration
             config = self.LEAGUE_CONFIGS.get(league.upper())
@@ -243,12 +346,7 @@ class BoxScoreFetcher:
             time.sleep(0.2)
 
             # Fetch box score with retry logic
-            response = self.session.get(
-                f"{self.API_BASE}index.php",
-                params=params,
-                timeout=(5, 15)  # (connect timeout, read timeout)
-            )
-            response.raise_for_status()
+            response = self._get_with_backoff(params)
 
             # HockeyTech may wrap statviewfeed responses in parentheses.
             body = (response.text or "").strip()
@@ -269,12 +367,11 @@ class BoxScoreFetcher:
                 )
 
             # Cache the result
+            self._memory_cache[memo_key] = box_score
             if self.cache_dir:
-                with open(cache_file, 'w') as f:
-                    json.dump(box_score, f, indent=2)
-                logger.debug(f"Cached box score to {cache_file}")
+                self._write_cache_file(cache_file, box_score)
 
-            return box_score
+            return box_score
 
         except Exception as e:
             logger.error(f"Failed to fetch box score: {e}")
@@ -20,6 +20,7 @@ from .time_utils import (
     period_length_seconds,
     time_string_to_seconds,
     period_time_to_absolute_seconds,
+    period_time_to_absolute_seconds_vec,
     seconds_to_time_string,
     PERIOD_LENGTH_MINUTES,
     PERIOD_LENGTH_SECONDS,
@@ -658,6 +659,50 @@ The broadcast scoreboard was broken or unreadable. Manual review required.
             logger.error(f"Failed to send scoreboard alert email: {e}")
 
 
+def _period_key(period) -> int:
+    """Integer period for array comparisons (-1 stands in for a missing period)."""
+    return -1 if period is None else int(period)
+
+
+class _TimestampTable:
+    """
+    Column (structure-of-arrays) view over a list of video timestamp dicts.
+
+    Built once per matching pass so each event selects and ranks candidates with
+    array operations instead of re-walking every dict. `rows` keeps the original
+    dicts for returning matches.
+    """
+    __slots__ = ('rows', 'periods', 'game_seconds', 'video_times', '_abs_seconds')
+
+    def __init__(self, rows: List[Dict]):
+        n = len(rows)
+        self.rows = rows
+        self.periods = np.fromiter((_period_key(ts.get('period')) for ts in rows), dtype=np.int64, count=n)
+        self.game_seconds = np.fromiter(
+            (float(ts.get('game_time_seconds', 0) or 0) for ts in rows), dtype=np.float64, count=n
+        )
+        # Same coercion as the per-row minimum-video-time filter: missing/0 -> -1.
+        self.video_times = np.fromiter(
+            (float(ts.get('video_time', -1.0) or -1.0) for ts in rows), dtype=np.float64, count=n
+        )
+        self._abs_seconds: Optional[np.ndarray] = None
+
+    def absolute_seconds(self, clock_rules) -> np.ndarray:
+        """Absolute game time of every row (unknown period counts as period 1)."""
+        if self._abs_seconds is None:
+            self._abs_seconds = period_time_to_absolute_seconds_vec(
+                np.maximum(self.periods, 1), self.game_seconds, clock_rules
+            )
+        return self._abs_seconds
+
+    def select(self, period=None, minimum_video_time: Optional[float] = None, *, any_period: bool = False) -> np.ndarray:
+        """Row indices in `period` (or all rows) at/after `minimum_video_time`."""
+        mask = np.ones(len(self.rows), dtype=bool) if any_period else self.periods == _period_key(period)
+        if minimum_video_time is not None:
+            mask &= self.video_times >= minimum_video_time
+        return np.flatnonzero(mask)
+
+
 class EventMatcher:
     """Matches box score events to video timestamps"""
 
@@ -834,6 +879,7 @@ class EventMatcher:
             f"Matching {len(events)} events to {len(normalized_timestamps)} video timestamps"
         )
 
+        table = _TimestampTable(normalized_timestamps)
         low_confidence_count = 0
         for event in events:
             try:
@@ -854,26 +900,24 @@ class EventMatcher:
                 )
 
                 # Get OCR candidates in this period for logging
-                period_candidates = [
-                    ts for ts in normalized_timestamps
-                    if ts.get('period') == event_period
-                ]
-                log_entry.candidates_in_period = len(period_candidates)
+                period_idx = table.select(event_period)
+                log_entry.candidates_in_period = int(period_idx.size)
 
-                # Calculate time diff for all candidates and sort by closest
+                # Rank candidates by time diff (stable, like the old list sort) and
+                # only materialize the top 10 that get logged.
+                diffs = np.abs(event_seconds_remaining - table.game_seconds[period_idx])
                 candidates_with_diff = []
-                for ts in period_candidates:
+                for i in period_idx[np.argsort(diffs, kind='stable')[:10]]:
+                    ts = normalized_timestamps[int(i)]
                     ts_seconds = ts.get('game_time_seconds', 0)
-                    time_diff = abs(event_seconds_remaining - ts_seconds)
                     candidates_with_diff.append({
                         'video_time': ts.get('video_time', 0),
                         'ocr_time': ts.get('game_time', '0:00'),
                         'ocr_seconds': ts_seconds,
-                        'time_diff': time_diff,
+                        'time_diff': abs(event_seconds_remaining - ts_seconds),
                         'period': ts.get('period'),
                     })
-                candidates_with_diff.sort(key=lambda c: c['time_diff'])
-                log_entry.all_candidates = candidates_with_diff[:10]  # Keep top 10
+                log_entry.all_candidates = candidates_with_diff  # Keep top 10
 
                 if candidates_with_diff:
                     best = candidates_with_diff[0]
@@ -887,6 +931,7 @@ class EventMatcher:
                     normalized_timestamps,
                     tolerance_seconds,
                     recording_game_start_time=recording_game_start_time,
+                    table=table,
                 )
 
                 if match_result is not None:
@@ -1061,6 +1106,7 @@ class EventMatcher:
         tolerance_seconds: int,
         *,
         recording_game_start_time: Optional[float] = None,
+        table: Optional[_TimestampTable] = None,
     ) -> Optional[Tuple[float, float, float, str]]:
         """
         Find the closest video timestamp for a box score event with confidence score
@@ -1069,6 +1115,7 @@ class EventMatcher:
             event: Event dictionary with period and time
             video_timestamps: List of video timestamp dictionaries
             tolerance_seconds: Maximum allowed time difference
+            table: Column view of video_timestamps to reuse across events
 
         Returns:
             Tuple of (video_time, confidence, time_diff, match_method) or None if no match found
@@ -1081,48 +1128,34 @@ class EventMatcher:
         # Convert event time to seconds remaining (OCR clock is countdown)
         event_seconds = self._event_time_to_remaining_seconds(event_period, event_time)
 
-        # Filter timestamps for matching period
-        period_timestamps = [
-            ts for ts in video_timestamps
-            if ts.get('period') == event_period
-        ]
+        if table is None:
+            table = _TimestampTable(video_timestamps)
 
+        # Timestamps in the matching period (and not before the plausible game time)
         minimum_video_time = self.minimum_video_time_for_event(
             event,
             recording_game_start_time=recording_game_start_time,
         )
-        if minimum_video_time is not None:
-            period_timestamps = [
-                ts for ts in period_timestamps
-                if float(ts.get("video_time", -1.0) or -1.0) >= minimum_video_time
-            ]
+        period_idx = table.select(event_period, minimum_video_time)
 
-        if not period_timestamps:
+        if not period_idx.size:
             # Try interpolation if we have timestamps before and after this period
             video_time = self._interpolate_timestamp(
                 event,
                 video_timestamps,
                 recording_game_start_time=recording_game_start_time,
+                table=table,
             )
             if video_time is not None:
                 # Lower confidence for interpolated matches
                 return (video_time, 0.5, tolerance_seconds / 2, "interpolation_no_period_match")
             return None
 
-        # Find timestamp with closest game time
-        best_match = None
-        best_diff = float('inf')
-
-        for ts in period_timestamps:
-            ts_seconds = ts.get('game_time_seconds', 0)
-
-            # Calculate time difference
-            # Note: Hockey clocks count DOWN, so we need to handle this
-            time_diff = abs(event_seconds - ts_seconds)
-
-            if time_diff < best_diff:
-                best_diff = time_diff
-                best_match = ts
+        # Find timestamp with closest game time (argmin keeps the first of ties).
+        # Note: Hockey clocks count DOWN, so compare remaining seconds directly.
+        diffs = np.abs(event_seconds - table.game_seconds[period_idx])
+        best_match = video_timestamps[int(period_idx[int(np.argmin(diffs))])]
+        best_diff = abs(event_seconds - best_match.get('game_time_seconds', 0))
 
         # Check if match is within tolerance
         if best_match and best_diff <= tolerance_seconds:
@@ -1142,6 +1175,7 @@ class EventMatcher:
             event,
             video_timestamps,
             recording_game_start_time=recording_game_start_time,
+            table=table,
         )
         if video_time is not None:
             # Very low confidence for interpolated matches outside tolerance
@@ -1155,6 +1189,7 @@ class EventMatcher:
         video_timestamps: List[Dict],
         *,
         recording_game_start_time: Optional[float] = None,
+        table: Optional[_TimestampTable] = None,
     ) -> Optional[float]:
         """
         Interpolate video timestamp when exact period match not found
@@ -1162,6 +1197,7 @@ class EventMatcher:
         Args:
             event: Event dictionary
             video_timestamps: List of video timestamps
+            table: Column view of video_timestamps to reuse across events
 
         Returns:
             Interpolated video time or None
@@ -1178,31 +1214,35 @@ class EventMatcher:
             # Convert event to absolute game time (seconds from game start)
             event_game_seconds = self._event_to_absolute_time(event_period, event_seconds)
 
-            # Find timestamps before and after the event
+            # Find timestamps before and after the event (absolute game time for
+            # every timestamp in one vectorized lookup).
             before = None
             after = None
-
-            for ts in video_timestamps:
-                if minimum_video_time is not None and float(ts.get("video_time", -1.0) or -1.0) < minimum_video_time:
-                    continue
-                ts_game_seconds = self._event_to_absolute_time(
-                    ts['period'],
-                    ts['game_time_seconds']
-                )
 
-                if ts_game_seconds <= event_game_seconds:
-                    if before is None or ts_game_seconds > before['abs_time']:
-                        before = {
-                            'video_time': ts['video_time'],
-                            'abs_time': ts_game_seconds
-                        }
-
-                if ts_game_seconds >= event_game_seconds:
-                    if after is None or ts_game_seconds < after['abs_time']:
-                        after = {
-                            'video_time': ts['video_time'],
-                            'abs_time': ts_game_seconds
-                        }
+            if table is None:
+                table = _TimestampTable(video_timestamps)
+            candidate_idx = table.select(minimum_video_time=minimum_video_time, any_period=True)
+            candidates = [video_timestamps[int(i)] for i in candidate_idx]
+
+            if candidates:
+                ts_game_seconds = table.absolute_seconds(self.clock_rules)[candidate_idx]
+
+                # argmax/argmin return the first extreme, matching the old strict scan.
+                at_or_before = np.flatnonzero(ts_game_seconds <= event_game_seconds)
+                if at_or_before.size:
+                    idx = int(at_or_before[np.argmax(ts_game_seconds[at_or_before])])
+                    before = {
+                        'video_time': candidates[idx]['video_time'],
+                        'abs_time': float(ts_game_seconds[idx])
+                    }
+
+                at_or_after = np.flatnonzero(ts_game_seconds >= event_game_seconds)
+                if at_or_after.size:
+                    idx = int(at_or_after[np.argmin(ts_game_seconds[at_or_after])])
+                    after = {
+                        'video_time': candidates[idx]['video_time'],
+                        'abs_time': float(ts_game_seconds[idx])
+                    }
 
             # Interpolate between before and after
             if before and after:
@@ -1360,6 +1400,8 @@ class EventMatcher:
             f"Matching {len(goals)} goals to {len(normalized_timestamps)} video timestamps"
         )
 
+        table = _TimestampTable(normalized_timestamps)
+
         for goal in goals:
             try:
                 # Create event dict for matching using existing logic
@@ -1376,6 +1418,7 @@ class EventMatcher:
                     normalized_timestamps,
                     tolerance_seconds,
                     recording_game_start_time=recording_game_start_time,
+                    table=table,
                 )
 
                 if match_result is not None:
@@ -1722,9 +1765,12 @@ class EventMatcher:
         fill_every = max(10.0, min(30.0, float(typical_dt) * 3.0))
         gap_threshold = max(60.0, fill_every * 4.0)
 
-        # Find gaps and interpolate
+        # Find gaps between observed samples and interpolate. New entries are
+        # collected separately so the scan never revisits its own output.
+        interpolated: List[Dict] = []
+        observed_count = len(enhanced)
         i = 0
-        while i < len(enhanced) - 1:
+        while i < observed_count - 1:
             current = enhanced[i]
             next_ts = enhanced[i + 1]
 
@@ -1774,7 +1820,7 @@ class EventMatcher:
                     # Estimate game time (counting down)
                     interp_game_time_sec = current['game_time_seconds'] - int(ratio * game_time_diff)
 
-                    enhanced.append({
+                    interpolated.append({
                         'video_time': interp_video_time,
                         'period': current['period'],
                         'game_time': f"{interp_game_time_sec//60}:{interp_game_time_sec%60:02d}",
@@ -1784,7 +1830,8 @@ class EventMatcher:
 
             i += 1
 
-        # Re-sort after adding interpolated timestamps
+        # Merge and re-sort after adding interpolated timestamps
+        enhanced.extend(interpolated)
         enhanced.sort(key=lambda t: t['video_time'])
 
         logger.info(f"Enhanced timestamps: {len(video_timestamps)} -> {len(enhanced)}")
@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, Optional, List
 import logging
 
+from .json_utils import write_json
 from .version import __version__ as HIGHLIGHT_EXTRACTOR_VERSION
 
 logger = logging.getLogger(__name__)
@@ -341,8 +342,7 @@ class FileManager:
         metadata_file = game_folders['data_dir'] / 'game_metadata.json'
 
         try:
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, indent=2, fp=f)
+            write_json(metadata_file, metadata, indent=True)
             logger.info(f"Saved game metadata to {metadata_file}")
         except Exception as e:
             logger.error(f"Failed to save metadata: {e}")
@@ -358,8 +358,7 @@ class FileManager:
         events_file = game_folders['data_dir'] / 'matched_events.json'
 
         try:
-            with open(events_file, 'w', encoding='utf-8') as f:
-                json.dump(events, indent=2, fp=f)
+            write_json(events_file, events, indent=True)
             logger.info(f"Saved {len(events)} matched events to {events_file}")
         except Exception as e:
             logger.error(f"Failed to save events: {e}")
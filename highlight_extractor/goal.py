@@ -8,10 +8,10 @@ with proper typing, validation, and time conversion utilities.
 from dataclasses import dataclass, field
 from typing import Optional, List
 from enum import Enum
-import re
 
 from .time_utils import (
     GameTime,
+    parse_time_string,
     time_string_to_seconds,
     period_time_to_absolute_seconds,
     seconds_to_time_string,
@@ -97,12 +97,10 @@ class Goal:
             raise ValueError(f"Invalid period {self.period}, expected 1-5")
 
         # Validate time format
-        if not re.match(r'^\d{1,2}:\d{2}$', self.time):
+        minutes, seconds = parse_time_string(self.time)
+        if minutes is None:
             raise ValueError(f"Invalid time format '{self.time}', expected MM:SS")
-
-        # Validate time values
-        parts = self.time.split(':')
-        minutes, seconds = int(parts[0]), int(parts[1])
+        self.time = self.time.strip()
 
         if not (0 <= minutes <= 20):
             raise ValueError(f"Invalid minutes {minutes}, expected 0-20")
@@ -0,0 +1,37 @@
+"""
+Fast JSON serialization with an optional orjson backend.
+
+orjson is a C extension that encodes large lists of dicts several times faster
+than the stdlib encoder (which falls back to pure Python whenever `indent` is
+set). It is optional: without it we produce equivalent output via `json`.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only when orjson is absent
+    orjson = None
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize `obj` to UTF-8 JSON bytes (2-space indent when `indent`)."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, int overflow); let json decide.
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def write_json(path: Path, obj: Any, *, indent: bool = False) -> None:
+    """Write `obj` as JSON to `path`."""
+    Path(path).write_bytes(dumps_bytes(obj, indent=indent))
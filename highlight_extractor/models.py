@@ -5,13 +5,16 @@ These models provide type safety, validation, and cleaner APIs for the
 hockey highlight extraction pipeline.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, List
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional, List
 from datetime import datetime
 import re
+import threading
 
+from .time_utils import parse_time_string
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GameInfo:
     """Information about a hockey game parsed from filename or metadata"""
 
@@ -60,9 +63,14 @@ class GameInfo:
         if not self.date_formatted:
             try:
                 date_obj = datetime.strptime(self.date, '%Y-%m-%d')
-                self.date_formatted = date_obj.strftime('%B %d, %Y')
+                date_formatted = date_obj.strftime('%B %d, %Y')
             except Exception:
-                self.date_formatted = self.date
+                date_formatted = self.date
+            object.__setattr__(self, 'date_formatted', date_formatted)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
 
 
 @dataclass
@@ -98,12 +106,10 @@ class Event:
             raise ValueError(f"Invalid period {self.period}, expected >= 1")
 
         # Validate time format
-        if not re.match(r'^\d{1,2}:\d{2}$', self.time):
+        minutes, seconds = parse_time_string(self.time)
+        if minutes is None:
             raise ValueError(f"Invalid time format '{self.time}', expected MM:SS")
-
-        # Parse time to validate values
-        parts = self.time.split(':')
-        minutes, seconds = int(parts[0]), int(parts[1])
+        self.time = self.time.strip()
 
         if not (0 <= minutes <= 20):
             raise ValueError(f"Invalid minutes {minutes}, expected 0-20")
@@ -209,12 +215,12 @@ class VideoTimestamp:
             raise ValueError(f"Invalid period {self.period}, expected >= 1")
 
         # Validate game_time format
-        if not re.match(r'^\d{1,2}:\d{2}$', self.game_time):
+        minutes, seconds = parse_time_string(self.game_time)
+        if minutes is None:
             raise ValueError(f"Invalid game_time format '{self.game_time}', expected MM:SS")
+        self.game_time = self.game_time.strip()
 
         # Validate game_time_seconds matches parsed time
-        parts = self.game_time.split(':')
-        minutes, seconds = int(parts[0]), int(parts[1])
         expected_seconds = minutes * 60 + seconds
 
         if self.game_time_seconds != expected_seconds:
@@ -258,7 +264,7 @@ class VideoTimestamp:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineResult:
     """Result from running the highlight extraction pipeline"""
 
@@ -284,6 +290,11 @@ class PipelineResult:
     matching_duration_seconds: Optional[float] = None
     rendering_duration_seconds: Optional[float] = None
     total_duration_seconds: Optional[float] = None
+    # Wall time per pipeline step; dotted keys are sub-steps ('fetch_box_score.find_game').
+    step_timings: Dict[str, float] = field(default_factory=dict)
+
+    # Set once the pipeline's background resource cleanup has finished.
+    cleanup_done: Optional[threading.Event] = field(default=None, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate result data"""
@@ -312,6 +323,16 @@ class PipelineResult:
             return 0.0
         return (self.events_matched / self.events_found) * 100
 
+    def wait_for_cleanup(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the pipeline has released the video and log handles.
+
+        Returns False if `timeout` expired first.
+        """
+        if self.cleanup_done is None:
+            return True
+        return self.cleanup_done.wait(timeout)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -322,7 +343,7 @@ class PipelineResult:
             'failed_step': self.failed_step,
             'failed_reason': self.failed_reason,
             'exception_type': self.exception_type,
-            'game_info': self.game_info.__dict__ if self.game_info else None,
+            'game_info': self.game_info.to_dict() if self.game_info else None,
             'events_found': self.events_found,
             'events_matched': self.events_matched,
             'clips_created': self.clips_created,
@@ -335,5 +356,6 @@ class PipelineResult:
                 'matching_duration_seconds': self.matching_duration_seconds,
                 'rendering_duration_seconds': self.rendering_duration_seconds,
                 'total_duration_seconds': self.total_duration_seconds,
+                'step_timings': dict(self.step_timings),
             }
         }
@@ -1,7 +1,9 @@
 from .tesseract_backend import TesseractBackend
 from .easyocr_backend import EasyOcrBackend
+from .digit_template_backend import DigitTemplateBackend
 
 __all__ = [
     "TesseractBackend",
     "EasyOcrBackend",
+    "DigitTemplateBackend",
 ]
@@ -0,0 +1,205 @@
+"""
+Fixed-font scoreboard clock reader based on learned glyph templates.
+
+Scoreboard clocks render a handful of characters (digits, ':' and a period
+marker) in one font at one scale, so once a few frames have been read by
+Tesseract the individual glyphs can be matched directly with
+`cv2.matchTemplate`. That costs well under a millisecond per frame versus
+several milliseconds of LSTM inference.
+
+Templates are learned online from confident reads of another backend (see
+`learn`). When any glyph in a crop matches its nearest template weakly, or
+barely better than the runner-up (typically a glyph with no template yet),
+`read_text` returns an empty result so the caller falls back to the full OCR
+backend.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from .base import OcrBackendResult
+
+logger = logging.getLogger(__name__)
+
+try:
+    import cv2
+    import numpy as np
+except ImportError:  # pragma: no cover - OpenCV is a hard dependency of the OCR engine
+    cv2 = None
+    np = None
+
+
+CELL_SIZE = 28
+# Characters worth learning; anything else in a Tesseract read is ignored.
+LEARNABLE_CHARS = set("0123456789:.OTSNDRP")
+# A glyph is read only when its best template scores at least this well and
+# beats the runner-up by the margin; otherwise the whole read is rejected.
+MIN_GLYPH_SCORE = 0.8
+MIN_GLYPH_MARGIN = 0.1
+
+
+class DigitTemplateBackend:
+    name = "digits"
+
+    def __init__(
+        self,
+        *,
+        max_samples_per_char: int = 12,
+        min_glyph_score: float = MIN_GLYPH_SCORE,
+        min_glyph_margin: float = MIN_GLYPH_MARGIN,
+    ):
+        self._max_samples_per_char = max(1, int(max_samples_per_char))
+        self._min_glyph_score = float(min_glyph_score)
+        self._min_glyph_margin = float(min_glyph_margin)
+        self._lock = threading.Lock()
+        self._sums: Dict[str, "np.ndarray"] = {}
+        self._counts: Dict[str, int] = {}
+        self._templates: Dict[str, "np.ndarray"] = {}
+
+    def is_available(self) -> bool:
+        return cv2 is not None
+
+    def is_ready(self) -> bool:
+        return bool(self._templates)
+
+    def reset(self) -> None:
+        """Drop learned templates (call when the ROI or preprocessing changes)."""
+        with self._lock:
+            self._sums.clear()
+            self._counts.clear()
+            self._templates.clear()
+
+    def _segment(self, image) -> Tuple[List["np.ndarray"], List[Tuple[int, int, int, int]]]:
+        """
+        Split a scoreboard crop into glyph cells, left to right.
+
+        Components that overlap horizontally (e.g. the two dots of ':') are merged
+        into one glyph. Returns (cells, boxes) with cells resized to CELL_SIZE².
+        """
+        gray = image
+        if gray.ndim == 3:
+            gray = cv2.cvtColor(gray, cv2.COLOR_RGB2GRAY)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        # Glyphs are the minority colour; make them white on black.
+        if cv2.countNonZero(binary) > binary.size // 2:
+            binary = cv2.bitwise_not(binary)
+
+        n, _labels, stats, _centroids = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        height = binary.shape[0]
+        min_area = max(4, int(height * height * 0.002))
+        boxes: List[List[int]] = []
+        for i in range(1, n):
+            x, y, w, h, area = (int(v) for v in stats[i])
+            if area < min_area or h >= height * 0.98:
+                continue
+            boxes.append([x, y, x + w, y + h])
+        boxes.sort(key=lambda b: b[0])
+
+        merged: List[List[int]] = []
+        for box in boxes:
+            if merged and box[0] < merged[-1][2]:
+                last = merged[-1]
+                last[0] = min(last[0], box[0])
+                last[1] = min(last[1], box[1])
+                last[2] = max(last[2], box[2])
+                last[3] = max(last[3], box[3])
+            else:
+                merged.append(list(box))
+
+        cells = []
+        out_boxes = []
+        for x0, y0, x1, y1 in merged:
+            glyph = binary[y0:y1, x0:x1]
+            # Pad to square so aspect ratio survives the resize ('1' vs '0').
+            side = max(glyph.shape)
+            pad_y = (side - glyph.shape[0]) // 2
+            pad_x = (side - glyph.shape[1]) // 2
+            square = np.zeros((side, side), dtype=np.uint8)
+            square[pad_y:pad_y + glyph.shape[0], pad_x:pad_x + glyph.shape[1]] = glyph
+            cells.append(cv2.resize(square, (CELL_SIZE, CELL_SIZE), interpolation=cv2.INTER_AREA))
+            out_boxes.append((x0, y0, x1 - x0, y1 - y0))
+        return cells, out_boxes
+
+    def learn(self, image, text: str) -> bool:
+        """
+        Add glyph templates from a crop whose text is known (a confident read).
+
+        Only used when the segmentation yields exactly one cell per character.
+        Returns True when templates were updated.
+        """
+        if not self.is_available():
+            return False
+        chars = [c for c in str(text or "").upper() if not c.isspace()]
+        if not chars or any(c not in LEARNABLE_CHARS for c in chars):
+            return False
+        if all(self._counts.get(c, 0) >= self._max_samples_per_char for c in chars):
+            return False
+
+        try:
+            cells, _boxes = self._segment(image)
+        except Exception as e:
+            logger.debug("Digit template segmentation failed: %s", e)
+            return False
+        if len(cells) != len(chars):
+            return False
+
+        with self._lock:
+            for ch, cell in zip(chars, cells):
+                count = self._counts.get(ch, 0)
+                if count >= self._max_samples_per_char:
+                    continue
+                acc = self._sums.get(ch)
+                cell_f = cell.astype(np.float32)
+                self._sums[ch] = cell_f if acc is None else acc + cell_f
+                self._counts[ch] = count + 1
+                self._templates[ch] = (self._sums[ch] / float(count + 1)).astype(np.float32)
+        return True
+
+    def read_text(self, image, *, config: Optional[str] = None) -> OcrBackendResult:
+        if not self.is_available() or not self._templates:
+            return OcrBackendResult(text="", confidence=0.0)
+
+        try:
+            cells, boxes = self._segment(image)
+            if not cells:
+                return OcrBackendResult(text="", confidence=0.0)
+
+            templates = list(self._templates.items())
+            chars: List[str] = []
+            scores: List[float] = []
+            for cell in cells:
+                cell_f = cell.astype(np.float32)
+                best_ch, best_score, runner_up = "", -1.0, -1.0
+                for ch, tmpl in templates:
+                    score = float(cv2.matchTemplate(cell_f, tmpl, cv2.TM_CCOEFF_NORMED)[0][0])
+                    if score != score:
+                        continue
+                    if score > best_score:
+                        best_ch, best_score, runner_up = ch, score, best_score
+                    elif score > runner_up:
+                        runner_up = score
+                # Unknown or ambiguous glyph: let the full OCR backend read this crop.
+                if best_score < self._min_glyph_score or best_score - runner_up < self._min_glyph_margin:
+                    return OcrBackendResult(text="", confidence=0.0)
+                chars.append(best_ch)
+                scores.append(best_score)
+
+            # Re-insert word breaks where the gap is wider than half a glyph height.
+            heights = sorted(h for _x, _y, _w, h in boxes)
+            gap_limit = 0.5 * heights[len(heights) // 2]
+            parts = [chars[0]]
+            for i in range(1, len(chars)):
+                prev_x, _py, prev_w, _ph = boxes[i - 1]
+                if boxes[i][0] - (prev_x + prev_w) > gap_limit:
+                    parts.append(" ")
+                parts.append(chars[i])
+
+            # The weakest glyph bounds the confidence of the whole read.
+            conf = max(0.0, min(100.0, min(scores) * 100.0))
+            return OcrBackendResult(text="".join(parts), confidence=conf)
+        except Exception as e:
+            logger.debug("Digit template backend failed: %s", e)
+            return OcrBackendResult(text="", confidence=0.0)
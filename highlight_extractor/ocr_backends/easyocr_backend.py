@@ -74,6 +74,6 @@ class EasyOcrBackend:
             conf = max(0.0, min(100.0, conf))
             return OcrBackendResult(text=raw, confidence=conf)
         except Exception as e:
-            logger.debug(f"EasyOCR backend failed: {e}")
+            logger.debug("EasyOCR backend failed: %s", e)
             return OcrBackendResult(text="", confidence=0.0)
 
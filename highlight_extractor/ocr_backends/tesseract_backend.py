@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Optional
+import shlex
+import subprocess
+from typing import List, Optional, Tuple
 
 from .base import OcrBackendResult
 
@@ -22,6 +24,17 @@ class TesseractBackend:
             self._pytesseract = None
             self._available = False
 
+        # In-memory path: PNG-encode with OpenCV and pipe through tesseract's
+        # stdin/stdout instead of pytesseract's temp image + output files.
+        # Disabled for the rest of the run after the first failure.
+        try:
+            import cv2
+
+            self._cv2 = cv2
+        except Exception:
+            self._cv2 = None
+        self._stdin_enabled = self._cv2 is not None
+
     def is_available(self) -> bool:
         return bool(self._available and self._pytesseract is not None)
 
@@ -39,6 +52,41 @@ class TesseractBackend:
         # pytesseract confs are usually 0..100 (sometimes -1).
         return max(0.0, min(100.0, sum(confs) / float(len(confs))))
 
+    def _image_to_data_stdin(self, image, cfg: str) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Run `tesseract stdin stdout ... tsv` on a PNG encoded in memory.
+
+        Returns (texts, confs) like image_to_data's DICT output, or None when the
+        fast path is unavailable (caller falls back to pytesseract).
+        """
+        if not self._stdin_enabled or getattr(image, "ndim", 0) not in (2, 3):
+            return None
+        try:
+            ok, png = self._cv2.imencode(".png", image)
+            if not ok:
+                return None
+            cmd = [self._pytesseract.pytesseract.tesseract_cmd, "stdin", "stdout"]
+            cmd += shlex.split(cfg)
+            cmd.append("tsv")
+            proc = subprocess.run(cmd, input=png.tobytes(), stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False)
+            if proc.returncode != 0:
+                raise RuntimeError(proc.stderr.decode("utf-8", errors="replace").strip() or f"exit {proc.returncode}")
+        except Exception as e:
+            logger.debug("Tesseract stdin path disabled, using pytesseract: %s", e)
+            self._stdin_enabled = False
+            return None
+
+        texts: List[str] = []
+        confs: List[str] = []
+        lines = proc.stdout.decode("utf-8", errors="replace").splitlines()
+        for line in lines[1:]:  # skip TSV header
+            cols = line.split("\t")
+            if len(cols) < 12:
+                continue
+            confs.append(cols[10])
+            texts.append(cols[11])
+        return texts, confs
+
     def read_text(self, image, *, config: Optional[str] = None) -> OcrBackendResult:
         if not self.is_available():
             return OcrBackendResult(text="", confidence=0.0)
@@ -46,9 +94,13 @@ class TesseractBackend:
         cfg = str(config or "")
         try:
             # Prefer image_to_data so we can extract confidence.
-            data = self._pytesseract.image_to_data(image, config=cfg, output_type=self._pytesseract.Output.DICT)
-            texts = data.get("text", []) if isinstance(data, dict) else []
-            confs = data.get("conf", []) if isinstance(data, dict) else []
+            fast = self._image_to_data_stdin(image, cfg)
+            if fast is not None:
+                texts, confs = fast
+            else:
+                data = self._pytesseract.image_to_data(image, config=cfg, output_type=self._pytesseract.Output.DICT)
+                texts = data.get("text", []) if isinstance(data, dict) else []
+                confs = data.get("conf", []) if isinstance(data, dict) else []
 
             # Build a compact raw text line for downstream parsing.
             raw = " ".join([str(t).strip() for t in texts if str(t).strip()])
@@ -67,7 +119,7 @@ class TesseractBackend:
             conf = self._normalize_conf(relevant_confs or confs)
             return OcrBackendResult(text=str(raw), confidence=float(conf))
         except Exception as e:
-            logger.debug(f"Tesseract backend failed: {e}")
+            logger.debug("Tesseract backend failed: %s", e)
             try:
                 raw = self._pytesseract.image_to_string(image, config=cfg) or ""
                 return OcrBackendResult(text=str(raw), confidence=0.0)
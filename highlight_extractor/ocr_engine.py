@@ -7,9 +7,13 @@ New API for diagnostics + confidence-aware logic:
   - extract_time_from_frame_detailed(...) -> Optional[OcrResult]
 """
 
+import bisect
 import json
 import logging
+import queue
 import re
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Tuple, List, Dict
@@ -27,7 +31,7 @@ except ImportError:
     logging.warning("pytesseract not installed - OCR functionality disabled")
 
 from .ocr_types import OcrResult
-from .ocr_backends import TesseractBackend, EasyOcrBackend
+from .ocr_backends import TesseractBackend, EasyOcrBackend, DigitTemplateBackend
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,139 @@ FLO_LIKE_BROADCAST_TYPES = {
     "mhl_amherst",
 }
 OCR_STYLE_BROADCAST_TYPES = FLO_LIKE_BROADCAST_TYPES | {"yarmouth"}
+
+
+def _snap_times_to_keyframes(
+    sample_times: List[float],
+    keyframe_times: List[float],
+    max_shift: float,
+) -> List[float]:
+    """
+    Move each sample time onto a keyframe so frames decode without a forward walk.
+
+    Prefers the first keyframe at/after the requested time; if that is more than
+    `max_shift` away (long GOP), the keyframe before it is used instead. Samples
+    that collapse onto the same keyframe are de-duplicated.
+    """
+    if not sample_times or not keyframe_times:
+        return []
+
+    snapped: List[float] = []
+    seen = set()
+    for t in sample_times:
+        idx = bisect.bisect_left(keyframe_times, t)
+        if idx < len(keyframe_times) and (keyframe_times[idx] - t) <= max_shift:
+            kf = keyframe_times[idx]
+        else:
+            kf = keyframe_times[max(0, idx - 1)]
+        if kf in seen:
+            continue
+        seen.add(kf)
+        snapped.append(kf)
+    return snapped
+
+
+@contextmanager
+def _worker_pool(executor: Optional[ThreadPoolExecutor], workers: int):
+    """Yield the caller's shared executor, or a private pool of `workers` threads."""
+    if executor is not None:
+        yield executor
+        return
+    with ThreadPoolExecutor(max_workers=max(1, int(workers or 1))) as own:
+        yield own
+
+
+def _prefetch(items, depth: int):
+    """
+    Iterate `items` on a background thread, keeping up to `depth` results queued.
+
+    Decoders (PyAV, OpenCV, torchcodec) release the GIL, so the next frames
+    decode while the caller crops and hashes the current one. Exceptions from
+    `items` are re-raised in the caller; closing the generator stops the thread.
+    """
+    buffer: "queue.Queue" = queue.Queue(maxsize=max(1, int(depth)))
+    stop = threading.Event()
+    end = object()
+
+    def produce():
+        error = None
+        try:
+            for item in items:
+                if stop.is_set():
+                    break
+                buffer.put(item)
+        except Exception as exc:
+            error = exc
+        buffer.put((end, error))
+
+    thread = threading.Thread(target=produce, name="frame-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item[0] is end:
+                if item[1] is not None:
+                    raise item[1]
+                return
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue so it can see `stop`.
+        while thread.is_alive():
+            try:
+                buffer.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+def _iter_sample_frames(video_processor, sample_times: List[float], keyframe_aligned: bool, prefetch: int = 0):
+    """
+    Yield (sample_time, frame) in order, decoding forward in a single pass when
+    the processor supports it (VideoProcessor.iter_frames_at_times).
+
+    Frames may come from a reused buffer pool: use each one (the scorebug crop
+    is copied) before advancing the iterator. With `prefetch` > 0 up to that
+    many frames are decoded ahead on a background thread.
+    """
+    iter_frames = getattr(video_processor, "iter_frames_at_times", None)
+    if callable(iter_frames):
+        # Queued frames, the one in use and the one being decoded each need a buffer.
+        extra = {"min_pool_size": prefetch + 2} if prefetch > 0 else {}
+        frames = iter_frames(sample_times, keyframe_aligned=keyframe_aligned, reuse_buffers=True, **extra)
+    elif keyframe_aligned:
+        frames = ((t, video_processor.get_frame_at_time(float(t), keyframe_aligned=True)) for t in sample_times)
+    else:
+        frames = ((t, video_processor.get_frame_at_time(float(t))) for t in sample_times)
+    if prefetch > 0:
+        frames = _prefetch(frames, prefetch)
+    yield from frames
+
+
+def _frame_signature(frame: np.ndarray) -> Optional[np.ndarray]:
+    """
+    64-bit perceptual (average) hash of a whole frame as a boolean array.
+
+    Used to tell a frozen clock on a static shot (intermission graphic, stoppage)
+    apart from a cut to another scene. Uses cv2.img_hash when opencv-contrib is
+    installed, otherwise an equivalent 8x8 mean-threshold hash in numpy.
+    """
+    if frame is None or getattr(frame, "size", 0) == 0:
+        return None
+    try:
+        if hasattr(cv2, "img_hash"):
+            return np.unpackbits(cv2.img_hash.averageHash(frame)).astype(bool)
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY) if frame.ndim == 3 else frame
+        small = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+        return (small > small.mean()).ravel()
+    except Exception:
+        return None
+
+
+def _signatures_match(a: Optional[np.ndarray], b: Optional[np.ndarray], max_distance: int) -> bool:
+    if a is None or b is None or a.shape != b.shape:
+        return False
+    return int(np.count_nonzero(a != b)) <= int(max_distance)
 
 
 @dataclass
@@ -226,6 +363,16 @@ class OCREngine:
             elif n == "easyocr" and self._easyocr_backend is not None and self._easyocr_backend.is_available():
                 self._backends.append(self._easyocr_backend)
 
+        # Learned glyph templates read the fixed-font clock without full OCR once a
+        # few confident reads from the backends above have trained them.
+        self._digit_backend = DigitTemplateBackend() if bool(
+            getattr(self.config, "OCR_DIGIT_TEMPLATE_FAST_PATH", True)
+        ) else None
+        self._digit_template_key = None
+        # Parallel OCR workers share the templates; the key check and reset/learn
+        # must not interleave.
+        self._digit_template_lock = threading.Lock()
+
         if not self._backends:
             raise RuntimeError(
                 "No OCR backend available. Install pytesseract (and tesseract-ocr) "
@@ -237,8 +384,8 @@ class OCREngine:
             if not TESSERACT_AVAILABLE:
                 raise RuntimeError("pytesseract not installed. Install with: pip install pytesseract")
             try:
-                pytesseract.get_tesseract_version()
-                logger.debug(f"Tesseract version: {pytesseract.get_tesseract_version()}")
+                tesseract_version = pytesseract.get_tesseract_version()
+                logger.debug("Tesseract version: %s", tesseract_version)
             except Exception as e:
                 raise RuntimeError(
                     "tesseract-ocr system package not found. "
@@ -477,6 +624,7 @@ class OCREngine:
             preprocess_variants = self._preprocess_variants(
                 probe,
                 base_style=bt if bt in OCR_STYLE_BROADCAST_TYPES else "standard",
+                roi=candidate_roi,
             )
             for style_name, processed in preprocess_variants:
                 for backend in self._backends:
@@ -510,6 +658,7 @@ class OCREngine:
         self._broadcast_type = broadcast_type
         # Reset cached settings; caller is explicitly overriding.
         self.scoreboard_roi = None
+        self._stretch_luts = {}
         if hasattr(self, "_preprocess_style"):
             try:
                 delattr(self, "_preprocess_style")
@@ -572,7 +721,25 @@ class OCREngine:
                 preprocess_style or (used_broadcast if used_broadcast in OCR_STYLE_BROADCAST_TYPES else "standard")
             )
 
-            processed = self._preprocess_for_ocr(scoreboard, style=preprocess_style)
+            processed = self._preprocess_for_ocr(scoreboard, style=preprocess_style, roi=used_roi)
+
+            # Fast path: template-match the clock glyphs; only fall through to the
+            # full OCR backend when a glyph is unknown or the match is weak.
+            digits = getattr(self, "_digit_backend", None)
+            if digits is not None:
+                digit_key = (used_roi, preprocess_style)
+                with self._digit_template_lock:
+                    key_changed = self._digit_template_key != digit_key
+                    if key_changed:
+                        digits.reset()
+                        self._digit_template_key = digit_key
+                if not key_changed and digits.is_ready():
+                    dres = digits.read_text(processed)
+                    min_conf = float(getattr(self.config, "OCR_DIGIT_TEMPLATE_MIN_CONFIDENCE", 90.0))
+                    if dres.text and float(dres.confidence) >= min_conf:
+                        parsed = self._parse_time_text(dres.text)
+                        if parsed is not None:
+                            return parsed, dres.text, float(dres.confidence), digits.name, used_broadcast, used_roi, preprocess_style
 
             # Choose backend
             backend_name = str(getattr(self, "_backend_name", "tesseract"))
@@ -618,6 +785,13 @@ class OCREngine:
                 # Cache the winning backend for subsequent frames.
                 self._backend_name = backend_name
 
+            if digits is not None and parsed is not None:
+                if float(conf or 0.0) >= float(getattr(self.config, "OCR_DIGIT_TEMPLATE_LEARN_MIN_CONFIDENCE", 85.0)):
+                    with self._digit_template_lock:
+                        # Skip reads made under templates another worker has since reset.
+                        if self._digit_template_key == (used_roi, preprocess_style):
+                            digits.learn(processed, raw_text)
+
             return parsed, str(raw_text or ""), float(conf or 0.0), str(backend_name or "unknown"), used_broadcast, used_roi, preprocess_style
 
         except Exception as e:
@@ -806,7 +980,13 @@ class OCREngine:
                         except Exception:
                             pass
 
-    def _preprocess_variants(self, image: np.ndarray, *, base_style: str) -> List[Tuple[str, np.ndarray]]:
+    def _preprocess_variants(
+        self,
+        image: np.ndarray,
+        *,
+        base_style: str,
+        roi: Optional[Tuple[int, int, int, int]] = None,
+    ) -> List[Tuple[str, np.ndarray]]:
         """
         Return a small set of preprocessing variants to try during probing.
 
@@ -825,10 +1005,10 @@ class OCREngine:
         out: List[Tuple[str, np.ndarray]] = []
         for v in variants:
             try:
-                out.append((v, self._preprocess_for_ocr(image, style=v)))
+                out.append((v, self._preprocess_for_ocr(image, style=v, roi=roi)))
             except Exception:
                 continue
-        return out or [(style, self._preprocess_for_ocr(image, style=style))]
+        return out or [(style, self._preprocess_for_ocr(image, style=style, roi=roi))]
 
     def find_game_start(
         self,
@@ -892,7 +1072,8 @@ class OCREngine:
             if result:
                 period, time_str, time_seconds = result
                 scanned_results.append((float(current_time), int(period), str(time_str), int(time_seconds)))
-                logger.debug(f"  {current_time/60:.1f}m: P{period} {time_str}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  %.1fm: P%s %s", current_time / 60, period, time_str)
 
                 if time_seconds >= 20 * 60:
                     # Clock shows 20:00 - period hasn't started yet
@@ -1066,7 +1247,8 @@ class OCREngine:
 
             if result:
                 period, time_str, time_seconds = result
-                logger.debug(f"  Binary search: {mid/60:.1f}m -> P{period} {time_str}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  Binary search: %.1fm -> P%s %s", mid / 60, period, time_str)
 
                 # If we find valid game time, game has started before this point
                 # But we need to check if it's actually game time (< 20:00) or just 20:00
@@ -1078,7 +1260,7 @@ class OCREngine:
                     low = mid
             else:
                 # No time detected - game hasn't started yet, search later
-                logger.debug(f"  Binary search: {mid/60:.1f}m -> no time")
+                logger.debug("  Binary search: %.1fm -> no time", mid / 60)
                 low = mid
 
         # Return the point where we're confident game has started
@@ -1096,7 +1278,12 @@ class OCREngine:
 
         return game_start
 
-    def _preprocess_for_ocr(self, image: np.ndarray, style: str = 'standard') -> np.ndarray:
+    def _preprocess_for_ocr(
+        self,
+        image: np.ndarray,
+        style: str = 'standard',
+        roi: Optional[Tuple[int, int, int, int]] = None,
+    ) -> np.ndarray:
         """
         Preprocess image for better OCR accuracy
 
@@ -1104,6 +1291,7 @@ class OCREngine:
             image: Input image (RGB or BGR)
             style: Preprocessing style ('standard', 'flohockey', 'yarmouth',
                 'mhl_summerside', 'mhl_amherst')
+            roi: Frame region the crop came from; keys the calibrated contrast LUT
 
         Returns:
             Preprocessed grayscale image
@@ -1161,9 +1349,15 @@ class OCREngine:
             # Apply bilateral filter to reduce noise while keeping edges sharp
             denoised = cv2.bilateralFilter(gray, 5, 50, 50)
 
-            # Increase contrast using CLAHE (Contrast Limited Adaptive Histogram Equalization)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            enhanced = clahe.apply(denoised)
+            # Increase contrast: a global stretch LUT calibrated once per ROI is
+            # enough for an evenly lit scorebug; CLAHE (Contrast Limited Adaptive
+            # Histogram Equalization) only when the crop has little dynamic range.
+            stretch_lut = self._contrast_stretch_lut(denoised, style, roi)
+            if stretch_lut is not None:
+                enhanced = cv2.LUT(denoised, stretch_lut)
+            else:
+                clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+                enhanced = clahe.apply(denoised)
 
             if style == "standard_otsu":
                 _, binary = cv2.threshold(enhanced, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
@@ -1183,6 +1377,35 @@ class OCREngine:
             logger.warning(f"Preprocessing failed, using original: {e}")
             return image
 
+    def _contrast_stretch_lut(
+        self,
+        gray: np.ndarray,
+        style: str,
+        roi: Optional[Tuple[int, int, int, int]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Return the 256-entry contrast-stretch LUT for this ROI, calibrating it
+        from `gray` (2nd-98th percentile) the first time the ROI is seen.
+
+        Returns None whenever this crop's own dynamic range is too small for a
+        global stretch (caller uses CLAHE); such crops never calibrate the LUT.
+        """
+        if not bool(getattr(self.config, "OCR_CONTRAST_STRETCH_LUT", True)):
+            return None
+        lo, hi = np.percentile(gray, (2, 98))
+        if (hi - lo) < float(getattr(self.config, "OCR_CONTRAST_STRETCH_MIN_RANGE", 60)):
+            return None
+
+        luts = getattr(self, "_stretch_luts", None)
+        if luts is None:
+            luts = self._stretch_luts = {}
+        key = (style, tuple(roi) if roi is not None else None, gray.shape)
+        lut = luts.get(key)
+        if lut is None:
+            lut = np.clip((np.arange(256) - lo) * 255.0 / (hi - lo), 0, 255).astype(np.uint8)
+            luts[key] = lut
+        return lut
+
     def _parse_time_text(self, text: str) -> Optional[Tuple[int, str]]:
         """
         Parse period and time from OCR text
@@ -1279,10 +1502,10 @@ class OCREngine:
         if m:
             out = _try_return(0, m.group(1), m.group(2))
             if out:
-                logger.debug(f"Found time {out[1]} but no period - marking period unknown (P0)")
+                logger.debug("Found time %s but no period - marking period unknown (P0)", out[1])
                 return out
 
-        logger.debug(f"Could not parse time from: {text}")
+        logger.debug("Could not parse time from: %s", text)
         return None
 
     def _validate_time_format(self, time_str: str) -> bool:
@@ -1298,7 +1521,7 @@ class OCREngine:
         try:
             parts = time_str.split(':')
             if len(parts) != 2:
-                logger.debug(f"Invalid time format (not MM:SS): {time_str}")
+                logger.debug("Invalid time format (not MM:SS): %s", time_str)
                 return False
 
             minutes = int(parts[0])
@@ -1328,7 +1551,7 @@ class OCREngine:
             return True
 
         except (ValueError, AttributeError) as e:
-            logger.debug(f"Failed to parse time '{time_str}': {e}")
+            logger.debug("Failed to parse time '%s': %s", time_str, e)
             return False
 
     def _extract_scorebug_crop(
@@ -1436,6 +1659,7 @@ class OCREngine:
         output_dir: Optional[Path] = None,
         game_id: str = "unknown",
         broadcast_type: str = "auto",
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> List[Dict]:
         """
         Sample time from video at regular intervals
@@ -1450,6 +1674,7 @@ class OCREngine:
             start_time: Video timestamp to start sampling from (default 0.0)
             output_dir: Optional directory to write OCR logs (for diagnostics)
             game_id: Game identifier for logging
+            executor: Shared thread pool for parallel OCR (default: a private pool of `workers`)
 
         Returns:
             List of dictionaries with {video_time, period, game_time}
@@ -1466,6 +1691,7 @@ class OCREngine:
                     output_dir=output_dir,
                     game_id=game_id,
                     broadcast_type=broadcast_type,
+                    executor=executor,
                 )
             except Exception as exc:
                 logger.warning(
@@ -1549,6 +1775,15 @@ class OCREngine:
             current_time = start_time
             sample_count = 0
 
+            # Frozen clock: after two identical reads on an unchanged scene, skip the
+            # next few samples entirely. Nothing is recorded for them (the clock may
+            # restart inside the window), so matching interpolates across the gap.
+            frozen_skip_samples = max(0, int(getattr(self.config, "OCR_FROZEN_CLOCK_SKIP_SAMPLES", 3) or 0))
+            frozen_max_distance = int(getattr(self.config, "OCR_FROZEN_CLOCK_MAX_HASH_DISTANCE", 4))
+            frozen_skip_remaining = 0
+            skipped_samples = 0
+            last_read = None  # ((period, game_time), frame_signature)
+
             logger.info(f"Starting OCR sampling from {start_time/60:.1f} minutes")
 
             while current_time < duration:
@@ -1556,6 +1791,14 @@ class OCREngine:
                 if max_samples and sample_count >= max_samples:
                     break
 
+                if frozen_skip_remaining > 0:
+                    frozen_skip_remaining -= 1
+                    skipped_samples += 1
+                    progress_bar.update(1)
+                    current_time += sample_interval
+                    sample_count += 1
+                    continue
+
                 # Get frame at current time
                 frame = video_processor.get_frame_at_time(current_time)
 
@@ -1568,7 +1811,7 @@ class OCREngine:
                         roi = self.scoreboard_roi or self.detect_scoreboard_roi(frame, method=method)
                         debug_path = debug_dir / f"debug_ocr_frame_{sample_count:04d}_{current_time:.1f}s.jpg"
                         self.save_debug_frame(frame, debug_path, roi)
-                        logger.debug(f"Saved debug frame: {debug_path}")
+                        logger.debug("Saved debug frame: %s", debug_path)
 
                     # Extract time from frame with metadata for logging
                     result, raw_text, conf, backend_name, used_broadcast, used_roi, preprocess_style = self._extract_time_from_frame_with_meta(
@@ -1606,7 +1849,25 @@ class OCREngine:
                             'ocr_sharpness_score': sharpness_score,
                             'ocr_crop_debug_path': crop_debug_path,
                         })
-                        logger.debug(f"Sample at {current_time:.1f}s: P{period} {game_time}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Sample at %.1fs: P%s %s", current_time, period, game_time)
+
+                        if frozen_skip_samples:
+                            signature = _frame_signature(frame)
+                            if (
+                                last_read is not None
+                                and last_read[0] == (period, game_time)
+                                and _signatures_match(last_read[1], signature, frozen_max_distance)
+                            ):
+                                frozen_skip_remaining = frozen_skip_samples
+                                logger.debug(
+                                    "Clock frozen at P%s %s; skipping next %s samples",
+                                    period,
+                                    game_time,
+                                    frozen_skip_samples,
+                                )
+                            last_read = ((period, game_time), signature)
+
                         # Update progress bar description with latest result
                         progress_bar.set_postfix({'latest': f"P{period} {game_time}", 'conf': f"{float(conf or 0.0):.0f}"})
 
@@ -1628,6 +1889,7 @@ class OCREngine:
                         ))
                         self._consecutive_bad_samples = 0
                     else:
+                        last_read = None
                         failure_crop_count += 1
                         crop_debug_path = self._save_scorebug_crop_debug(
                             scorebug_crop,
@@ -1664,6 +1926,7 @@ class OCREngine:
                         if self._consecutive_bad_samples >= max(3, reset_n):
                             logger.info("OCR health collapsed; resetting cached ROI/broadcast and re-probing")
                             self.scoreboard_roi = None
+                            self._stretch_luts = {}
                             if hasattr(self, "_broadcast_type"):
                                 try:
                                     delattr(self, "_broadcast_type")
@@ -1695,7 +1958,8 @@ class OCREngine:
             ocr_logger.write_logs()
 
             # Persist sampling stats for pipeline-level health decisions.
-            total = float(total_samples or 0)
+            # Skipped frozen-clock samples were never OCR'd, so they don't count.
+            total = float(max(0, (total_samples or 0) - skipped_samples))
             successful = float(len([s for s in ocr_logger.samples if s.success]))
             with_period = float(len([s for s in ocr_logger.samples if s.success and (s.parsed_period or 0) > 0]))
             confs = [float(s.confidence) for s in ocr_logger.samples if s.success and s.confidence is not None]
@@ -1732,6 +1996,7 @@ class OCREngine:
         output_dir: Optional[Path] = None,
         game_id: str = "unknown",
         broadcast_type: str = "auto",
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> List[Dict]:
         """
         Capture frames sequentially, then OCR the scorebug crops in parallel.
@@ -1746,6 +2011,7 @@ class OCREngine:
             output_dir: Optional directory to write OCR logs
             game_id: Game identifier for logging
             broadcast_type: Pinned or auto-detected broadcast type
+            executor: Shared thread pool (OCR still runs at most `workers` crops at once)
 
         Returns:
             List of dictionaries with {video_time, period, game_time}
@@ -1777,6 +2043,21 @@ class OCREngine:
                 if max_samples and len(sample_times) >= max_samples:
                     break
 
+            # Snap to keyframe PTS (when the processor can index them) so each capture
+            # is a single keyframe decode instead of seek + forward decode.
+            keyframe_aligned = False
+            keyframe_index = getattr(video_processor, "keyframe_times", None)
+            if callable(keyframe_index) and bool(getattr(self.config, "OCR_KEYFRAME_ALIGNED_SAMPLING", True)):
+                snapped = _snap_times_to_keyframes(sample_times, keyframe_index(), float(sample_interval))
+                if snapped:
+                    logger.info(
+                        "Snapped %s OCR sample times onto %s keyframes",
+                        len(sample_times),
+                        len(snapped),
+                    )
+                    sample_times = snapped
+                    keyframe_aligned = True
+
             total_samples = len(sample_times)
             if total_samples == 0:
                 return []
@@ -1793,48 +2074,6 @@ class OCREngine:
             pinned_broadcast = requested_broadcast
             pinned_roi = self.scoreboard_roi
 
-            sample_payloads: List[Dict] = []
-            capture_bar = tqdm(total=total_samples, desc="Capture Frames", unit="frame", ncols=100)
-
-            for idx, sample_time in enumerate(sample_times):
-                frame = video_processor.get_frame_at_time(float(sample_time))
-                if frame is None:
-                    sample_payloads.append({"idx": idx, "sample_time": float(sample_time), "crop": None})
-                    capture_bar.update(1)
-                    continue
-
-                if pinned_roi is None or requested_broadcast == "auto":
-                    if requested_broadcast == "auto":
-                        bt, roi_sel, style_sel, backend_sel = self._select_best_settings(frame)
-                        self._broadcast_type = bt
-                        self.scoreboard_roi = roi_sel
-                        self._preprocess_style = style_sel
-                        self._backend_name = backend_sel
-                        pinned_broadcast = bt
-                        pinned_roi = roi_sel
-                    else:
-                        method = requested_broadcast if requested_broadcast in ROI_PINNED_BROADCAST_TYPES else "auto"
-                        pinned_roi = self.detect_scoreboard_roi(frame, method=method)
-                        self.scoreboard_roi = pinned_roi
-
-                if debug_dir and idx in debug_sample_indices and pinned_roi is not None:
-                    debug_path = debug_dir / f"debug_ocr_frame_{idx:04d}_{sample_time:.1f}s.jpg"
-                    self.save_debug_frame(frame, debug_path, pinned_roi)
-
-                crop = self._extract_scorebug_crop(frame, pinned_roi)
-                sample_payloads.append(
-                    {
-                        "idx": idx,
-                        "sample_time": float(sample_time),
-                        "crop": crop,
-                        "broadcast_type": str(pinned_broadcast or requested_broadcast or "standard"),
-                        "roi": pinned_roi,
-                    }
-                )
-                capture_bar.update(1)
-
-            capture_bar.close()
-
             def _ocr_payload(payload: Dict) -> Dict:
                 crop = payload.get("crop")
                 sample_time = float(payload.get("sample_time") or 0.0)
@@ -1871,10 +2110,94 @@ class OCREngine:
                     "sharpness": self._measure_sharpness(crop),
                 }
 
+            sample_payloads: List[Dict] = []
+            frozen_payloads: List[Dict] = []
+            future_map = {}
             ocr_results: List[Dict] = []
-            ocr_bar = tqdm(total=total_samples, desc=f"OCR ({max(1, workers)} workers)", unit="frame", ncols=100)
-            with ThreadPoolExecutor(max_workers=max(1, int(workers or 1))) as executor:
-                future_map = {executor.submit(_ocr_payload, payload): payload for payload in sample_payloads}
+            capture_bar = tqdm(total=total_samples, desc="Capture Frames", unit="frame", ncols=100)
+
+            # Frozen clock: a scorebug crop that is pixel-identical to the previous
+            # sample's (on an unchanged scene) reads the same, so reuse that OCR result.
+            frozen_enabled = int(getattr(self.config, "OCR_FROZEN_CLOCK_SKIP_SAMPLES", 3) or 0) > 0
+            frozen_max_distance = int(getattr(self.config, "OCR_FROZEN_CLOCK_MAX_HASH_DISTANCE", 4))
+            prev_capture = None  # (payload, frame_signature)
+
+            # A shared pool is sized for clip extraction too; keep OCR to `workers`.
+            ocr_slots = threading.BoundedSemaphore(max(1, int(workers or 1)))
+
+            def _ocr_limited(payload: Dict) -> Dict:
+                with ocr_slots:
+                    return _ocr_payload(payload)
+
+            # Producer/consumer: one forward decode pass feeds crops to the OCR workers
+            # as they are captured instead of seeking to every sample separately.
+            with _worker_pool(executor, workers) as executor:
+                for idx, (sample_time, frame) in enumerate(
+                    _iter_sample_frames(
+                        video_processor,
+                        sample_times,
+                        keyframe_aligned,
+                        prefetch=int(getattr(self.config, "OCR_PREFETCH_FRAMES", 4) or 0),
+                    )
+                ):
+                    if frame is None:
+                        payload = {"idx": idx, "sample_time": float(sample_time), "crop": None}
+                        sample_payloads.append(payload)
+                        future_map[executor.submit(_ocr_limited, payload)] = payload
+                        capture_bar.update(1)
+                        continue
+
+                    if pinned_roi is None or requested_broadcast == "auto":
+                        if requested_broadcast == "auto":
+                            bt, roi_sel, style_sel, backend_sel = self._select_best_settings(frame)
+                            self._broadcast_type = bt
+                            self.scoreboard_roi = roi_sel
+                            self._preprocess_style = style_sel
+                            self._backend_name = backend_sel
+                            pinned_broadcast = bt
+                            pinned_roi = roi_sel
+                        else:
+                            method = requested_broadcast if requested_broadcast in ROI_PINNED_BROADCAST_TYPES else "auto"
+                            pinned_roi = self.detect_scoreboard_roi(frame, method=method)
+                            self.scoreboard_roi = pinned_roi
+
+                    if debug_dir and idx in debug_sample_indices and pinned_roi is not None:
+                        debug_path = debug_dir / f"debug_ocr_frame_{idx:04d}_{sample_time:.1f}s.jpg"
+                        self.save_debug_frame(frame, debug_path, pinned_roi)
+
+                    crop = self._extract_scorebug_crop(frame, pinned_roi)
+                    payload = {
+                        "idx": idx,
+                        "sample_time": float(sample_time),
+                        "crop": crop,
+                        "broadcast_type": str(pinned_broadcast or requested_broadcast or "standard"),
+                        "roi": pinned_roi,
+                    }
+                    if frozen_enabled:
+                        signature = _frame_signature(frame)
+                        prev_payload = prev_capture[0] if prev_capture is not None else None
+                        if (
+                            prev_payload is not None
+                            and crop is not None
+                            and prev_payload.get("crop") is not None
+                            and prev_payload["crop"].shape == crop.shape
+                            and prev_payload.get("roi") == pinned_roi
+                            and float(cv2.absdiff(prev_payload["crop"], crop).mean()) < 1.0
+                            and _signatures_match(prev_capture[1], signature, frozen_max_distance)
+                        ):
+                            payload["frozen_of"] = prev_payload.get("frozen_of", prev_payload["idx"])
+                        prev_capture = (payload, signature)
+                    sample_payloads.append(payload)
+                    if "frozen_of" in payload:
+                        frozen_payloads.append(payload)
+                    else:
+                        future_map[executor.submit(_ocr_limited, payload)] = payload
+                    capture_bar.update(1)
+                capture_bar.close()
+
+                if frozen_payloads:
+                    logger.info("Reusing OCR for %s frozen-clock samples", len(frozen_payloads))
+                ocr_bar = tqdm(total=len(future_map), desc=f"OCR ({max(1, workers)} workers)", unit="frame", ncols=100)
                 for future in as_completed(future_map):
                     payload = future_map[future]
                     try:
@@ -1898,6 +2221,17 @@ class OCREngine:
                     ocr_bar.update(1)
             ocr_bar.close()
 
+            if frozen_payloads:
+                results_by_time = {float(item.get("video_time") or 0.0): item for item in ocr_results}
+                for payload in frozen_payloads:
+                    source = results_by_time.get(float(sample_payloads[payload["frozen_of"]]["sample_time"]))
+                    if source is None:
+                        continue
+                    frozen_result = dict(source)
+                    frozen_result["video_time"] = float(payload["sample_time"])
+                    frozen_result["frozen_skip"] = True
+                    ocr_results.append(frozen_result)
+
             ocr_results.sort(key=lambda item: float(item.get("video_time") or 0.0))
 
             for sample in ocr_results:
@@ -1942,6 +2276,8 @@ class OCREngine:
                             "ocr_crop_debug_path": crop_debug_path,
                         }
                     )
+                    if sample.get("frozen_skip"):
+                        timestamps[-1]["ocr_frozen_skip"] = True
                     ocr_logger.add_sample(
                         OCRSampleLog(
                             video_time=sample_time,
@@ -2050,7 +2386,7 @@ class OCREngine:
                 roi = self.scoreboard_roi or self.detect_scoreboard_roi(frame)
                 debug_path = debug_dir / f"debug_ocr_frame_{sample_idx:04d}_{sample_time:.1f}s.jpg"
                 self.save_debug_frame(frame, debug_path, roi)
-                logger.debug(f"Saved debug frame: {debug_path}")
+                logger.debug("Saved debug frame: %s", debug_path)
 
             # Extract time from frame
             result = self.extract_time_from_frame(frame)
@@ -2067,7 +2403,7 @@ class OCREngine:
             return None
 
         except Exception as e:
-            logger.debug(f"Failed to extract time at {sample_time:.1f}s: {e}")
+            logger.debug("Failed to extract time at %.1fs: %s", sample_time, e)
             return None
 
     def _time_to_seconds(self, time_str: str) -> int:
@@ -6,8 +6,12 @@ testable, reusable, and easier to maintain.
 """
 
 import logging
+import os
+import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Dict, List
 
@@ -15,6 +19,7 @@ from .models import GameInfo, Event, VideoTimestamp, PipelineResult
 from .goal import Goal, GoalSummary
 from .file_manager import FileManager
 from .box_score import BoxScoreFetcher
+from .json_utils import write_json
 try:
     from .video_processor import VideoProcessor
 except ModuleNotFoundError:
@@ -111,6 +116,7 @@ class HighlightPipeline:
         self.box_score: Optional[Dict] = None
         self.events: List[Dict] = []
         self.video_timestamps: List[Dict] = []
+        self._valid_events: Optional[List[Dict]] = None
         self.matched_events: List[Dict] = []
         self.created_clips: List = []
 
@@ -123,6 +129,14 @@ class HighlightPipeline:
         self._step_timings: Dict[str, float] = {}
         self._pipeline_start_time: Optional[float] = None
 
+        # Set when the last execute() has finished releasing resources.
+        self._cleanup_done = threading.Event()
+        self._cleanup_done.set()
+
+        # One thread pool per execute() shared by the box score fetch, parallel
+        # OCR and clip extraction; its size bounds the pipeline's total concurrency.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         # Major review pause/resume state
         self.paused_for_review: bool = False
         self.resume_state_path: Optional[Path] = None
@@ -153,6 +167,7 @@ class HighlightPipeline:
         self._refine_goal_clock = True
         self._refine_local_ocr = True
         self._goal_legacy_timing_fallback_override: Optional[bool] = None
+        self._refresh_box_score = False
         self._detected_game_start_time: Optional[float] = None
         self._game_context: Dict = {}
         if game_info_override:
@@ -177,6 +192,28 @@ class HighlightPipeline:
         """Get GoalSummary with team context"""
         return self._goal_summary
 
+    @property
+    def matched_events(self) -> List[Dict]:
+        """Box score events annotated with video times (None when unmatched)"""
+        return self._matched_events
+
+    @matched_events.setter
+    def matched_events(self, events: List[Dict]) -> None:
+        self._matched_events = events
+        self._valid_events = None
+
+    @property
+    def valid_events(self) -> List[Dict]:
+        """
+        Matched events that have a video time, in matched_events order.
+
+        Computed once per assignment of matched_events (step 5 fixes it after
+        sorting); in-place edits of video_time must reassign matched_events.
+        """
+        if self._valid_events is None:
+            self._valid_events = [e for e in self._matched_events if e.get('video_time') is not None]
+        return self._valid_events
+
     def _record_failure(self, step: int, reason: str, exc: Optional[BaseException] = None) -> None:
         # Keep the first failure cause; later warnings shouldn't clobber it.
         if self.failed_step is None:
@@ -185,6 +222,20 @@ class HighlightPipeline:
             if exc is not None:
                 self.exception_type = type(exc).__name__
 
+    @contextmanager
+    def _timed_step(self, name: str):
+        """
+        Record the wall time of a block in `_step_timings` under `name`.
+
+        Dotted names ('fetch_box_score.find_game') are sub-steps of the part before
+        the first dot; the time is recorded even if the block raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._step_timings[name] = time.perf_counter() - start
+
     def _configure_pipeline_logging(self) -> None:
         """
         Attach a per-game log file handler for highlight_extractor.* loggers.
@@ -218,9 +269,9 @@ class HighlightPipeline:
     def _refresh_game_context(self) -> None:
         context: Dict = {}
         if self.game_info is not None:
-            context.update(getattr(self.game_info, "__dict__", {}) or {})
+            context.update(self.game_info.to_dict())
         if self.source_game_info is not None:
-            for key, value in (getattr(self.source_game_info, "__dict__", {}) or {}).items():
+            for key, value in self.source_game_info.to_dict().items():
                 context.setdefault(key, value)
 
         if isinstance(self.box_score, dict):
@@ -481,6 +532,7 @@ class HighlightPipeline:
         reel_mode: Optional[str] = None,
         build_reel: bool = True,
         build_description: bool = True,
+        refresh: bool = False,
     ) -> PipelineResult:
         """
         Execute the complete 7-step pipeline
@@ -502,12 +554,15 @@ class HighlightPipeline:
             reel_mode: Reel composition mode (goals_only, goals_with_pp_penalties,
                 goals_with_approved_majors, full_production)
             build_reel: Build the per-game stitched highlights reel after creating clips
-            build_description: Generate the YouTube description sidecar after processing
+            build_description: Generate the YouTube description sidecar after processing
+            refresh: Bypass the game ID / box score caches and re-fetch from the API
+                (e.g. for games still in progress)
 
         Returns:
             PipelineResult with success status and metrics
-        """
-        self.reel_mode = self._normalize_reel_mode(reel_mode)
+        """
+        self.reel_mode = self._normalize_reel_mode(reel_mode)
+        self._refresh_box_score = bool(refresh)
         self._refine_goal_clock = bool(refine_goal_clock)
         self._refine_local_ocr = bool(refine_local_ocr)
         self._goal_legacy_timing_fallback_override = (
@@ -517,7 +572,17 @@ class HighlightPipeline:
         self._pending_broadcast_type = str(broadcast_type or 'auto')
         if self._pending_broadcast_type != 'auto':
             logger.info(f"Using broadcast type: {self._pending_broadcast_type}")
-        self._pipeline_start_time = time.time()
+        self._pipeline_start_time = time.perf_counter()
+        self.wait_for_cleanup()
+        self._cleanup_done = threading.Event()
+        if hasattr(self.video_processor, 'clip_worker_count'):
+            clip_workers = self.video_processor.clip_worker_count()
+        else:
+            clip_workers = getattr(self.config, 'CLIP_EXTRACT_WORKERS', None) or min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, int(ocr_workers or 1), int(clip_workers)),
+            thread_name_prefix="pipeline",
+        )
         errors = []
         warnings = []
 
@@ -534,7 +599,8 @@ class HighlightPipeline:
 
             # STEP 1: Parse filename and create folders
             try:
-                self._step1_parse_and_setup()
+                with self._timed_step('parse_and_setup'):
+                    self._step1_parse_and_setup()
             except Exception as e:
                 self._record_failure(1, "parse_failed", e)
                 error_msg = f"Step 1 failed: {e}"
@@ -542,22 +608,34 @@ class HighlightPipeline:
                 errors.append(error_msg)
                 return self._create_result(False, errors, warnings)
 
-            # STEP 2: Fetch box score
-            try:
-                self._step2_fetch_box_score()
-            except Exception as e:
-                self._record_failure(2, "box_score_failed", e)
-                error_msg = f"Step 2 failed: {e}"
-                logger.error(error_msg)
-                errors.append(error_msg)
-                return self._create_result(False, errors, warnings)
+            # STEP 2 + 3: Fetch box score (network) in the background while the video
+            # loads (disk). The fetch is joined before any OCR starts, and a step 2
+            # failure is still reported ahead of a step 3 failure.
+            video_load_error = None
+            box_score_future = self._executor.submit(
+                self._timed_step('fetch_box_score')(self._step2_fetch_box_score)
+            )
 
-            # STEP 3: Load video
-            try:
-                self._step3_load_video()
-            except Exception as e:
-                self._record_failure(3, "video_load_failed", e)
-                error_msg = f"Step 3 failed: {e}"
+            # STEP 3: Load video
+            try:
+                with self._timed_step('load_video'):
+                    self._step3_load_video()
+            except Exception as e:
+                video_load_error = e
+
+            # STEP 2: Fetch box score
+            try:
+                box_score_future.result()
+            except Exception as e:
+                self._record_failure(2, "box_score_failed", e)
+                error_msg = f"Step 2 failed: {e}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                return self._create_result(False, errors, warnings)
+
+            if video_load_error is not None:
+                self._record_failure(3, "video_load_failed", video_load_error)
+                error_msg = f"Step 3 failed: {video_load_error}"
                 logger.error(error_msg)
                 errors.append(error_msg)
                 return self._create_result(False, errors, warnings)
@@ -567,7 +645,8 @@ class HighlightPipeline:
             self._detected_game_start_time = None
             if auto_detect_start:
                 try:
-                    detected_start = self._detect_game_start()
+                    with self._timed_step('detect_game_start'):
+                        detected_start = self._detect_game_start()
                     if detected_start is not None:
                         game_start_time = detected_start
                         self._detected_game_start_time = float(detected_start)
@@ -579,12 +658,13 @@ class HighlightPipeline:
 
             # STEP 4: Extract timestamps via OCR
             try:
-                self._step4_extract_timestamps(
-                    sample_interval=sample_interval,
-                    parallel=parallel_ocr,
-                    workers=ocr_workers,
-                    start_time=game_start_time
-                )
+                with self._timed_step('extract_timestamps'):
+                    self._step4_extract_timestamps(
+                        sample_interval=sample_interval,
+                        parallel=parallel_ocr,
+                        workers=ocr_workers,
+                        start_time=game_start_time
+                    )
             except Exception as e:
                 self._record_failure(4, "ocr_failed", e)
                 error_msg = f"Step 4 failed: {e}"
@@ -594,10 +674,11 @@ class HighlightPipeline:
 
             # STEP 5: Match events to video
             try:
-                self._step5_match_events(
-                    tolerance_seconds=tolerance_seconds,
-                    recording_game_start_time=self._detected_game_start_time,
-                )
+                with self._timed_step('match_events'):
+                    self._step5_match_events(
+                        tolerance_seconds=tolerance_seconds,
+                        recording_game_start_time=self._detected_game_start_time,
+                    )
             except Exception as e:
                 self._record_failure(5, "event_match_failed", e)
                 error_msg = f"Step 5 failed: {e}"
@@ -607,10 +688,11 @@ class HighlightPipeline:
 
             # STEP 6: Create individual clips
             try:
-                self._step6_create_clips(
-                    before_seconds=before_seconds,
-                    after_seconds=after_seconds
-                )
+                with self._timed_step('create_clips'):
+                    self._step6_create_clips(
+                        before_seconds=before_seconds,
+                        after_seconds=after_seconds
+                    )
             except Exception as e:
                 error_msg = f"Step 6 failed: {e}"
                 logger.error(error_msg)
@@ -620,7 +702,8 @@ class HighlightPipeline:
 
             # STEP 6.5: Handle major penalties (async review workflow)
             try:
-                self._step6_5_process_major_penalties()
+                with self._timed_step('major_penalties'):
+                    self._step6_5_process_major_penalties()
             except Exception as e:
                 warning_msg = f"Step 6.5 (major penalties) failed: {e}"
                 logger.warning(warning_msg)
@@ -649,7 +732,8 @@ class HighlightPipeline:
             highlights_path = None
             if build_reel:
                 try:
-                    highlights_path = self._step7_create_highlights_reel(max_clips=max_clips)
+                    with self._timed_step('create_highlights_reel'):
+                        highlights_path = self._step7_create_highlights_reel(max_clips=max_clips)
                 except Exception as e:
                     error_msg = f"Step 7 failed: {e}"
                     logger.error(error_msg)
@@ -660,7 +744,8 @@ class HighlightPipeline:
 
             if build_description:
                 try:
-                    self._step8_generate_description()
+                    with self._timed_step('generate_description'):
+                        self._step8_generate_description()
                 except Exception as e:
                     warning_msg = f"Step 8 (YouTube description) failed: {e}"
                     logger.warning(warning_msg)
@@ -684,13 +769,12 @@ class HighlightPipeline:
             return self._create_result(False, errors, warnings)
 
         finally:
-            # Always cleanup
-            self._cleanup()
+            # Always cleanup, but off the critical path: closing decoders and
+            # flushing logs can take a while after a long game.
+            self._start_background_cleanup()
 
     def _step1_parse_and_setup(self):
         """Step 1: Parse filename and create folder structure"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 1: PARSING GAME INFORMATION")
         logger.info("=" * 70)
@@ -717,7 +801,6 @@ class HighlightPipeline:
 
             self._configure_pipeline_logging()
             self._refresh_game_context()
-            self._step_timings['parse_and_setup'] = time.time() - start_time
             return
 
         # Parse filename
@@ -741,27 +824,33 @@ class HighlightPipeline:
 
         self._configure_pipeline_logging()
         self._refresh_game_context()
-        self._step_timings['parse_and_setup'] = time.time() - start_time
 
     def _step2_fetch_box_score(self):
         """Step 2: Fetch box score from API"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 2: FETCHING BOX SCORE")
         logger.info("=" * 70)
 
-        # Initialize fetcher with cache dir (only if not already provided for testing)
-        if not hasattr(self.box_score_fetcher, 'find_game'):
-            self.box_score_fetcher = BoxScoreFetcher(cache_dir=self.game_folders['data_dir'])
+        # Point the fetcher's read-through cache at this game's data folder unless the
+        # caller configured one (stub fetchers without a cache are left untouched).
+        fetcher = self.box_score_fetcher
+        if getattr(fetcher, 'cache_dir', False) is None:
+            cache_dir = Path(self.game_folders['data_dir']) / 'box_score_cache'
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            fetcher.cache_dir = cache_dir
+            if getattr(fetcher, 'cache_ttl_seconds', None) is None:
+                fetcher.cache_ttl_seconds = getattr(self.config, 'BOX_SCORE_CACHE_TTL_SECONDS', None)
+        if hasattr(fetcher, 'refresh'):
+            fetcher.refresh = self._refresh_box_score
 
         # Find game ID
-        game_id = self.box_score_fetcher.find_game(
-            self.game_info.league,
-            self.game_info.home_team,
-            self.game_info.away_team,
-            self.game_info.date
-        )
+        with self._timed_step('fetch_box_score.find_game'):
+            game_id = self.box_score_fetcher.find_game(
+                self.game_info.league,
+                self.game_info.home_team,
+                self.game_info.away_team,
+                self.game_info.date
+            )
 
         if not game_id:
             raise ValueError(
@@ -772,24 +861,26 @@ class HighlightPipeline:
             )
 
         # Fetch box score
-        self.box_score = self.box_score_fetcher.fetch_box_score(
-            self.game_info.league,
-            game_id
-        )
+        with self._timed_step('fetch_box_score.fetch_box_score'):
+            self.box_score = self.box_score_fetcher.fetch_box_score(
+                self.game_info.league,
+                game_id
+            )
 
         if not self.box_score:
             raise ValueError("Failed to fetch box score from API")
 
-        # Extract events (dictionary format for backward compatibility)
-        self.events = self.box_score_fetcher.extract_events(self.box_score)
+        with self._timed_step('fetch_box_score.extract_events'):
+            # Extract events (dictionary format for backward compatibility)
+            self.events = self.box_score_fetcher.extract_events(self.box_score)
 
-        # Also extract typed Goal objects (new in v2.1)
-        self._goals = self.box_score_fetcher.get_goals(self.box_score)
-        self._goal_summary = self.box_score_fetcher.get_goal_summary(
-            self.box_score,
-            self.game_info.home_team,
-            self.game_info.away_team
-        )
+            # Also extract typed Goal objects (new in v2.1)
+            self._goals = self.box_score_fetcher.get_goals(self.box_score)
+            self._goal_summary = self.box_score_fetcher.get_goal_summary(
+                self.box_score,
+                self.game_info.home_team,
+                self.game_info.away_team
+            )
 
         if not self.events:
             logger.warning("⚠️  No events found in box score")
@@ -804,18 +895,15 @@ class HighlightPipeline:
         # Save game metadata
         self.file_manager.save_game_metadata(
             self.game_folders,
-            self.game_info.__dict__,
+            self.game_info.to_dict(),
             self.box_score,
-            source_game_info=self.source_game_info.__dict__ if self.source_game_info else None,
+            source_game_info=self.source_game_info.to_dict() if self.source_game_info else None,
         )
 
         self._refresh_game_context()
-        self._step_timings['fetch_box_score'] = time.time() - start_time
 
     def _step3_load_video(self):
         """Step 3: Load video file"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 3: LOADING VIDEO")
         logger.info("=" * 70)
@@ -828,12 +916,8 @@ class HighlightPipeline:
             f"@ {self.video_processor.fps:.1f} FPS"
         )
 
-        self._step_timings['load_video'] = time.time() - start_time
-
     def _detect_game_start(self) -> Optional[float]:
         """Detect when the actual game starts (puck drop) to skip pre-game content"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 3.5: AUTO-DETECTING GAME START")
         logger.info("=" * 70)
@@ -845,7 +929,6 @@ class HighlightPipeline:
         else:
             logger.warning("Could not detect game start")
 
-        self._step_timings['detect_game_start'] = time.time() - start_time
         return game_start
 
     def _step4_extract_timestamps(
@@ -856,7 +939,6 @@ class HighlightPipeline:
         start_time: float = 0.0
     ):
         """Step 4: Extract timestamps from video via OCR"""
-        step_start = time.time()
         video_start_time = start_time  # Rename to avoid conflict
 
         logger.info("\n" + "=" * 70)
@@ -877,18 +959,20 @@ class HighlightPipeline:
         # Sample video with OCR
         ocr_engine = self._ensure_ocr_engine()
 
-        self.video_timestamps = ocr_engine.sample_video_times(
-            self.video_processor,
-            sample_interval=sample_interval,
-            max_samples=None,
-            debug_dir=self.game_folders['data_dir'],
-            parallel=parallel,
-            workers=workers,
-            start_time=video_start_time,
-            output_dir=self.game_folders.get('data_dir'),
-            game_id=ocr_game_id,
-            broadcast_type=str(self._pending_broadcast_type or "auto"),
-        )
+        with self._timed_step('extract_timestamps.sample'):
+            self.video_timestamps = ocr_engine.sample_video_times(
+                self.video_processor,
+                sample_interval=sample_interval,
+                max_samples=None,
+                debug_dir=self.game_folders['data_dir'],
+                parallel=parallel,
+                workers=workers,
+                start_time=video_start_time,
+                output_dir=self.game_folders.get('data_dir'),
+                game_id=ocr_game_id,
+                broadcast_type=str(self._pending_broadcast_type or "auto"),
+                **self._executor_kwargs(),
+            )
 
         # Hybrid policy: if OCR quality is poor, run a probe pass to lock onto the most stable
         # scoreboard settings and rerun sampling before failing the pipeline.
@@ -925,18 +1009,20 @@ class HighlightPipeline:
                     logger.warning(f"OCR probe pass failed: {e}")
 
                 # Retry full sampling using the newly cached ROI/broadcast/backend/preprocess.
-                self.video_timestamps = ocr_engine.sample_video_times(
-                    self.video_processor,
-                    sample_interval=sample_interval,
-                    max_samples=None,
-                    debug_dir=self.game_folders['data_dir'],
-                    parallel=parallel,
-                    workers=workers,
-                    start_time=video_start_time,
-                    output_dir=self.game_folders.get('data_dir'),
-                    game_id=ocr_game_id,
-                    broadcast_type=str(self._pending_broadcast_type or "auto"),
-                )
+                with self._timed_step('extract_timestamps.resample'):
+                    self.video_timestamps = ocr_engine.sample_video_times(
+                        self.video_processor,
+                        sample_interval=sample_interval,
+                        max_samples=None,
+                        debug_dir=self.game_folders['data_dir'],
+                        parallel=parallel,
+                        workers=workers,
+                        start_time=video_start_time,
+                        output_dir=self.game_folders.get('data_dir'),
+                        game_id=ocr_game_id,
+                        broadcast_type=str(self._pending_broadcast_type or "auto"),
+                        **self._executor_kwargs(),
+                    )
 
         if not self.video_timestamps:
             raise ValueError(
@@ -951,10 +1037,8 @@ class HighlightPipeline:
 
         # Save debug info
         debug_file = self.game_folders['data_dir'] / 'video_timestamps.json'
-        with open(debug_file, 'w') as f:
-            json.dump(self.video_timestamps, f, indent=2)
-
-        self._step_timings['extract_timestamps'] = time.time() - step_start
+        with self._timed_step('extract_timestamps.serialize'):
+            write_json(debug_file, self.video_timestamps)
 
     def _step5_match_events(
         self,
@@ -962,8 +1046,6 @@ class HighlightPipeline:
         recording_game_start_time: Optional[float] = None,
     ):
         """Step 5: Match box score events to video timestamps"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 5: MATCHING EVENTS TO VIDEO")
         logger.info("=" * 70)
@@ -1046,8 +1128,11 @@ class HighlightPipeline:
 
         self._finalize_goal_timing_verification(self.matched_events)
 
+        # Sort by video time
+        self.matched_events = self.event_matcher.sort_events_by_video_time(self.matched_events)
+
         # Filter to only events with successful matches
-        valid_events = [e for e in self.matched_events if e.get('video_time') is not None]
+        valid_events = self.valid_events
 
         if not valid_events:
             raise ValueError(
@@ -1059,14 +1144,9 @@ class HighlightPipeline:
 
         logger.info(f"✅ Matched {len(valid_events)}/{len(self.events)} events to video")
 
-        # Sort by video time
-        self.matched_events = self.event_matcher.sort_events_by_video_time(self.matched_events)
-
         # Save matched events
         self.file_manager.save_events(self.game_folders, self.matched_events)
 
-        self._step_timings['match_events'] = time.time() - start_time
-
     def _ocr_clock_sample(self, t: float, *, expected_period: int, period_length: int) -> Dict:
         frame = self.video_processor.get_frame_at_time(float(t))
         if frame is None:
@@ -1722,22 +1802,17 @@ class HighlightPipeline:
         after_seconds: float = 4.0
     ):
         """Step 6: Create individual highlight clips for the selected reel mode."""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 6: CREATING HIGHLIGHT CLIPS")
         logger.info("=" * 70)
 
         # Filter to goals only
-        goal_events = self.event_matcher.filter_events_by_type(
-            [e for e in self.matched_events if e.get('video_time') is not None],
-            ['goal']
-        )
+        goal_events = self.event_matcher.filter_events_by_type(self.valid_events, ['goal'])
 
         if not goal_events:
             logger.warning("⚠️  No goals found in matched events")
             logger.info("   Creating clips for all events instead...")
-            goal_events = [e for e in self.matched_events if e.get('video_time') is not None]
+            goal_events = list(self.valid_events)
 
         # Ensure we don't mix clips from previous runs (important when team labels change).
         try:
@@ -1869,7 +1944,8 @@ class HighlightPipeline:
             final_events,
             self.game_folders['clips_dir'],
             before_seconds=before_seconds,
-            after_seconds=after_seconds
+            after_seconds=after_seconds,
+            **self._executor_kwargs(),
         )
 
         if not self.created_clips:
@@ -1880,29 +1956,35 @@ class HighlightPipeline:
             clips_dir = self.game_folders['clips_dir']
             game_dir = self.game_folders['game_dir']
             manifest: Dict[str, List[Dict]] = {"clips": []}
-            for idx, (event, clip_path) in enumerate(self.created_clips, 1):
+            # Events whose windows were merged share a clip: one entry per clip,
+            # carrying the first event's fields plus every covered event in "events".
+            events_by_clip: Dict[Path, List] = {}
+            for event, clip_path in self.created_clips:
+                events_by_clip.setdefault(Path(clip_path), []).append(event)
+            for idx, (clip_path, clip_events) in enumerate(events_by_clip.items(), 1):
                 relpath = None
                 try:
                     relpath = str(Path(clip_path).relative_to(game_dir))
                 except Exception:
                     relpath = str(clip_path)
 
+                event = clip_events[0]
                 entry: Dict = dict(event) if isinstance(event, dict) else {"type": "unknown"}
+                if len(clip_events) > 1:
+                    entry["events"] = [dict(e) for e in clip_events if isinstance(e, dict)]
                 entry["index"] = idx
                 entry["clip_filename"] = Path(clip_path).name
                 entry["path"] = relpath
                 manifest["clips"].append(entry)
 
             manifest_path = self.game_folders['data_dir'] / "clips_manifest.json"
-            manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+            write_json(manifest_path, manifest, indent=True)
             logger.info(f"Saved clip manifest: {manifest_path}")
         except Exception as e:
             logger.warning(f"Could not write clips manifest: {e}")
 
         logger.info(f"✅ Created {len(self.created_clips)} clips")
 
-        self._step_timings['create_clips'] = time.time() - start_time
-
     def _find_penalty_video_time(self, penalty_info: PenaltyInfo) -> Optional[float]:
         """
         Find the video timestamp for a penalty using OCR timestamp data.
@@ -2096,15 +2178,12 @@ class HighlightPipeline:
 
     def _step6_5_process_major_penalties(self):
         """Step 6.5: Process 5-minute major penalties for async review"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 6.5: CHECKING FOR MAJOR PENALTIES")
         logger.info("=" * 70)
 
         if not self._requires_major_review_workflow():
             logger.info("Skipping major penalty workflow for reel mode '%s'", self.reel_mode)
-            self._step_timings['major_penalties'] = time.time() - start_time
             return
 
         # Get penalties from box_score - nested under SiteKit.Gamesummary.penalties
@@ -2124,7 +2203,6 @@ class HighlightPipeline:
         )
         if not major_groups:
             logger.info("No 5-minute major penalties detected")
-            self._step_timings['major_penalties'] = time.time() - start_time
             return
 
         logger.info(f"Found {sum(len(g) for g in major_groups)} major penalties in {len(major_groups)} groups")
@@ -2231,20 +2309,17 @@ class HighlightPipeline:
             except Exception as e:
                 logger.warning(f"Could not write major review state: {e}")
 
-        self._step_timings['major_penalties'] = time.time() - start_time
-
     def _step7_create_highlights_reel(
         self,
         max_clips: Optional[int] = None
     ) -> Optional[Path]:
         """Step 7: Create final highlights reel"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 7: CREATING HIGHLIGHTS REEL")
         logger.info("=" * 70)
 
-        clip_paths = [clip_path for _, clip_path in self.created_clips]
+        # Merged windows appear once per event; the reel needs each clip once.
+        clip_paths = list(dict.fromkeys(clip_path for _, clip_path in self.created_clips))
         highlights_path = self.game_folders['output_dir'] / 'highlights.mp4'
 
         # Use max_clips from config if not specified
@@ -2257,14 +2332,10 @@ class HighlightPipeline:
             max_clips=max_clips
         )
 
-        self._step_timings['create_highlights_reel'] = time.time() - start_time
-
         return highlights_path if success else None
 
     def _step8_generate_description(self):
         """Step 8: Generate YouTube description file"""
-        start_time = time.time()
-
         logger.info("\n" + "=" * 70)
         logger.info("STEP 8: GENERATING YOUTUBE DESCRIPTION")
         logger.info("=" * 70)
@@ -2291,8 +2362,7 @@ class HighlightPipeline:
                 game_data['attendance'] = gi.get('attendance', game_data['attendance'])
 
         # Use matched events with video times for clickable timestamps
-        matched_goals = [e for e in self.matched_events
-                        if e.get('type') == 'goal' and e.get('video_time') is not None]
+        matched_goals = [e for e in self.valid_events if e.get('type') == 'goal']
 
         # Generate and save description
         desc_path = generate_and_save_description(
@@ -2303,15 +2373,13 @@ class HighlightPipeline:
 
         logger.info(f"✅ YouTube description saved: {desc_path}")
 
-        self._step_timings['generate_description'] = time.time() - start_time
-
     def _log_summary(self, highlights_path: Optional[Path]):
         """Log processing summary"""
         logger.info("\n" + "=" * 70)
         logger.info("PROCESSING COMPLETE!")
         logger.info("=" * 70)
 
-        valid_events = [e for e in self.matched_events if e.get('video_time') is not None]
+        valid_events = self.valid_events
 
         logger.info(f"\n📊 Summary:")
         logger.info(f"   Events in box score: {len(self.events)}")
@@ -2326,11 +2394,22 @@ class HighlightPipeline:
         logger.info(f"   Logs: {self.game_folders['logs_dir'] / 'pipeline.log'}")
 
         # Performance summary
-        total_time = time.time() - self._pipeline_start_time
+        total_time = time.perf_counter() - self._pipeline_start_time
         logger.info(f"\n⏱️  Performance:")
         logger.info(f"   Total time: {total_time:.1f}s ({total_time/60:.1f} minutes)")
+        # Slowest steps first, each followed by its sub-steps. Box score fetching
+        # overlaps video loading/OCR, so shares can add up to more than 100%.
+        sub_steps: Dict[str, List[tuple]] = {}
         for step_name, duration in self._step_timings.items():
-            logger.info(f"   {step_name}: {duration:.1f}s")
+            parent, _, child = step_name.partition('.')
+            if child:
+                sub_steps.setdefault(parent, []).append((child, duration))
+        top_level = [(k, v) for k, v in self._step_timings.items() if '.' not in k]
+        for step_name, duration in sorted(top_level, key=lambda kv: kv[1], reverse=True):
+            share = 100.0 * duration / total_time if total_time > 0 else 0.0
+            logger.info(f"   {step_name}: {duration:.1f}s ({share:.0f}%)")
+            for child, child_duration in sorted(sub_steps.get(step_name, ()), key=lambda kv: kv[1], reverse=True):
+                logger.info(f"      {child}: {child_duration:.1f}s")
 
     def _create_result(
         self,
@@ -2340,9 +2419,9 @@ class HighlightPipeline:
         highlights_path: Optional[Path] = None
     ) -> PipelineResult:
         """Create PipelineResult from pipeline state"""
-        valid_events = [e for e in self.matched_events if e.get('video_time') is not None]
+        valid_events = self.valid_events
 
-        total_time = time.time() - self._pipeline_start_time if self._pipeline_start_time is not None else 0.0
+        total_time = time.perf_counter() - self._pipeline_start_time if self._pipeline_start_time is not None else 0.0
 
         return PipelineResult(
             success=success,
@@ -2363,11 +2442,21 @@ class HighlightPipeline:
             matching_duration_seconds=self._step_timings.get('match_events'),
             rendering_duration_seconds=self._step_timings.get('create_clips', 0) +
                                       self._step_timings.get('create_highlights_reel', 0),
-            total_duration_seconds=total_time
+            total_duration_seconds=total_time,
+            step_timings=dict(self._step_timings),
+            cleanup_done=self._cleanup_done,
         )
 
+    def _executor_kwargs(self) -> Dict:
+        """`executor=` for step helpers when execute() has a shared pool running"""
+        return {'executor': self._executor} if self._executor is not None else {}
+
     def _cleanup(self):
         """Clean up resources"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
         try:
             self.video_processor.cleanup()
             logger.debug("Pipeline cleanup completed")
@@ -2384,7 +2473,27 @@ class HighlightPipeline:
                     pass
                 self._log_handler = None
         except Exception:
-            pass
+            pass
+
+    def _start_background_cleanup(self):
+        """Run _cleanup on a worker thread and signal _cleanup_done when finished"""
+        done = self._cleanup_done
+
+        def run():
+            try:
+                self._cleanup()
+            finally:
+                done.set()
+
+        try:
+            threading.Thread(target=run, name="pipeline-cleanup").start()
+        except RuntimeError:
+            # Interpreter shutting down; clean up inline.
+            run()
+
+    def wait_for_cleanup(self, timeout: Optional[float] = None) -> bool:
+        """Block until the last execute() has released its resources"""
+        return self._cleanup_done.wait(timeout)
 
     def __enter__(self):
         """Context manager entry"""
@@ -2392,4 +2501,5 @@ class HighlightPipeline:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
+        self.wait_for_cleanup()
         self._cleanup()
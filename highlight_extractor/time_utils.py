@@ -7,9 +7,18 @@ This module provides centralized time handling for:
 - Video timestamp conversions
 """
 
+import bisect
 import re
+from functools import lru_cache
 from typing import Any, Optional, Tuple
 from dataclasses import dataclass
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: the NumPy kernels below are used instead
+    njit = None
 
 
 # Hockey period constants
@@ -18,6 +27,13 @@ PERIOD_LENGTH_SECONDS = PERIOD_LENGTH_MINUTES * 60
 OT_LENGTH_MINUTES = 5
 OT_LENGTH_SECONDS = OT_LENGTH_MINUTES * 60
 
+# Precompiled patterns (used with fullmatch) for the clock/period parsers.
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
+# One alternation for every period spelling: "1"/"1ST" | "P1" | "OT"/"2OT" | "OT1".
+_PERIOD_RE = re.compile(r'(\d+)(?:ST|ND|RD|TH)?|P(\d+)|(\d*)OT|OT(1)')
+
+_PERIOD_LABELS = {1: "1st", 2: "2nd", 3: "3rd", 4: "OT", 5: "2OT"}
+
 
 @dataclass(frozen=True)
 class GameClockRules:
@@ -40,6 +56,12 @@ class GameClockRules:
 
 DEFAULT_GAME_CLOCK_RULES = GameClockRules()
 
+# Start of periods 1-4 under the default (regular season) rules; every period
+# from 4 on is a DEFAULT_OT_SECONDS overtime.
+_CUM_PERIOD_OFFSETS = (0, PERIOD_LENGTH_SECONDS, 2 * PERIOD_LENGTH_SECONDS, 3 * PERIOD_LENGTH_SECONDS)
+_REGULATION_SECONDS = _CUM_PERIOD_OFFSETS[3]
+_DEFAULT_OT_SECONDS = DEFAULT_GAME_CLOCK_RULES.period_length_seconds(4)
+
 
 def _context_get(game_context: Any, key: str, default: Any = None) -> Any:
     if game_context is None:
@@ -53,6 +75,8 @@ def game_clock_rules_from_context(game_context: Any = None) -> GameClockRules:
     """Build clock rules from a game metadata object or dict."""
     if isinstance(game_context, GameClockRules):
         return game_context
+    if game_context is None:
+        return DEFAULT_GAME_CLOCK_RULES
 
     playoff_raw = _context_get(game_context, "playoff", None)
     schedule_notes = str(_context_get(game_context, "schedule_notes", "") or "").strip().lower()
@@ -87,20 +111,85 @@ def game_clock_rules_from_context(game_context: Any = None) -> GameClockRules:
         20,
     )
 
-    return GameClockRules(
+    rules = GameClockRules(
         playoff=bool(playoff),
         regular_season_ot_minutes=regular_season_ot_minutes,
         playoff_first_ot_minutes=playoff_first_ot_minutes,
         playoff_later_ot_minutes=playoff_later_ot_minutes,
     )
+    # Hand back the shared instance for default rules so the conversion
+    # helpers can take their constant fast path with an identity check.
+    return DEFAULT_GAME_CLOCK_RULES if rules == DEFAULT_GAME_CLOCK_RULES else rules
 
 
 def period_length_seconds(period: int, clock_rules: Any = None) -> int:
     rules = game_clock_rules_from_context(clock_rules)
     return rules.period_length_seconds(period)
+
+
+@lru_cache(maxsize=64)
+def _period_tables(rules: GameClockRules, num_periods: int) -> Tuple[Tuple[int, ...], Tuple[int, ...], np.ndarray, np.ndarray]:
+    """
+    Per-period lookup tables for periods 0..num_periods-1 (index = period number).
+
+    Returns (offsets, lengths) as tuples for scalar lookups and as int64 arrays
+    for vectorized gathers. offsets[p] is the game time elapsed before period p.
+    Index 0 mirrors period 1 so `int(period or 1)` semantics hold.
+    """
+    lengths = [rules.period_length_seconds(1)] + [rules.period_length_seconds(p) for p in range(1, num_periods)]
+    offsets = [0, 0]
+    for p in range(1, num_periods - 1):
+        offsets.append(offsets[-1] + lengths[p])
+    return (
+        tuple(offsets),
+        tuple(lengths),
+        np.asarray(offsets, dtype=np.int64),
+        np.asarray(lengths, dtype=np.int64),
+    )
+
+
+def _tables_for(rules: GameClockRules, max_period: int):
+    # Round the table size up to a power of two so the cache stays tiny.
+    size = 8
+    while size <= max_period:
+        size *= 2
+    return _period_tables(rules, size)
+
+
+# Array kernels for the *_vec conversions. Inputs are already clamped/cast by
+# the callers; `offsets`/`lengths` come from `_period_tables`.
+def _absolute_kernel(periods, remaining, offsets, lengths):
+    return offsets[periods] + (lengths[periods] - remaining)
+
+
+def _period_time_kernel(absolute, offsets, lengths):
+    periods = np.maximum(np.searchsorted(offsets, absolute, side="right") - 1, 1)
+    remaining = np.maximum(lengths[periods] - (absolute - offsets[periods]), 0)
+    return periods, remaining
+
+
+if njit is not None:
+    # Single fused pass per element instead of one temporary array per NumPy op.
+    @njit(cache=True)
+    def _absolute_kernel(periods, remaining, offsets, lengths):  # noqa: F811
+        out = np.empty(periods.shape[0], dtype=remaining.dtype)
+        for i in range(periods.shape[0]):
+            p = periods[i]
+            out[i] = offsets[p] + (lengths[p] - remaining[i])
+        return out
+
+    @njit(cache=True)
+    def _period_time_kernel(absolute, offsets, lengths):  # noqa: F811
+        n = absolute.shape[0]
+        periods = np.empty(n, dtype=np.int64)
+        remaining = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            p = max(np.searchsorted(offsets, absolute[i], side="right") - 1, 1)
+            periods[i] = p
+            remaining[i] = max(lengths[p] - (absolute[i] - offsets[p]), 0)
+        return periods, remaining
 
 
-@dataclass(frozen=True)
 class GameTime:
     """
     Represents a point in game time.
@@ -109,32 +198,45 @@ class GameTime:
     This class handles the conversion between:
     - Period + time remaining (what you see on the clock)
     - Absolute game time (seconds from start of game)
+
+    Immutable: the clock string is parsed once at construction and the derived
+    second counts are stored alongside it.
     """
-    period: int
-    time_remaining: str  # MM:SS format
+    __slots__ = ('_period', '_time_remaining', '_rem', '_abs')
+
+    def __init__(self, period: int, time_remaining: str):
+        """Validate and parse the game time"""
+        if int(period or 0) < 1:
+            raise ValueError(f"Invalid period {period}, expected >= 1")
 
-    def __post_init__(self):
-        """Validate the game time"""
-        if int(self.period or 0) < 1:
-            raise ValueError(f"Invalid period {self.period}, expected >= 1")
+        minutes, seconds = parse_time_string(time_remaining)
+        if minutes is None:
+            raise ValueError(f"Invalid time format '{time_remaining}', expected MM:SS")
+        if not (0 <= minutes <= 20) or not (0 <= seconds <= 59):
+            raise ValueError(f"Invalid time '{time_remaining}'")
 
-        if not re.match(r'^\d{1,2}:\d{2}$', self.time_remaining):
-            raise ValueError(f"Invalid time format '{self.time_remaining}', expected MM:SS")
+        self._period = period
+        self._time_remaining = time_remaining  # MM:SS format
+        self._rem = minutes * 60 + seconds
+        self._abs = period_time_to_absolute_seconds(period, self._rem)
 
-        minutes, seconds = parse_time_string(self.time_remaining)
-        if minutes is None or not (0 <= minutes <= 20) or not (0 <= seconds <= 59):
-            raise ValueError(f"Invalid time '{self.time_remaining}'")
+    @property
+    def period(self) -> int:
+        return self._period
+
+    @property
+    def time_remaining(self) -> str:
+        return self._time_remaining
 
     @property
     def time_remaining_seconds(self) -> int:
         """Get time remaining in period as seconds"""
-        minutes, seconds = parse_time_string(self.time_remaining)
-        return minutes * 60 + seconds
+        return self._rem
 
-    @property
-    def time_elapsed_in_period(self) -> int:
-        """Get time elapsed in current period (seconds)"""
-        return period_length_seconds(self.period) - self.time_remaining_seconds
+    @property
+    def time_elapsed_in_period(self) -> int:
+        """Get time elapsed in current period (seconds)"""
+        return period_length_seconds(self._period) - self._rem
 
     @property
     def absolute_seconds(self) -> int:
@@ -145,7 +247,18 @@ class GameTime:
         - Period 1, 15:00 remaining = 5 minutes elapsed = 300 seconds
         - Period 2, 10:00 remaining = 20 + 10 minutes elapsed = 1800 seconds
         """
-        return period_time_to_absolute_seconds(self.period, self.time_remaining_seconds)
+        return self._abs
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self._period, self._time_remaining) == (other._period, other._time_remaining)
+
+    def __hash__(self) -> int:
+        return hash((self._period, self._time_remaining))
+
+    def __repr__(self) -> str:
+        return f"GameTime(period={self._period!r}, time_remaining={self._time_remaining!r})"
 
     def __str__(self) -> str:
         return f"P{self.period} {self.time_remaining}"
@@ -168,14 +281,10 @@ def parse_time_string(time_str: str) -> Tuple[Optional[int], Optional[int]]:
         Tuple of (minutes, seconds) or (None, None) if parsing fails
     """
     try:
-        parts = time_str.strip().split(':')
-        if len(parts) == 2:
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-            return (minutes, seconds)
-    except (ValueError, AttributeError):
-        pass
-    return (None, None)
+        m = _TIME_RE.fullmatch(time_str.strip())
+    except AttributeError:
+        return (None, None)
+    return (int(m[1]), int(m[2])) if m else (None, None)
 
 
 def time_string_to_seconds(time_str: str) -> int:
@@ -226,17 +335,46 @@ def period_time_to_absolute_seconds(period: int, time_remaining_seconds: int, cl
     Returns:
         Absolute game time in seconds from start
     """
-    # Calculate time from completed previous periods
-    period_num = int(period or 1)
-    previous_periods_time = 0
-    for p in range(1, period_num):
-        previous_periods_time += period_length_seconds(p, clock_rules)
+    period_num = max(1, int(period or 1))
+    if clock_rules is None or clock_rules is DEFAULT_GAME_CLOCK_RULES:
+        if period_num <= 3:
+            return _CUM_PERIOD_OFFSETS[period_num - 1] + (PERIOD_LENGTH_SECONDS - time_remaining_seconds)
+        return (
+            _REGULATION_SECONDS
+            + (period_num - 4) * _DEFAULT_OT_SECONDS
+            + (_DEFAULT_OT_SECONDS - time_remaining_seconds)
+        )
+
+    offsets, lengths, _, _ = _tables_for(game_clock_rules_from_context(clock_rules), period_num)
+
+    # Completed previous periods + time elapsed in current period (length - remaining)
+    return offsets[period_num] + (lengths[period_num] - time_remaining_seconds)
 
-    # Time elapsed in current period = period length - time remaining
-    period_length = period_length_seconds(period_num, clock_rules)
-    time_elapsed_in_period = period_length - time_remaining_seconds
 
-    return previous_periods_time + time_elapsed_in_period
+def period_time_to_absolute_seconds_vec(periods: Any, time_remaining_seconds: Any, clock_rules: Any = None) -> np.ndarray:
+    """
+    Vectorized `period_time_to_absolute_seconds` for arrays of periods/remaining times.
+
+    Args:
+        periods: Array-like of period numbers (0/unknown is treated as period 1)
+        time_remaining_seconds: Array-like of time remaining in each period (seconds)
+
+    Returns:
+        Array of absolute game times in seconds from start
+    """
+    periods = np.maximum(np.asarray(periods, dtype=np.int64), 1)
+    remaining = np.asarray(time_remaining_seconds)
+    remaining = remaining.astype(np.float64 if remaining.dtype.kind == "f" else np.int64, copy=False)
+    max_period = int(periods.max()) if periods.size else 1
+    _, _, offsets, lengths = _tables_for(game_clock_rules_from_context(clock_rules), max_period)
+    shape = np.broadcast(periods, remaining).shape
+    result = _absolute_kernel(
+        np.ascontiguousarray(np.broadcast_to(periods, shape)).ravel(),
+        np.ascontiguousarray(np.broadcast_to(remaining, shape)).ravel(),
+        offsets,
+        lengths,
+    )
+    return result.reshape(shape)
 
 
 def absolute_seconds_to_period_time(absolute_seconds: int, clock_rules: Any = None) -> Tuple[int, int]:
@@ -252,21 +390,47 @@ def absolute_seconds_to_period_time(absolute_seconds: int, clock_rules: Any = No
     if absolute_seconds < 0:
         return (1, PERIOD_LENGTH_SECONDS)
 
-    remaining_absolute = int(absolute_seconds)
-    period = 1
-    while True:
-        current_period_length = period_length_seconds(period, clock_rules)
-        if remaining_absolute < current_period_length:
-            elapsed_in_period = remaining_absolute
-            break
-        remaining_absolute -= current_period_length
-        period += 1
-
-    # Time remaining = period length - time elapsed
-    current_period_length = period_length_seconds(period, clock_rules)
-    time_remaining = current_period_length - elapsed_in_period
-
-    return (period, max(0, time_remaining))
+    absolute = int(absolute_seconds)
+    if clock_rules is None or clock_rules is DEFAULT_GAME_CLOCK_RULES:
+        if absolute < _REGULATION_SECONDS:
+            period = bisect.bisect_right(_CUM_PERIOD_OFFSETS, absolute)
+            return (period, PERIOD_LENGTH_SECONDS - (absolute - _CUM_PERIOD_OFFSETS[period - 1]))
+        ot_index, into_ot = divmod(absolute - _REGULATION_SECONDS, _DEFAULT_OT_SECONDS)
+        return (4 + ot_index, _DEFAULT_OT_SECONDS - into_ot)
+
+    # Periods are at least a minute long, so this many periods always covers `absolute`.
+    offsets, lengths, _, _ = _tables_for(game_clock_rules_from_context(clock_rules), absolute // 60 + 2)
+    period = max(1, bisect.bisect_right(offsets, absolute) - 1)
+
+    # Time remaining = period length - time elapsed
+    time_remaining = lengths[period] - (absolute - offsets[period])
+
+    return (period, max(0, time_remaining))
+
+
+def absolute_seconds_to_period_time_vec(absolute_seconds: Any, clock_rules: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized `absolute_seconds_to_period_time`.
+
+    Args:
+        absolute_seconds: Array-like of absolute game times in seconds from start
+
+    Returns:
+        Tuple of (periods, time_remaining_seconds) arrays
+    """
+    values = np.asarray(absolute_seconds)
+    negative = values < 0
+    absolute = np.where(negative, 0, values).astype(np.int64)
+    max_abs = int(absolute.max()) if absolute.size else 0
+    _, _, offsets, lengths = _tables_for(game_clock_rules_from_context(clock_rules), max_abs // 60 + 2)
+
+    periods, remaining = _period_time_kernel(absolute.ravel(), offsets, lengths)
+    periods = periods.reshape(absolute.shape)
+    remaining = remaining.reshape(absolute.shape)
+
+    periods = np.where(negative, 1, periods)
+    remaining = np.where(negative, PERIOD_LENGTH_SECONDS, remaining)
+    return periods, remaining
 
 
 def format_period(period: int) -> str:
@@ -279,18 +443,10 @@ def format_period(period: int) -> str:
     Returns:
         Formatted string (e.g., "1st", "2nd", "OT")
     """
-    if period == 1:
-        return "1st"
-    elif period == 2:
-        return "2nd"
-    elif period == 3:
-        return "3rd"
-    elif period == 4:
-        return "OT"
-    elif period == 5:
-        return "2OT"
-    else:
+    label = _PERIOD_LABELS.get(period)
+    if label is None:
         return f"{period - 3}OT"
+    return label
 
 
 def parse_period_string(period_str: str) -> Optional[int]:
@@ -305,28 +461,18 @@ def parse_period_string(period_str: str) -> Optional[int]:
     Returns:
         Period number or None if parsing fails
     """
-    period_str = period_str.strip().upper()
-
-    # Direct number
-    if period_str.isdigit():
-        return int(period_str)
-
-    # "1st", "2nd", "3rd" format
-    match = re.match(r'^(\d+)(?:ST|ND|RD|TH)?$', period_str)
-    if match:
-        return int(match.group(1))
-
+    match = _PERIOD_RE.fullmatch(period_str.strip().upper())
+    if match is None:
+        return None
+
+    number, p_number, ot_number, _ot1 = match.groups()
+    # Direct number / "1st", "2nd", "3rd" format
+    if number is not None:
+        return int(number)
     # "P1", "P2" format
-    match = re.match(r'^P(\d+)$', period_str)
-    if match:
-        return int(match.group(1))
-
-    # Overtime formats
-    if period_str in ('OT', 'OT1', '1OT'):
-        return 4
-
-    match = re.match(r'^(\d+)OT$', period_str)
-    if match:
-        return 3 + int(match.group(1))
-
-    return None
+    if p_number is not None:
+        return int(p_number)
+    # Overtime formats: "OT", "OT1" and "1OT" are the first overtime
+    if ot_number:
+        return 3 + int(ot_number)
+    return 4
@@ -2,23 +2,141 @@
 Video Processor - Handles video loading, clip creation, and rendering
 """
 
+import bisect
+import functools
+import inspect
 import json
 import logging
+import math
+import os
 import re
 import subprocess
+import tempfile
+import threading
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from fractions import Fraction
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 import numpy as np
 from tqdm import tqdm
 
 try:
-    from moviepy import VideoFileClip, concatenate_videoclips, TextClip, CompositeVideoClip
+    from moviepy import VideoFileClip, TextClip, CompositeVideoClip
 except ImportError:
-    from moviepy.editor import VideoFileClip, concatenate_videoclips, TextClip, CompositeVideoClip
+    from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip
+
+try:
+    # Optional: PyAV gives direct access to keyframe PTS so OCR sampling can
+    # seek straight to keyframes instead of decoding forward from the previous one.
+    import av
+except ImportError:
+    av = None
+
+try:
+    # OpenCV ships with the OCR stack; used for grab/retrieve sampling without PyAV.
+    import cv2
+except ImportError:
+    cv2 = None
+
+try:
+    # Optional: torchcodec keeps one native decoder open and seeks by its frame
+    # index, which beats even PyAV for scattered single-frame reads.
+    from torchcodec.decoders import VideoDecoder as TorchCodecDecoder
+except (ImportError, OSError, RuntimeError):
+    TorchCodecDecoder = None
+
+try:
+    from numba import njit
+except ImportError:  # Optional: the NumPy `_compute_bounds` is used instead
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Whether this MoviePy's write_videofile takes `logger` (checked once, not per write).
+try:
+    _WRITE_ACCEPTS_LOGGER = 'logger' in inspect.signature(VideoFileClip.write_videofile).parameters
+except (TypeError, ValueError):
+    _WRITE_ACCEPTS_LOGGER = False
+
+# Clips are written as fragmented MP4 (a fragment per keyframe): readable while
+# still being written, and the muxer never buffers a whole-file index.
+_CLIP_MOVFLAGS = '+faststart+frag_keyframe'
+
+# Preference order when VIDEO_HWACCEL is 'auto'.
+_PREFERRED_HWACCELS = ('cuda', 'vaapi', 'videotoolbox', 'qsv', 'd3d11va')
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_hwaccels() -> Tuple[str, ...]:
+    """Hardware decode methods this ffmpeg build lists (`ffmpeg -hwaccels`), probed once."""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-hwaccels'],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ()
+    lines = (result.stdout or '').splitlines()
+    return tuple(line.strip() for line in lines[1:] if line.strip())
+
+
+def _compute_bounds(
+    video_times: np.ndarray,
+    duration: float,
+    before: np.ndarray,
+    after: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Clip (starts, ends) for every event time, clamped to [0, duration]."""
+    starts = np.clip(video_times - before, 0.0, duration)
+    ends = np.maximum(starts, np.minimum(duration, video_times + after))
+    return starts, ends
+
+
+# Below this many events the JIT call overhead outweighs the NumPy temporaries.
+_JIT_BOUNDS_MIN_EVENTS = 64
+
+if njit is not None:
+    # One fused pass per event (batch/full-season runs) instead of a temporary per op.
+    @njit(cache=True, fastmath=True)
+    def _compute_bounds_jit(video_times, duration, before, after):
+        n = video_times.shape[0]
+        starts = np.empty(n, dtype=np.float64)
+        ends = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            start = min(max(video_times[i] - before[i], 0.0), duration)
+            starts[i] = start
+            ends[i] = max(start, min(duration, video_times[i] + after[i]))
+        return starts, ends
+else:
+    _compute_bounds_jit = None
+
+
+def _merge_cut_windows(cuts: list, gap: Optional[float]) -> list:
+    """
+    Union overlapping clip windows.
+
+    `cuts` holds (index, event, start, end, path) tuples; windows that overlap
+    or sit within `gap` seconds of each other collapse into one
+    (members, start, end, path) entry, where `members` lists every
+    (index, event) it covers and `path` is the earliest window's. With `gap`
+    None every window stays separate.
+    """
+    if gap is None:
+        return [([(i, event)], start, end, path) for i, event, start, end, path in cuts]
+    merged: list = []
+    for i, event, start, end, path in sorted(cuts, key=lambda cut: (cut[2], cut[0])):
+        if merged and start <= merged[-1][2] + float(gap):
+            members, first_start, last_end, first_path = merged[-1]
+            members.append((i, event))
+            merged[-1] = (members, first_start, max(last_end, end), first_path)
+        else:
+            merged.append(([(i, event)], start, end, path))
+    return merged
+
 
 def _sanitize_filename_token(value: str, *, fallback: str, limit: int = 40) -> str:
     normalized = unicodedata.normalize("NFKD", str(value or ""))
@@ -61,6 +179,62 @@ def _event_clip_filename(event: dict, *, index: int) -> str:
     return "_".join(parts) + ".mp4"
 
 
+class _FramePool:
+    """
+    Round-robin set of preallocated RGB frame buffers.
+
+    A buffer handed out by `take` is overwritten `size` calls later, so callers
+    must be done with (or have copied) a frame before then.
+    """
+
+    def __init__(self, size: int):
+        self._size = max(1, int(size))
+        self._buffers: List[np.ndarray] = []
+        self._next = 0
+        self._staging: Optional[np.ndarray] = None
+
+    def take(self, shape: Tuple[int, ...]) -> np.ndarray:
+        if not self._buffers or self._buffers[0].shape != shape:
+            self._buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self._size)]
+            self._next = 0
+        buf = self._buffers[self._next]
+        self._next = (self._next + 1) % self._size
+        return buf
+
+    def staging(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Scratch buffer for intermediate (e.g. packed I420) data."""
+        if self._staging is None or self._staging.shape != shape:
+            self._staging = np.empty(shape, dtype=np.uint8)
+        return self._staging
+
+
+def _av_frame_to_rgb(frame, pool: Optional[_FramePool]) -> np.ndarray:
+    """
+    RGB array for a decoded PyAV frame, written into `pool` when possible.
+
+    Limited-range yuv420p (what broadcast H.264 decodes to) is packed as I420
+    and converted by OpenCV straight into a pooled buffer; anything else goes
+    through PyAV's own conversion.
+    """
+    if pool is None or cv2 is None or frame.format.name != "yuv420p" or frame.width % 2 or frame.height % 2:
+        return frame.to_ndarray(format="rgb24")
+    width, height = frame.width, frame.height
+    i420 = pool.staging((height * 3 // 2, width))
+    y_plane, u_plane, v_plane = frame.planes
+    i420[:height] = np.frombuffer(y_plane, np.uint8).reshape(height, y_plane.line_size)[:, :width]
+    chroma = (height // 2, width // 2)
+    # Chroma planes are packed back to back after Y; they only fill whole rows
+    # of `width` when height % 4 == 0, so address them through the flat buffer.
+    luma_size = height * width
+    chroma_size = luma_size // 4
+    flat = i420.reshape(-1)
+    u_rows = flat[luma_size:luma_size + chroma_size].reshape(chroma)
+    v_rows = flat[luma_size + chroma_size:].reshape(chroma)
+    u_rows[:] = np.frombuffer(u_plane, np.uint8).reshape(chroma[0], u_plane.line_size)[:, :chroma[1]]
+    v_rows[:] = np.frombuffer(v_plane, np.uint8).reshape(chroma[0], v_plane.line_size)[:, :chroma[1]]
+    return cv2.cvtColor(i420, cv2.COLOR_YUV2RGB_I420, dst=pool.take((height, width, 3)))
+
+
 class _WrittenClipHandle:
     """Minimal closeable handle for ffmpeg-written clips."""
 
@@ -80,61 +254,553 @@ class VideoProcessor:
             config: Configuration module
         """
         self.video_path = video_path
+        # Every decoder/ffmpeg call takes the path as a string; convert it once.
+        self._video_path_str = os.fspath(video_path)
         self.config = config
-        self.video_clip: Optional[VideoFileClip] = None
+        # The MoviePy clip (and its ffmpeg reader) is only opened on first use of
+        # `video_clip`; load_video fills in metadata from a single probe.
+        self._video_clip: Optional[VideoFileClip] = None
+        self._video_clip_open_lock = threading.Lock()
+        self.metadata: Optional[dict] = None
         self.duration: float = 0.0
         self.fps: float = 0.0
 
+        # PyAV state for keyframe-aligned seeks (lazily opened, guarded by a lock
+        # because OCR helpers may call in from worker threads).
+        self._av_container = None
+        self._av_start_seconds: float = 0.0
+        self._av_time_base: float = 0.0
+        self._av_lock = threading.Lock()
+        self._keyframe_times: Optional[List[float]] = None
+        # Byte offset of each keyframe packet, parallel to _keyframe_times.
+        self._keyframe_positions: List[Optional[int]] = []
+        self._torchcodec_decoder = None
+        self._torchcodec_start_seconds: float = 0.0
+        self._torchcodec_lock = threading.Lock()
+        # MoviePy readers on the full-game clip are not thread-safe.
+        self._video_clip_lock = threading.Lock()
+        # Set once a hardware-decoded ffmpeg run fails; later cuts decode in software.
+        self._hwaccel_failed = False
+
+    @property
+    def video_clip(self) -> Optional[VideoFileClip]:
+        """Full-game MoviePy clip, opened on first access after load_video."""
+        if self._video_clip is None and self.metadata is not None:
+            with self._video_clip_open_lock:
+                if self._video_clip is None:
+                    self._video_clip = self._open_video_clip()
+        return self._video_clip
+
+    @video_clip.setter
+    def video_clip(self, clip: Optional[VideoFileClip]) -> None:
+        self._video_clip = clip
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once load_video succeeded (or a clip was attached directly)."""
+        return self._video_clip is not None or self.metadata is not None
+
+    def _open_video_clip(self) -> VideoFileClip:
+        logger.debug("Opening MoviePy reader for %s", self.video_path)
+        try:
+            return VideoFileClip(self._video_path_str)
+        except Exception as exc:
+            # Some downloaded transport streams omit enough front-of-file metadata
+            # that MoviePy's fast probe path cannot infer duration/size. Falling
+            # back to a full decode probe is slower, but it keeps the pipeline
+            # working for otherwise decodable files.
+            logger.warning(
+                "Fast video probe failed for %s; retrying with full decode probe: %s",
+                self.video_path,
+                exc,
+            )
+            return VideoFileClip(self._video_path_str, decode_file=True)
+
+    def _probe_video_metadata(self) -> Optional[dict]:
+        """
+        Duration, fps, size, codec, frame count and time base of the first video
+        stream from one ffprobe call (PyAV when ffprobe is missing).
+
+        Returns None when the container does not report a usable duration or
+        frame rate; load_video then falls back to opening the MoviePy clip.
+        """
+        cmd = [
+            'ffprobe',
+            '-v',
+            'error',
+            '-select_streams',
+            'v:0',
+            '-show_entries',
+            'format=duration:stream=codec_name,width,height,avg_frame_rate,r_frame_rate,nb_frames,time_base,duration,start_time',
+            '-print_format',
+            'json',
+            self._video_path_str,
+        ]
+        try:
+            payload = json.loads(subprocess.check_output(cmd, text=True))
+            stream = (payload.get('streams') or [{}])[0]
+            # The container duration can include audio running past the last frame.
+            duration = stream.get('duration')
+            if duration in (None, 'N/A'):
+                duration = (payload.get('format') or {}).get('duration')
+            rates = [stream.get('avg_frame_rate'), stream.get('r_frame_rate')]
+            metadata = {
+                'duration': float(duration) if duration not in (None, 'N/A') else None,
+                'codec': stream.get('codec_name'),
+                'width': stream.get('width'),
+                'height': stream.get('height'),
+                'nb_frames': int(stream['nb_frames']) if str(stream.get('nb_frames') or '').isdigit() else None,
+                'time_base': stream.get('time_base'),
+                'start_time': float(stream['start_time']) if stream.get('start_time') not in (None, 'N/A') else 0.0,
+            }
+            metadata['fps'] = next(
+                (float(Fraction(rate)) for rate in rates if rate and rate != '0/0' and Fraction(rate) > 0),
+                None,
+            )
+        except FileNotFoundError:
+            if av is None:
+                return None
+            try:
+                with av.open(self._video_path_str) as container:
+                    stream = container.streams.video[0]
+                    rate = stream.average_rate or stream.base_rate
+                    if stream.duration and stream.time_base:
+                        duration = float(stream.duration * stream.time_base)
+                    else:
+                        duration = container.duration / av.time_base if container.duration else None
+                    metadata = {
+                        'duration': duration,
+                        'fps': float(rate) if rate else None,
+                        'codec': stream.codec_context.name,
+                        'width': stream.codec_context.width,
+                        'height': stream.codec_context.height,
+                        'nb_frames': stream.frames or None,
+                        'time_base': str(stream.time_base) if stream.time_base else None,
+                        'start_time': float(stream.start_time * stream.time_base) if stream.start_time else 0.0,
+                    }
+            except Exception as exc:
+                logger.debug("PyAV probe failed for %s: %s", self.video_path, exc)
+                return None
+        except Exception as exc:
+            logger.debug("ffprobe failed for %s: %s", self.video_path, exc)
+            return None
+        if not metadata.get('duration') or not metadata.get('fps'):
+            return None
+        return metadata
+
+    def _first_frame_decodes(self) -> bool:
+        """
+        Decode the first video frame to prove the file is readable, not just probeable.
+
+        Uses PyAV, else OpenCV; without either the MoviePy clip is opened now
+        (it reads the first frame itself) and kept.
+        """
+        if av is not None:
+            try:
+                with av.open(self._video_path_str) as container:
+                    for _frame in container.decode(video=0):
+                        return True
+            except Exception as exc:
+                logger.debug("First-frame decode failed for %s: %s", self.video_path, exc)
+            return False
+        if cv2 is not None:
+            cap = cv2.VideoCapture(self._video_path_str)
+            try:
+                ok, _frame = cap.read()
+                return bool(ok)
+            finally:
+                cap.release()
+        self._video_clip = self._open_video_clip()
+        return True
+
     def load_video(self) -> bool:
         """
         Load video file
 
+        Probes the container and decodes its first frame; the MoviePy reader
+        is opened lazily when a frame or subclip is first needed (see
+        `video_clip`).
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            logger.info(f"Loading video: {self.video_path}")
-            try:
-                self.video_clip = VideoFileClip(str(self.video_path))
-            except Exception as exc:
-                # Some downloaded transport streams omit enough front-of-file metadata
-                # that MoviePy's fast probe path cannot infer duration/size. Falling
-                # back to a full decode probe is slower, but it keeps the pipeline
-                # working for otherwise decodable files.
-                logger.warning(
-                    "Fast video probe failed for %s; retrying with full decode probe: %s",
-                    self.video_path,
-                    exc,
-                )
-                self.video_clip = VideoFileClip(str(self.video_path), decode_file=True)
-
-            self.duration = self.video_clip.duration
-            self.fps = self.video_clip.fps
-
-            logger.info(f"Video loaded: {self.duration:.1f}s @ {self.fps:.1f} FPS")
+            logger.info("Loading video: %s", self.video_path)
+            metadata = self._probe_video_metadata()
+            if metadata is None:
+                # No usable probe (e.g. a transport stream missing front-of-file
+                # metadata): let MoviePy work it out and keep its clip open.
+                clip = self._open_video_clip()
+                self._video_clip = clip
+                metadata = {'duration': clip.duration, 'fps': clip.fps, 'width': clip.w, 'height': clip.h}
+            elif not self._first_frame_decodes():
+                logger.error("Failed to load video: no decodable video frame in %s", self.video_path)
+                return False
+            self.metadata = metadata
+            self.duration = float(metadata['duration'])
+            self.fps = float(metadata['fps'])
+
+            logger.info("Video loaded: %.1fs @ %.1f FPS", self.duration, self.fps)
             return True
 
         except Exception as e:
             logger.error(f"Failed to load video: {e}")
             return False
 
-    def get_frame_at_time(self, time_seconds: float) -> Optional[np.ndarray]:
+    def keyframe_times(self) -> List[float]:
+        """
+        Return keyframe presentation times (seconds from video start).
+
+        The container is demuxed once (no decoding) and the result cached, with
+        PyAV or, without it, ffprobe's packet list. Returns an empty list when
+        neither works, in which case callers should keep their original sample
+        times.
+        """
+        if self._keyframe_times is not None:
+            return self._keyframe_times
+
+        index: List[Tuple[float, Optional[int]]] = []
+        if av is not None:
+            try:
+                with av.open(self._video_path_str) as container:
+                    stream = container.streams.video[0]
+                    time_base = float(stream.time_base)
+                    start = float(stream.start_time or 0) * time_base
+                    for packet in container.demux(stream):
+                        if packet.is_keyframe and packet.pts is not None:
+                            pos = packet.pos if packet.pos is not None and packet.pos >= 0 else None
+                            index.append((max(0.0, float(packet.pts) * time_base - start), pos))
+            except Exception as exc:
+                logger.warning("Keyframe probe failed for %s: %s", self.video_path, exc)
+                index = []
+        else:
+            index = self._probe_keyframes_with_ffprobe()
+
+        index.sort(key=lambda entry: entry[0])
+        times = [t for t, _pos in index]
+        self._keyframe_positions = [pos for _t, pos in index]
+        self._keyframe_times = times
+        if times:
+            logger.debug("Indexed %s keyframes in %s", len(times), self.video_path)
+        return times
+
+    def _probe_keyframes_with_ffprobe(self) -> List[Tuple[float, Optional[int]]]:
+        """(time, byte offset) of every keyframe packet, from ffprobe (demux only)."""
+        cmd = [
+            'ffprobe',
+            '-v',
+            'error',
+            '-select_streams',
+            'v:0',
+            '-show_entries',
+            'packet=pts_time,pos,flags',
+            '-of',
+            'csv=p=0',
+            self._video_path_str,
+        ]
+        try:
+            output = subprocess.check_output(cmd, text=True)
+        except (OSError, subprocess.CalledProcessError) as exc:
+            logger.warning("Keyframe probe failed for %s: %s", self.video_path, exc)
+            return []
+        start = float((self.metadata or {}).get('start_time') or 0.0)
+        index: List[Tuple[float, Optional[int]]] = []
+        for line in output.splitlines():
+            parts = line.strip().split(',')
+            if len(parts) < 3 or 'K' not in parts[2] or parts[0] in ('', 'N/A'):
+                continue
+            pos = int(parts[1]) if parts[1].isdigit() else None
+            index.append((max(0.0, float(parts[0]) - start), pos))
+        return index
+
+    def snap_to_keyframe(self, time_seconds: float) -> float:
+        """
+        Keyframe time at or before `time_seconds` (the time itself without an index).
+
+        Reading the frame there needs no forward decode after the seek, which is
+        all scoreboard OCR needs (a second either way does not matter).
+        """
+        keyframe = self._stream_copy_start(time_seconds)
+        return float(time_seconds) if keyframe is None else keyframe
+
+    def _open_av_container(self):
+        """Open (once) the PyAV container used for keyframe seeks."""
+        if self._av_container is None:
+            self._av_container = av.open(self._video_path_str)
+            stream = self._av_container.streams.video[0]
+            self._av_time_base = float(stream.time_base)
+            self._av_start_seconds = float(stream.start_time or 0) * self._av_time_base
+        return self._av_container
+
+    def _seek_av_keyframe(self, container, stream, time_seconds: float) -> None:
+        """
+        Seek so decoding resumes at the keyframe at or before `time_seconds`.
+
+        Once `keyframe_times()` has indexed the file, the seek targets that
+        keyframe directly: by byte offset on MPEG-TS, by its exact PTS otherwise.
+        Without the index this is a plain backward timestamp seek. MPEG-TS is
+        always indexed first: its timestamp seeks can land mid-GOP and decode
+        garbage until the next keyframe.
+        """
+        # MPEG-TS has no seek index, so timestamp seeks bisect the file;
+        # keyframe byte offsets let it jump straight to the GOP instead.
+        byte_seekable = 'mpegts' in str(container.format.name).split(',')
+        if byte_seekable and self._keyframe_times is None:
+            self.keyframe_times()
+        if self._keyframe_times:
+            idx = bisect.bisect_right(self._keyframe_times, float(time_seconds) + 1e-6) - 1
+            if idx >= 0:
+                pos = self._keyframe_positions[idx] if idx < len(self._keyframe_positions) else None
+                if byte_seekable and pos is not None:
+                    container.seek(pos, unsupported_byte_offset=True)
+                    return
+                time_seconds = self._keyframe_times[idx]
+        time_base = float(stream.time_base)
+        start = float(stream.start_time or 0) * time_base
+        pts = int(round((float(time_seconds) + start) / time_base))
+        container.seek(pts, stream=stream, any_frame=False, backward=True)
+
+    def _get_keyframe_at_time(self, time_seconds: float) -> Optional[np.ndarray]:
+        """Seek to the keyframe at/before `time_seconds` and decode only that frame."""
+        with self._av_lock:
+            container = self._open_av_container()
+            stream = container.streams.video[0]
+            self._seek_av_keyframe(container, stream, time_seconds)
+            for frame in container.decode(stream):
+                return frame.to_ndarray(format="rgb24")
+        return None
+
+    def _open_torchcodec_decoder(self):
+        """torchcodec decoder on the GPU when VIDEO_HWACCEL resolves to CUDA, else on the CPU."""
+        kwargs = {"dimension_order": "NHWC", "seek_mode": "approximate"}
+        if self.hwaccel() == 'cuda':
+            try:
+                return TorchCodecDecoder(self._video_path_str, device="cuda", **kwargs)
+            except Exception as e:
+                logger.debug("torchcodec CUDA decoder unavailable, using CPU: %s", e)
+        return TorchCodecDecoder(self._video_path_str, **kwargs)
+
+    def _torchcodec_frame_at_time(self, time_seconds: float) -> Optional[np.ndarray]:
+        """Frame shown at `time_seconds` from a persistent torchcodec decoder (HWC RGB)."""
+        with self._torchcodec_lock:
+            if self._torchcodec_decoder is None:
+                self._torchcodec_decoder = self._open_torchcodec_decoder()
+                begin = getattr(self._torchcodec_decoder.metadata, 'begin_stream_seconds', None)
+                self._torchcodec_start_seconds = float(begin or 0.0)
+            frame = self._torchcodec_decoder.get_frame_played_at(float(time_seconds) + self._torchcodec_start_seconds)
+            return frame.data.cpu().numpy()
+
+    def _decode_frame_at_time(self, time_seconds: float) -> Optional[np.ndarray]:
+        """
+        Decode the frame shown at `time_seconds` with PyAV.
+
+        Seeks to the keyframe at/before the target and decodes forward in-process,
+        instead of MoviePy restarting or fast-forwarding its ffmpeg pipe reader.
+        """
+        with self._av_lock:
+            container = self._open_av_container()
+            stream = container.streams.video[0]
+            time_base = self._av_time_base
+            self._seek_av_keyframe(container, stream, time_seconds)
+            threshold = float(time_seconds) - 0.5 / float(self.fps or 30.0)
+            for frame in container.decode(stream):
+                if frame.pts is None:
+                    continue
+                if float(frame.pts) * time_base - self._av_start_seconds >= threshold:
+                    return frame.to_ndarray(format="rgb24")
+        return None
+
+    def iter_frames_at_times(
+        self,
+        times: Iterable[float],
+        *,
+        keyframe_aligned: bool = False,
+        reuse_buffers: bool = False,
+        min_pool_size: int = 0,
+    ) -> Iterator[Tuple[float, Optional[np.ndarray]]]:
+        """
+        Yield (time, frame) for ascending `times` from one forward pass over the video.
+
+        Frames are decoded in order and the decoder only seeks (forward) when a
+        keyframe lies between its current position and the next target, so no
+        sample ever seeks backwards or re-decodes a GOP. With `keyframe_aligned`
+        non-keyframes are skipped by the decoder entirely. Without PyAV an
+        OpenCV grab/retrieve pass does the same job (see `_iter_frames_with_cv2`);
+        falls back to `get_frame_at_time` per time if neither works.
+
+        Args:
+            times: Sample times in seconds, ascending
+            keyframe_aligned: Times are keyframe PTS from `keyframe_times()`
+            reuse_buffers: Decode into a pool of VIDEO_FRAME_POOL_SIZE preallocated
+                buffers instead of a new array per frame. A yielded frame is then
+                only valid until the generator has advanced that many more times.
+            min_pool_size: Lower bound on that buffer count, for callers that
+                queue frames ahead of use
+
+        Yields:
+            (time, frame) with the frame as RGB numpy array or None if failed
+        """
+        times = [float(t) for t in times]
+        done = 0
+        pool = None
+        if reuse_buffers:
+            pool_size = int(getattr(self.config, 'VIDEO_FRAME_POOL_SIZE', 2) or 0)
+            pool = _FramePool(max(pool_size, min_pool_size)) if pool_size > 0 else None
+        if av is not None and self.is_loaded:
+            try:
+                keyframes = self.keyframe_times()
+                with av.open(self._video_path_str) as container:
+                    stream = container.streams.video[0]
+                    if keyframe_aligned:
+                        stream.codec_context.skip_frame = "NONKEY"
+                    time_base = float(stream.time_base)
+                    start = float(stream.start_time or 0) * time_base
+                    half_frame = 0.5 / float(self.fps or 30.0)
+
+                    frames = None
+                    position = None  # time of the last decoded frame
+                    last_frame = None
+                    for t in times:
+                        target = max(0.0, min(t, self.duration))
+                        if frames is None or (
+                            target > position
+                            and (
+                                bisect.bisect_right(keyframes, target) > bisect.bisect_right(keyframes, position)
+                                if keyframes
+                                else target - position > 2.0
+                            )
+                        ):
+                            self._seek_av_keyframe(container, stream, target)
+                            frames = container.decode(stream)
+                            last_frame = None
+
+                        if last_frame is None or position < target - half_frame:
+                            last_frame = None
+                            for frame in frames:
+                                if frame.pts is None:
+                                    continue
+                                position = float(frame.pts) * time_base - start
+                                if position >= target - half_frame:
+                                    last_frame = _av_frame_to_rgb(frame, pool)
+                                    break
+
+                        if last_frame is None:
+                            # Past the last decodable frame; let MoviePy clamp it.
+                            yield t, self.get_frame_at_time(t)
+                        else:
+                            yield t, last_frame
+                        done += 1
+            except Exception as exc:
+                logger.warning("Sequential decode failed after %s frames, seeking per frame: %s", done, exc)
+
+        if done < len(times) and cv2 is not None and self.is_loaded:
+            try:
+                for t, frame in self._iter_frames_with_cv2(times[done:], pool=pool):
+                    yield t, frame if frame is not None else self.get_frame_at_time(t)
+                    done += 1
+            except Exception as exc:
+                logger.warning("OpenCV sampling failed after %s frames, seeking per frame: %s", done, exc)
+
+        for t in times[done:]:
+            if keyframe_aligned:
+                yield t, self.get_frame_at_time(t, keyframe_aligned=True)
+            else:
+                yield t, self.get_frame_at_time(t)
+
+    def _iter_frames_with_cv2(
+        self,
+        times: List[float],
+        *,
+        pool: Optional[_FramePool] = None,
+    ) -> Iterator[Tuple[float, Optional[np.ndarray]]]:
+        """
+        Yield (time, frame) for ascending `times` with OpenCV's grab/retrieve.
+
+        `grab()` advances past unwanted frames without converting them to RGB and
+        `retrieve()` runs only on sampled frames. Gaps longer than a few seconds
+        are jumped with a frame-index seek instead of grabbing through them.
+        Frames that cannot be read are yielded as None. With a `pool`, frames
+        are converted into its buffers instead of new arrays.
+        """
+        cap = cv2.VideoCapture(self._video_path_str)
+        if not cap.isOpened():
+            raise RuntimeError(f"OpenCV could not open {self.video_path}")
+        try:
+            fps = float(self.fps or cap.get(cv2.CAP_PROP_FPS) or 30.0)
+            max_grab = max(1, int(fps * 4))
+            position = -1  # index of the last grabbed frame
+            bgr_shape = None
+            for t in times:
+                # First frame within half a frame of `t`, as in the PyAV pass.
+                target = max(0, math.ceil(fps * max(0.0, min(t, self.duration)) - 0.5 - 1e-6))
+                if target < position or target - position > max_grab:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                    position = target - 1
+                while position < target and cap.grab():
+                    position += 1
+                frame = None
+                if position == target:
+                    ok, bgr = cap.retrieve(pool.staging(bgr_shape) if pool is not None and bgr_shape else None)
+                    if ok and bgr is not None:
+                        bgr_shape = bgr.shape
+                        dst = pool.take(bgr.shape) if pool is not None else None
+                        frame = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=dst)
+                yield t, frame
+        finally:
+            cap.release()
+
+    def sample_frames(self, times: Iterable[float]) -> List[Optional[np.ndarray]]:
+        """
+        Frames (RGB or None) for `times`, in the order given.
+
+        Times are decoded in one ascending pass via `iter_frames_at_times`;
+        repeated times share a frame.
+        """
+        times = [float(t) for t in times]
+        frames = dict(self.iter_frames_at_times(sorted(set(times))))
+        return [frames.get(t) for t in times]
+
+    def get_frame_at_time(self, time_seconds: float, *, keyframe_aligned: bool = False) -> Optional[np.ndarray]:
         """
         Extract a single frame at specified time
 
+        Uses a torchcodec decoder when installed (VIDEO_TORCHCODEC_FRAME_ACCESS),
+        then PyAV seeks (VIDEO_PYAV_FRAME_ACCESS), else MoviePy.
+
         Args:
             time_seconds: Time in seconds
+            keyframe_aligned: `time_seconds` is a keyframe PTS from `keyframe_times()`;
+                seek directly to it and skip the forward decode (requires PyAV)
 
         Returns:
             Frame as numpy array (RGB) or None if failed
         """
-        if self.video_clip is None:
+        if not self.is_loaded:
             logger.error("No video loaded")
             return None
 
         try:
             # Ensure time is within bounds
             time_seconds = max(0, min(time_seconds, self.duration))
+            if (
+                TorchCodecDecoder is not None
+                and not keyframe_aligned
+                and getattr(self.config, 'VIDEO_TORCHCODEC_FRAME_ACCESS', True)
+            ):
+                try:
+                    return self._torchcodec_frame_at_time(time_seconds)
+                except Exception as exc:
+                    logger.debug("torchcodec seek failed at %.3fs, trying PyAV: %s", time_seconds, exc)
+            if av is not None and (keyframe_aligned or getattr(self.config, 'VIDEO_PYAV_FRAME_ACCESS', True)):
+                try:
+                    if keyframe_aligned:
+                        frame = self._get_keyframe_at_time(time_seconds)
+                    else:
+                        frame = self._decode_frame_at_time(time_seconds)
+                    if frame is not None:
+                        return frame
+                except Exception as exc:
+                    logger.debug("PyAV seek failed at %.3fs, using MoviePy: %s", time_seconds, exc)
             frame = self.video_clip.get_frame(time_seconds)
             return frame
 
@@ -142,6 +808,18 @@ class VideoProcessor:
             logger.error(f"Failed to get frame at {time_seconds}s: {e}")
             return None
 
+    def get_frame_at_frame(self, frame_index: int) -> Optional[np.ndarray]:
+        """
+        Extract frame number `frame_index` (0-based, at the video's nominal fps).
+
+        Same seek path as `get_frame_at_time`; with the keyframe index built it
+        lands on the enclosing keyframe directly and decodes forward from there.
+        """
+        if not self.fps:
+            logger.error("No video loaded")
+            return None
+        return self.get_frame_at_time(max(0, int(frame_index)) / float(self.fps))
+
     def create_clip(
         self,
         start_time: float,
@@ -167,7 +845,7 @@ class VideoProcessor:
         Returns:
             VideoFileClip object or None if failed
         """
-        if self.video_clip is None:
+        if not self.is_loaded:
             logger.error("No video loaded")
             return None
 
@@ -177,23 +855,31 @@ class VideoProcessor:
             end_time = max(start_time, min(end_time, self.duration))
             apply_overlay = bool(overlay_config) and getattr(self.config, 'OVERLAY_ENABLED', True)
 
-            logger.debug(f"Creating clip: {start_time:.1f}s - {end_time:.1f}s")
+            logger.debug("Creating clip: %.1fs - %.1fs", start_time, end_time)
 
             # Fast path: when no overlay is needed, cut directly from the source video with ffmpeg.
             if output_path and not apply_overlay:
                 self._write_source_segment(start_time, end_time, output_path)
                 return _WrittenClipHandle()
 
-            # Create subclip
-            clip = self.video_clip.subclipped(start_time, end_time)
+            # Overlay clips render from a short stream-copied cut of the source
+            # rather than from the shared full-game clip.
+            if output_path and self._write_overlay_clip_from_segment(
+                start_time, end_time, output_path, overlay_config
+            ):
+                return _WrittenClipHandle()
 
-            # Add overlay if configured
-            if apply_overlay:
-                clip = self._add_overlay(clip, overlay_config)
+            with self._video_clip_lock:
+                # Create subclip
+                clip = self.video_clip.subclipped(start_time, end_time)
+
+                # Add overlay if configured
+                if apply_overlay:
+                    clip = self._add_overlay(clip, overlay_config)
 
-            # Save if output path provided
-            if output_path:
-                self._write_video(clip, output_path)
+                # Save if output path provided
+                if output_path:
+                    self._write_video(clip, output_path)
 
             return clip
 
@@ -203,9 +889,82 @@ class VideoProcessor:
 
     def _write_source_segment(self, start_time: float, end_time: float, output_path: Path) -> None:
         """Cut and encode a source segment directly with ffmpeg."""
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_source_segments([(start_time, end_time, output_path)])
+
+    def _stream_copy_start(self, start_time: float) -> Optional[float]:
+        """Keyframe at or before `start_time`, or None without a keyframe index."""
+        keyframes = self.keyframe_times()
+        if keyframes:
+            idx = bisect.bisect_right(keyframes, float(start_time)) - 1
+            if idx >= 0:
+                return keyframes[idx]
+        return None
 
+    def hwaccel(self) -> Optional[str]:
+        """
+        ffmpeg hardware decode method to use (`-hwaccel`), or None for software.
+
+        VIDEO_HWACCEL names a method ('cuda', 'vaapi', 'videotoolbox', ...) or
+        'auto' for the first available one; methods this ffmpeg build does not
+        list are ignored, as is everything once a hardware run has failed.
+        """
+        setting = getattr(self.config, 'VIDEO_HWACCEL', None)
+        if not setting or self._hwaccel_failed:
+            return None
+        available = _ffmpeg_hwaccels()
+        if str(setting).lower() == 'auto':
+            return next((name for name in _PREFERRED_HWACCELS if name in available), None)
+        if setting not in available:
+            logger.debug("ffmpeg does not list hwaccel %r; decoding in software", setting)
+            return None
+        return str(setting)
+
+    def _segment_input_args(
+        self,
+        start_time: float,
+        end_time: float,
+        stream_copy: bool,
+        hwaccel: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Input options that open the source at one segment.
+
+        Stream copy can only start on a keyframe, so in that mode the start is
+        moved back to the keyframe at or before `start_time` (when the keyframe
+        index is available) and the clip runs slightly long instead of opening
+        on undecodable frames. Re-encoded segments are decoded with `hwaccel`
+        when given.
+        """
+        args: List[str] = []
+        if stream_copy:
+            keyframe = self._stream_copy_start(start_time)
+            if keyframe is not None:
+                start_time = keyframe
+        elif hwaccel:
+            args += ['-hwaccel', hwaccel]
         duration = max(0.05, float(end_time) - float(start_time))
+        return args + [
+            '-ss',
+            f'{float(start_time):.3f}',
+            '-t',
+            f'{duration:.3f}',
+            '-i',
+            self._video_path_str,
+        ]
+
+    def _keyframe_args(self, fps: float) -> List[str]:
+        """Fixed GOP of OUTPUT_KEYFRAME_SECONDS at `fps` (none when unset or fps unknown)."""
+        seconds = getattr(self.config, 'OUTPUT_KEYFRAME_SECONDS', None)
+        if not seconds or not fps:
+            return []
+        gop = str(max(1, int(round(float(fps) * float(seconds)))))
+        return ['-g', gop, '-keyint_min', gop]
+
+    def _segment_codec_args(self, stream_copy: bool) -> List[str]:
+        """Output codec options shared by every cut of the source."""
+        if stream_copy:
+            return ['-c', 'copy']
+
         codec = getattr(self.config, 'OUTPUT_CODEC', 'libx264')
         preset = getattr(self.config, 'OUTPUT_PRESET', 'medium')
         audio_codec = getattr(self.config, 'OUTPUT_AUDIO_CODEC', 'aac')
@@ -215,50 +974,187 @@ class VideoProcessor:
         threads = getattr(self.config, 'OUTPUT_THREADS', None)
         crf = getattr(self.config, 'OUTPUT_CRF', None)
 
-        cmd = [
-            'ffmpeg',
-            '-y',
-            '-ss',
-            f'{float(start_time):.3f}',
-            '-t',
-            f'{duration:.3f}',
-            '-i',
-            str(self.video_path),
-            '-map',
-            '0:v:0',
-            '-map',
-            '0:a?',
+        args = [
             '-c:v',
             str(codec),
             '-preset',
             str(preset),
         ]
         if crf is not None and str(codec).lower() in {'libx264', 'libx265'}:
-            cmd += ['-crf', str(crf)]
+            args += ['-crf', str(crf)]
+        args += self._keyframe_args(self.fps)
         if audio_codec:
-            cmd += ['-c:a', str(audio_codec)]
+            args += ['-c:a', str(audio_codec)]
         if audio_bitrate:
-            cmd += ['-b:a', str(audio_bitrate)]
+            args += ['-b:a', str(audio_bitrate)]
         if audio_fps:
-            cmd += ['-ar', str(audio_fps)]
+            args += ['-ar', str(audio_fps)]
         if pixel_format:
-            cmd += ['-pix_fmt', str(pixel_format)]
+            args += ['-pix_fmt', str(pixel_format)]
         if threads:
-            cmd += ['-threads', str(threads)]
-        cmd += [
-            '-movflags',
-            '+faststart',
-            '-avoid_negative_ts',
-            'make_zero',
-            str(output_path),
-        ]
+            args += ['-threads', str(threads)]
+        return args
+
+    def _write_source_segments(
+        self,
+        segments: List[Tuple[float, float, Path]],
+        *,
+        stream_copy: Optional[bool] = None,
+    ) -> None:
+        """
+        Cut several source segments with a single ffmpeg process.
+
+        Each segment is its own input (`-ss`/`-t` before `-i`, so ffmpeg seeks
+        instead of decoding from the start of the game) mapped to its own
+        output, which saves a process start and container probe per clip.
+        Overlay-free clips are stream-copied instead of encoded when
+        CLIP_STREAM_COPY is set (or `stream_copy` forces either mode).
+
+        Re-encoded cuts decode on the GPU when VIDEO_HWACCEL selects a method;
+        if that run fails (no device, unsupported profile) the cut is redone in
+        software and hardware decode stays off for this processor.
+        """
+        if stream_copy is None:
+            stream_copy = bool(getattr(self.config, 'CLIP_STREAM_COPY', False))
+        hwaccel = None if stream_copy else self.hwaccel()
+        if hwaccel:
+            try:
+                self._run_source_segments(segments, stream_copy, hwaccel)
+                return
+            except RuntimeError as e:
+                self._hwaccel_failed = True
+                logger.warning(f"Hardware decode ({hwaccel}) failed, falling back to software: {e}")
+        self._run_source_segments(segments, stream_copy, None)
+
+    def _run_source_segments(
+        self,
+        segments: List[Tuple[float, float, Path]],
+        stream_copy: bool,
+        hwaccel: Optional[str],
+    ) -> None:
+        """Build and run the ffmpeg command for `_write_source_segments`."""
+        codec_args = self._segment_codec_args(stream_copy)
+
+        cmd = ['ffmpeg', '-y']
+        for start_time, end_time, _output_path in segments:
+            cmd += self._segment_input_args(start_time, end_time, stream_copy, hwaccel)
+        for idx, (_start_time, _end_time, output_path) in enumerate(segments):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            cmd += [
+                '-map',
+                f'{idx}:v:0',
+                '-map',
+                f'{idx}:a?',
+                *codec_args,
+                '-movflags',
+                _CLIP_MOVFLAGS,
+                '-avoid_negative_ts',
+                'make_zero',
+                str(output_path),
+            ]
 
         try:
             subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.debug(f"Source segment written to {output_path}")
+            for _start_time, _end_time, output_path in segments:
+                logger.debug("Source segment written to %s", output_path)
         except subprocess.CalledProcessError as exc:
             stderr = (exc.stderr or '').strip()
-            raise RuntimeError(stderr or f"ffmpeg failed for {output_path}") from exc
+            target = segments[0][2] if len(segments) == 1 else f"{len(segments)} segments"
+            raise RuntimeError(stderr or f"ffmpeg failed for {target}") from exc
+
+    def _write_source_batch(self, segments: List[Tuple[float, float, Path]]) -> List[Optional[Exception]]:
+        """
+        Write a batch of segments, returning one error (or None) per segment.
+
+        If the batched ffmpeg run fails, the segments are retried one at a time
+        so a single bad cut does not take the rest of the batch down with it.
+        """
+        try:
+            self._write_source_segments(segments)
+            return [None] * len(segments)
+        except Exception as batch_error:
+            if len(segments) == 1:
+                return [batch_error]
+            logger.debug("Batched clip cut failed, retrying clips individually: %s", batch_error)
+
+        errors: List[Optional[Exception]] = []
+        for segment in segments:
+            try:
+                self._write_source_segments([segment])
+                errors.append(None)
+            except Exception as e:
+                errors.append(e)
+        return errors
+
+    def _write_overlay_clip_from_segment(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        overlay_config: dict,
+    ) -> bool:
+        """
+        Render an overlay clip from a temporary stream-copied cut of the source.
+
+        ffmpeg seeks the source (`-ss` before `-i`) and copies packets from the
+        keyframe at or before `start_time`, so MoviePy only decodes a few seconds
+        of video instead of sharing the full-game reader. The overlay clip is
+        trimmed to the exact requested window inside that cut.
+
+        Returns False (nothing written) when the cut cannot be made, e.g. without
+        a keyframe index; the caller then renders from the full-game clip.
+        """
+        segment_start = self._stream_copy_start(start_time)
+        if segment_start is None:
+            return False
+
+        segment_path = output_path.with_name(f".{output_path.stem}.source{output_path.suffix}")
+        try:
+            self._write_source_segments([(segment_start, end_time, segment_path)], stream_copy=True)
+        except Exception as e:
+            logger.debug("Source cut for overlay clip failed, using the full video: %s", e)
+            segment_path.unlink(missing_ok=True)
+            return False
+
+        try:
+            with VideoFileClip(str(segment_path)) as source:
+                offset = max(0.0, float(start_time) - segment_start)
+                clip = source.subclipped(offset, min(source.duration, offset + float(end_time) - float(start_time)))
+                clip = self._add_overlay(clip, overlay_config)
+                self._write_video(clip, output_path)
+                clip.close()
+        finally:
+            segment_path.unlink(missing_ok=True)
+        return True
+
+    def _render_overlay_clip(
+        self,
+        start_time: float,
+        end_time: float,
+        output_path: Path,
+        overlay_config: dict,
+    ) -> List[Optional[Exception]]:
+        """Pool job for one overlay clip; same result shape as `_write_source_batch`."""
+        clip = self.create_clip(start_time, end_time, output_path, overlay_config)
+        if not clip:
+            return [RuntimeError(f"No clip written to {output_path}")]
+        clip.close()
+        return [None]
+
+    def clip_worker_count(self) -> int:
+        """
+        Number of clips to render at once.
+
+        CLIP_EXTRACT_WORKERS (default min(4, CPU count)), reduced when
+        OUTPUT_THREADS is set so workers x encoder threads stays within the CPU
+        count.
+        """
+        cpu_count = os.cpu_count() or 1
+        workers = int(getattr(self.config, 'CLIP_EXTRACT_WORKERS', None) or min(4, cpu_count))
+        threads = getattr(self.config, 'OUTPUT_THREADS', None)
+        if threads:
+            workers = min(workers, cpu_count // max(1, int(threads)))
+        return max(1, workers)
 
     def _probe_stream_metadata(self, clip_path: Path) -> dict:
         """Return basic ffprobe metadata for a clip."""
@@ -267,13 +1163,18 @@ class VideoProcessor:
             '-v',
             'error',
             '-show_entries',
-            'stream=codec_type,width,height,r_frame_rate,pix_fmt',
+            'stream=codec_type,codec_name,width,height,r_frame_rate,pix_fmt,sample_rate,channels,duration',
             '-of',
             'json',
             str(clip_path),
         ]
         try:
             payload = json.loads(subprocess.check_output(cmd, text=True))
+        except FileNotFoundError:
+            # No ffprobe binary next to ffmpeg (e.g. imageio-ffmpeg installs).
+            if av is None:
+                raise
+            payload = {'streams': self._probe_streams_with_av(clip_path)}
         except subprocess.CalledProcessError as exc:
             raise RuntimeError(f"ffprobe failed for {clip_path}") from exc
         streams = payload.get('streams') or []
@@ -284,8 +1185,127 @@ class VideoProcessor:
             for idx, stream in enumerate(streams)
         }
 
+    @staticmethod
+    def _probe_streams_with_av(clip_path: Path) -> List[dict]:
+        """The ffprobe stream fields `_probe_stream_metadata` asks for, read with PyAV."""
+        streams = []
+        try:
+            with av.open(str(clip_path)) as container:
+                for stream in container.streams:
+                    ctx = stream.codec_context
+                    entry = {'codec_type': stream.type, 'codec_name': ctx.name}
+                    if stream.duration is not None and stream.time_base is not None:
+                        entry['duration'] = str(float(stream.duration * stream.time_base))
+                    if stream.type == 'video':
+                        rate = stream.base_rate
+                        entry.update(
+                            width=ctx.width,
+                            height=ctx.height,
+                            r_frame_rate=f'{rate.numerator}/{rate.denominator}' if rate else None,
+                            pix_fmt=ctx.pix_fmt,
+                        )
+                    elif stream.type == 'audio':
+                        entry.update(sample_rate=str(ctx.sample_rate), channels=ctx.channels)
+                    streams.append(entry)
+        except Exception as exc:
+            raise RuntimeError(f"Probe failed for {clip_path}") from exc
+        return streams
+
+    @staticmethod
+    def _concat_signature(streams: dict) -> tuple:
+        """Stream parameters that must match for the concat demuxer to copy packets."""
+        video = streams.get('video') or {}
+        audio = streams.get('audio') or {}
+        return (
+            video.get('codec_name'),
+            video.get('width'),
+            video.get('height'),
+            video.get('r_frame_rate'),
+            video.get('pix_fmt'),
+            audio.get('codec_name'),
+            audio.get('sample_rate'),
+            audio.get('channels'),
+        )
+
+    @staticmethod
+    def _reel_seconds(clip_streams: List[dict]) -> float:
+        """Expected reel length from probed clip durations (0.0 when unknown)."""
+        total = 0.0
+        for streams in clip_streams:
+            try:
+                total += float((streams.get('video') or {}).get('duration') or 0.0)
+            except (TypeError, ValueError):
+                pass
+        return total
+
+    @staticmethod
+    def _run_ffmpeg_with_progress(cmd: List[str], total_seconds: float, desc: str) -> None:
+        """
+        Run ffmpeg with a tqdm bar fed by its `-progress` key=value stream.
+
+        stderr goes to a temp file (not a pipe nobody drains while stdout is
+        read); failures raise CalledProcessError like `subprocess.run(check=True)`.
+        """
+        cmd = cmd[:1] + ['-nostats', '-progress', 'pipe:1'] + cmd[1:]
+        total = float(total_seconds or 0.0) or None
+        with tempfile.TemporaryFile(mode='w+', encoding='utf-8', errors='replace') as stderr_file, tqdm(
+            total=total,
+            desc=desc,
+            unit='s',
+            ncols=100,
+        ) as progress_bar:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+            done = 0.0
+            for line in process.stdout:
+                key, _, value = line.strip().partition('=')
+                # out_time_us (and the misnamed out_time_ms) are microseconds.
+                if key == 'out_time_us' and value.isdigit():
+                    seconds = int(value) / 1_000_000
+                    # Output timestamps can run slightly past the probed durations.
+                    if total is not None:
+                        seconds = min(seconds, total)
+                    if seconds > done:
+                        progress_bar.update(round(seconds - done, 3))
+                        done = seconds
+            returncode = process.wait()
+            if returncode:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr_file.read())
+
+    def _write_concat_reel_copy(self, clip_paths: List[Path], temp_output: Path, total_seconds: float = 0.0) -> None:
+        """Join clips with the ffmpeg concat demuxer, copying packets (no re-encode)."""
+        list_path = temp_output.with_suffix('.txt')
+        lines = []
+        for clip_path in clip_paths:
+            escaped = str(Path(clip_path).resolve()).replace("'", "'\\''")
+            lines.append(f"file '{escaped}'\n")
+        list_path.write_text(''.join(lines), encoding='utf-8')
+        cmd = [
+            'ffmpeg', '-hide_banner', '-y',
+            '-f', 'concat', '-safe', '0', '-i', str(list_path),
+            '-c', 'copy',
+            '-movflags', '+faststart',
+            str(temp_output),
+        ]
+        try:
+            self._run_ffmpeg_with_progress(cmd, total_seconds, "Joining Reel")
+        except subprocess.CalledProcessError as exc:
+            stderr = (exc.stderr or '').strip()
+            temp_output.unlink(missing_ok=True)
+            raise RuntimeError(stderr or f"ffmpeg concat copy failed for {temp_output}") from exc
+        finally:
+            list_path.unlink(missing_ok=True)
+
     def _write_concat_reel_ffmpeg(self, clip_paths: List[Path], output_path: Path) -> None:
-        """Stitch clips with a single ffmpeg concat filter and one final encode."""
+        """
+        Stitch clips into one reel with ffmpeg.
+
+        Clips cut with identical encoder settings (the normal case) are joined by
+        the concat demuxer with stream copy; otherwise a single concat filter
+        normalizes and re-encodes them (the demuxer cannot mix resolutions or
+        frame rates). Either way one ffmpeg process does the work and reports
+        progress through `-progress`.
+        """
         if not clip_paths:
             raise RuntimeError("No clips provided for concat reel")
 
@@ -294,7 +1314,21 @@ class VideoProcessor:
         if temp_output.exists():
             temp_output.unlink()
 
-        first_streams = self._probe_stream_metadata(clip_paths[0])
+        clip_streams = [self._probe_stream_metadata(clip_path) for clip_path in clip_paths]
+        for clip_path, streams in zip(clip_paths, clip_streams):
+            if 'audio' not in streams:
+                raise RuntimeError(f"Clip is missing audio stream: {clip_path}")
+        total_seconds = self._reel_seconds(clip_streams)
+
+        if len({self._concat_signature(streams) for streams in clip_streams}) == 1:
+            try:
+                self._write_concat_reel_copy(clip_paths, temp_output, total_seconds)
+                temp_output.replace(output_path)
+                return
+            except Exception as exc:
+                logger.warning("Stream-copy concat failed for %s; re-encoding: %s", output_path, exc)
+
+        first_streams = clip_streams[0]
         video_stream = first_streams.get('video') or {}
         width = int(video_stream.get('width') or 1920)
         height = int(video_stream.get('height') or 1080)
@@ -315,9 +1349,6 @@ class VideoProcessor:
 
         for idx, clip_path in enumerate(clip_paths):
             cmd += ['-i', str(clip_path)]
-            streams = self._probe_stream_metadata(clip_path)
-            if 'audio' not in streams:
-                raise RuntimeError(f"Clip is missing audio stream: {clip_path}")
             filter_parts.append(
                 f'[{idx}:v:0]'
                 f'scale={width}:{height}:force_original_aspect_ratio=decrease,'
@@ -370,7 +1401,7 @@ class VideoProcessor:
         ]
 
         try:
-            subprocess.run(cmd, check=True, capture_output=True, text=True)
+            self._run_ffmpeg_with_progress(cmd, total_seconds, "Encoding Reel")
         except subprocess.CalledProcessError as exc:
             stderr = (exc.stderr or '').strip()
             if temp_output.exists():
@@ -442,7 +1473,7 @@ class VideoProcessor:
             # Composite overlay onto clip
             result = CompositeVideoClip([clip, txt_clip])
 
-            logger.debug(f"Added overlay: '{display_text}'")
+            logger.debug("Added overlay: '%s'", display_text)
             return result
 
         except Exception as e:
@@ -500,7 +1531,8 @@ class VideoProcessor:
         events: List[dict],
         clips_dir: Path,
         before_seconds: float = 8.0,
-        after_seconds: float = 6.0
+        after_seconds: float = 6.0,
+        executor: Optional[ThreadPoolExecutor] = None,
     ) -> List[Tuple[dict, Path]]:
         """
         Create highlight clips for each event
@@ -510,68 +1542,141 @@ class VideoProcessor:
             clips_dir: Directory to save clips
             before_seconds: Seconds to include before event
             after_seconds: Seconds to include after event
+            executor: Shared thread pool for ffmpeg cuts (default: a private
+                pool of CLIP_EXTRACT_WORKERS threads)
 
         Returns:
-            List of tuples (event, clip_path)
+            List of tuples (event, clip_path); events whose windows were merged
+            (see CLIP_MERGE_GAP) share one clip_path
         """
-        if self.video_clip is None:
+        if not self.is_loaded:
             logger.error("No video loaded")
             return []
 
-        created_clips = []
+        # Results by event index so the returned list keeps event order even
+        # though ffmpeg cuts finish out of order.
+        created_by_index = {}
+        overlay_enabled = getattr(self.config, 'OVERLAY_ENABLED', True)
+        workers = self.clip_worker_count()
 
         # Create progress bar for clip creation
+        # Redraws are throttled to twice a second and carry no per-clip postfix;
+        # failures and skips are logged instead.
         progress_bar = tqdm(
-            events,
+            total=len(events),
             desc="Creating Clips",
             unit="clip",
-            ncols=100
+            ncols=100,
+            mininterval=0.5,
+            miniters=1,
         )
 
-        for i, event in enumerate(progress_bar, 1):
-            try:
-                video_time = event.get('video_time')
-                if video_time is None:
-                    logger.warning(f"Event {i} missing video_time")
-                    progress_bar.set_postfix({'status': 'skipped'})
-                    continue
-
-                event_before = float(event.get('before_seconds', before_seconds))
-                event_after = float(event.get('after_seconds', after_seconds))
-
-                # Calculate clip boundaries
-                start_time = max(0, video_time - event_before)
-                end_time = min(self.duration, video_time + event_after)
-
-                clip_filename = _event_clip_filename(event, index=i)
-                clip_path = clips_dir / clip_filename
+        # Work out every clip's boundaries first (one NumPy pass) so overlay-free
+        # cuts can be handed to ffmpeg in batches before any overlay rendering starts.
+        timed = []
+        for i, event in enumerate(events, 1):
+            if event.get('video_time') is None:
+                logger.warning(f"Event {i} missing video_time")
+                progress_bar.update(1)
+            else:
+                timed.append((i, event))
+        compute_bounds = _compute_bounds
+        if _compute_bounds_jit is not None and len(timed) > _JIT_BOUNDS_MIN_EVENTS:
+            compute_bounds = _compute_bounds_jit
+        starts, ends = compute_bounds(
+            np.fromiter((float(event['video_time']) for _i, event in timed), dtype=np.float64, count=len(timed)),
+            float(self.duration),
+            np.fromiter(
+                (float(event.get('before_seconds', before_seconds)) for _i, event in timed),
+                dtype=np.float64,
+                count=len(timed),
+            ),
+            np.fromiter(
+                (float(event.get('after_seconds', after_seconds)) for _i, event in timed),
+                dtype=np.float64,
+                count=len(timed),
+            ),
+        )
 
-                # Update progress bar with current clip info
-                progress_bar.set_postfix({'clip': clip_filename[:30]})
+        source_cuts = []
+        overlay_cuts = []
+        for (i, event), start_time, end_time in zip(timed, starts.tolist(), ends.tolist()):
+            try:
+                clip_filename = _event_clip_filename(event, index=i)
+                clip_path = clips_dir / clip_filename
 
                 # Build overlay configuration from event data
                 overlay_config = self._build_overlay_config(event)
 
-                # Create and save clip
-                logger.debug(f"Creating clip {i}/{len(events)}: {clip_filename}")
-
-                clip = self.create_clip(start_time, end_time, clip_path, overlay_config)
-
-                if clip:
-                    created_clips.append((event, clip_path))
-                    # Close clip to free memory
-                    clip.close()
-                    progress_bar.set_postfix({'status': 'done'})
-
+                if overlay_config and overlay_enabled:
+                    overlay_cuts.append((i, event, start_time, end_time, clip_path, overlay_config))
+                else:
+                    source_cuts.append((i, event, start_time, end_time, clip_path))
             except Exception as e:
                 logger.error(f"Failed to create clip {i}: {e}")
-                progress_bar.set_postfix({'status': 'error'})
-                continue
+                progress_bar.update(1)
+
+        # Overlay-free windows that overlap (or nearly touch) are cut once; the
+        # clip is named after the earliest event and shared by every event in it.
+        source_cuts = _merge_cut_windows(source_cuts, getattr(self.config, 'CLIP_MERGE_GAP', 2.0))
+
+        if overlay_cuts or getattr(self.config, 'CLIP_STREAM_COPY', False):
+            # Index keyframes once here rather than racing to do it in every worker.
+            self.keyframe_times()
+
+        # Every clip is an independent job: overlay-free clips are cut by ffmpeg,
+        # several per process (one input and one output per clip), and overlay
+        # clips render through MoviePy from their own short source cut. At most
+        # `workers` jobs run at once even on a larger shared pool.
+        slots = threading.BoundedSemaphore(workers)
+
+        def run_limited(fn, *args):
+            with slots:
+                return fn(*args)
+
+        batch_size = max(1, int(getattr(self.config, 'CLIP_BATCH_SIZE', 8) or 1))
+        # Never batch so aggressively that workers sit idle.
+        batch_size = min(batch_size, max(1, -(-len(source_cuts) // workers)))
+        if executor is not None:
+            pool_context = nullcontext(executor)
+        else:
+            pool_context = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="clip")
+        with pool_context as pool:
+            pending = {}
+            for offset in range(0, len(source_cuts), batch_size):
+                batch = source_cuts[offset:offset + batch_size]
+                segments = [(start_time, end_time, clip_path) for _members, start_time, end_time, clip_path in batch]
+                future = pool.submit(run_limited, self._write_source_batch, segments)
+                pending[future] = [
+                    [(i, event, clip_path) for i, event in members] for members, _start, _end, clip_path in batch
+                ]
+
+            for i, event, start_time, end_time, clip_path, overlay_config in overlay_cuts:
+                logger.debug("Creating clip %d/%d: %s", i, len(events), clip_path.name)
+                future = pool.submit(
+                    run_limited, self._render_overlay_clip, start_time, end_time, clip_path, overlay_config
+                )
+                pending[future] = [[(i, event, clip_path)]]
+
+            for future in as_completed(pending):
+                batch = pending[future]
+                try:
+                    errors = future.result()
+                except Exception as e:
+                    errors = [e] * len(batch)
+                for group, error in zip(batch, errors):
+                    for i, event, clip_path in group:
+                        if error is None:
+                            created_by_index[i] = (event, clip_path)
+                        else:
+                            logger.error(f"Failed to create clip {i}: {error}")
+                        progress_bar.update(1)
 
         # Close progress bar
         progress_bar.close()
 
-        logger.info(f"Created {len(created_clips)}/{len(events)} highlight clips")
+        created_clips = [created_by_index[i] for i in sorted(created_by_index)]
+        logger.info("Created %d/%d highlight clips", len(created_clips), len(events))
         return created_clips
 
     def create_highlights_reel(
@@ -600,57 +1705,12 @@ class VideoProcessor:
             if max_clips:
                 clip_paths = clip_paths[:max_clips]
 
-            logger.info(f"Creating highlights reel from {len(clip_paths)} clips")
+            logger.info("Creating highlights reel from %d clips", len(clip_paths))
 
-            try:
-                self._write_concat_reel_ffmpeg(clip_paths, output_path)
-                logger.info(f"✅ Highlights reel created: {output_path}")
-                return True
-            except Exception as exc:
-                logger.warning(
-                    "ffmpeg concat reel path failed for %s; falling back to MoviePy: %s",
-                    output_path,
-                    exc,
-                )
-
-            # Load all clips with progress bar
-            clips = []
-            progress_bar = tqdm(
-                clip_paths,
-                desc="Loading Clips",
-                unit="clip",
-                ncols=100
-            )
-
-            for clip_path in progress_bar:
-                try:
-                    progress_bar.set_postfix({'file': clip_path.name[:30]})
-                    clip = VideoFileClip(str(clip_path))
-                    clips.append(clip)
-                except Exception as e:
-                    logger.warning(f"Failed to load clip {clip_path}: {e}")
-                    progress_bar.set_postfix({'status': 'error'})
-
-            progress_bar.close()
-
-            if not clips:
-                logger.error("No clips could be loaded")
-                return False
-
-            # Concatenate clips
-            logger.info("Concatenating clips...")
-            final_clip = concatenate_videoclips(clips, method="compose")
-
-            # Write final video
-            logger.info(f"Writing highlights reel to {output_path}")
-            self._write_video(final_clip, output_path)
-
-            # Cleanup
-            final_clip.close()
-            for clip in clips:
-                clip.close()
-
-            logger.info(f"✅ Highlights reel created: {output_path}")
+            # Stream copy through the concat demuxer when every clip shares codec
+            # parameters, one concat-filter re-encode otherwise.
+            self._write_concat_reel_ffmpeg(clip_paths, output_path)
+            logger.info("✅ Highlights reel created: %s", output_path)
             return True
 
         except Exception as e:
@@ -682,42 +1742,27 @@ class VideoProcessor:
             crf = getattr(self.config, 'OUTPUT_CRF', None)
             if crf is not None and str(codec).lower() in {'libx264', 'libx265'}:
                 ffmpeg_params += ['-crf', str(crf)]
-            # Web playback friendliness.
-            ffmpeg_params += ['-movflags', '+faststart']
+            ffmpeg_params += self._keyframe_args(getattr(clip, 'fps', None))
+            ffmpeg_params += ['-movflags', _CLIP_MOVFLAGS]
 
-            # Try different write methods for MoviePy 1.x vs 2.x compatibility
-            try:
-                clip.write_videofile(
-                    str(output_path),
-                    codec=codec,
-                    preset=preset,
-                    audio_codec=audio_codec,
-                    audio_bitrate=audio_bitrate,
-                    audio_fps=audio_fps,
-                    temp_audiofile=None,
-                    remove_temp=True,
-                    threads=threads,
-                    ffmpeg_params=ffmpeg_params or None,
-                    pixel_format=pixel_format,
-                    logger=None
-                )
-            except TypeError:
-                # MoviePy 2.x may not accept logger parameter
-                clip.write_videofile(
-                    str(output_path),
-                    codec=codec,
-                    preset=preset,
-                    audio_codec=audio_codec,
-                    audio_bitrate=audio_bitrate,
-                    audio_fps=audio_fps,
-                    temp_audiofile=None,
-                    remove_temp=True,
-                    threads=threads,
-                    ffmpeg_params=ffmpeg_params or None,
-                    pixel_format=pixel_format,
-                )
-
-            logger.debug(f"Video written to {output_path}")
+            # Silence MoviePy's own progress bar where the installed version allows it
+            write_kwargs = {'logger': None} if _WRITE_ACCEPTS_LOGGER else {}
+            clip.write_videofile(
+                str(output_path),
+                codec=codec,
+                preset=preset,
+                audio_codec=audio_codec,
+                audio_bitrate=audio_bitrate,
+                audio_fps=audio_fps,
+                temp_audiofile=None,
+                remove_temp=True,
+                threads=threads,
+                ffmpeg_params=ffmpeg_params or None,
+                pixel_format=pixel_format,
+                **write_kwargs,
+            )
+
+            logger.debug("Video written to %s", output_path)
 
         except Exception as e:
             logger.error(f"Failed to write video to {output_path}: {e}")
@@ -725,12 +1770,19 @@ class VideoProcessor:
 
     def cleanup(self):
         """Close video clip and free resources"""
-        if self.video_clip:
+        if self._video_clip:
             try:
-                self.video_clip.close()
+                self._video_clip.close()
                 logger.debug("Video clip closed")
             except Exception as e:
                 logger.warning(f"Error closing video clip: {e}")
+        if self._av_container is not None:
+            try:
+                self._av_container.close()
+            except Exception as e:
+                logger.warning(f"Error closing PyAV container: {e}")
+            self._av_container = None
+        self._torchcodec_decoder = None
 
     def __enter__(self):
         """Context manager entry"""
@@ -146,7 +146,8 @@ def _upload_review_goal_clips(
     for entry in entries:
         if not isinstance(entry, dict):
             continue
-        if str(entry.get("type") or "").strip().lower() != "goal":
+        clip_events = entry.get("events") or [entry]
+        if not any(str(event.get("type") or "").strip().lower() == "goal" for event in clip_events):
             continue
         clip_path = _clip_entry_local_path(game_dir, entry)
         if clip_path is None:
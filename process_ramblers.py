@@ -154,7 +154,8 @@ def process_video(
     video_path: Path,
     provider: AmherstBoxScoreProvider,
     game: dict,
-    dry_run: bool = False
+    dry_run: bool = False,
+    refresh: bool = False,
 ):
     """Process a video file with pre-fetched box score data"""
 
@@ -197,6 +198,7 @@ def process_video(
         parallel_ocr=True,
         ocr_workers=4,
         broadcast_type='auto',
+        refresh=refresh,
     )
 
     # Print results
@@ -250,6 +252,11 @@ def main():
         action='store_true',
         help='Show what would be done without processing'
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-fetch box score data instead of using the on-disk cache'
+    )
     parser.add_argument(
         '--games-json',
         help='Path to amherst-ramblers.json file'
@@ -298,7 +305,7 @@ def main():
         sys.exit(1)
 
     # Process the video
-    process_video(video_path, provider, game, dry_run=args.dry_run)
+    process_video(video_path, provider, game, dry_run=args.dry_run, refresh=args.refresh)
 
 
 if __name__ == '__main__':
@@ -558,6 +558,8 @@ def maybe_run_pipeline(
         config.OVERLAY_ENABLED = False
     try:
         result = pipeline.execute(**profile)
+        # Release the source decoders and per-game log handler before the reel build.
+        pipeline.wait_for_cleanup()
     finally:
         if disable_source_overlays:
             config.OVERLAY_ENABLED = original_overlay_enabled
@@ -748,8 +750,15 @@ def main() -> int:
         clips = load_clip_manifest(game_dir) if (game_dir / "data" / "clips_manifest.json").exists() else []
         matched_count = 0
         for entry in clips:
-            if not clip_matches_filters(entry, filters):
+            # A merged clip lists every event it covers; it matches through any of them.
+            matched_event = next(
+                (event for event in (entry.get("events") or [entry]) if clip_matches_filters(event, filters)),
+                None,
+            )
+            if matched_event is None:
                 continue
+            if matched_event is not entry:
+                entry = {**entry, **matched_event}
             clip_path = resolve_clip_path(game_dir, entry)
             if clip_path is None:
                 continue
@@ -770,6 +770,9 @@ def _load_clip_items(
 
         for i, entry in enumerate(entries, 1):
             clip_path = _resolve_clip_path(entry)
+            if clip_path in seen_paths:
+                # Older manifests listed a merged clip once per event.
+                continue
             seen_paths.add(clip_path)
             index = int(entry.get("index") or i)
             items.append(ClipItem(index=index, clip_path=clip_path, event=_entry_event(entry)))
@@ -785,10 +788,12 @@ def _load_clip_items(
             items.append(ClipItem(index=10_000 + i, clip_path=clip_path, event=_entry_event(entry)))
 
     if items:
+        # linked_to_goal counts goals, and a merged clip may cover several.
         goal_times: List[Optional[float]] = []
         for it in items:
-            if str(it.event.get("type") or "").strip().lower() == "goal":
-                goal_times.append(_event_video_time(it.event))
+            for event in it.event.get("events") or [it.event]:
+                if str(event.get("type") or "").strip().lower() == "goal":
+                    goal_times.append(_event_video_time(event))
 
         def _sort_key(it: ClipItem) -> Tuple[float, int, int, str]:
             video_time = _event_video_time(it.event)
@@ -1001,6 +1001,7 @@ def _process_one_video(
     broadcast_type: Optional[str],
     parallel_ocr: Optional[bool],
     ocr_workers: Optional[int],
+    refresh: bool = False,
 ) -> Tuple[bool, Optional[Path], Dict[str, Any]]:
     provider = _load_amherst_provider()
     fetcher = provider.create_fetcher(game)
@@ -1037,8 +1038,13 @@ def _process_one_video(
         execution_profile["parallel_ocr"] = bool(parallel_ocr)
     if ocr_workers is not None:
         execution_profile["ocr_workers"] = int(ocr_workers)
+    if refresh:
+        execution_profile["refresh"] = True
 
     result = pipeline.execute(**execution_profile)
+    # execute() releases decoders and the per-game log handler in the background;
+    # the reel build, upload and any repair re-run below must not overlap that.
+    pipeline.wait_for_cleanup()
 
     game_dir = game_folders.get("game_dir") if isinstance(game_folders.get("game_dir"), Path) else None
 
@@ -1051,7 +1057,7 @@ def _process_one_video(
         "failed_reason": getattr(result, "failed_reason", None),
         "exception_type": getattr(result, "exception_type", None),
         "game_id": str(game.get("game_id", "")),
-        "game_info": getattr(result, "game_info", None).__dict__ if getattr(result, "game_info", None) else None,
+        "game_info": getattr(result, "game_info", None).to_dict() if getattr(result, "game_info", None) else None,
         "events_found": result.events_found,
         "events_matched": result.events_matched,
         "clips_created": result.clips_created,
@@ -1184,6 +1190,7 @@ def main() -> int:
     parser.add_argument("--max-clips", type=int, default=None, help="Max clips in basic highlights.mp4 (0 = unlimited)")
     parser.add_argument("--no-parallel-ocr", action="store_true", help="Disable parallel OCR")
     parser.add_argument("--ocr-workers", type=int, default=None, help="OCR worker threads override")
+    parser.add_argument("--refresh", action="store_true", help="Re-fetch game ID / box score data instead of using the on-disk cache")
     parser.add_argument(
         "--audio-delay-seconds",
         type=float,
@@ -1519,6 +1526,7 @@ def main() -> int:
                         broadcast_type=str(args.broadcast_type or ""),
                         parallel_ocr=parallel_ocr,
                         ocr_workers=args.ocr_workers,
+                        refresh=bool(args.refresh),
                     )
                     if repaired_video and working_video == repaired_video and isinstance(status_payload, dict):
                         status_payload.setdefault("warnings", []).append(
@@ -1550,6 +1558,7 @@ def main() -> int:
                                 broadcast_type=str(args.broadcast_type or ""),
                                 parallel_ocr=parallel_ocr,
                                 ocr_workers=args.ocr_workers,
+                                refresh=bool(args.refresh),
                             )
                             status_payload.setdefault("warnings", []).append(
                                 f"Video repaired via ffmpeg remux/re-encode: {repaired_video.name}"
@@ -121,8 +121,7 @@ def main():
         else:
             print(f"  ✗ Video time may be wrong (expected ~{expected}, got {actual})")
 
-    if video_processor.video_clip:
-        video_processor.video_clip.close()
+    video_processor.cleanup()
 
 
 if __name__ == '__main__':
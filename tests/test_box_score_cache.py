@@ -0,0 +1,132 @@
+import json
+import os
+import time
+
+from highlight_extractor.box_score import BoxScoreFetcher
+
+
+class _Response:
+    def __init__(self, payload):
+        self._payload = payload
+        self.text = json.dumps(payload)
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+def _fetcher(tmp_path, calls, **kwargs):
+    fetcher = BoxScoreFetcher(cache_dir=tmp_path, api_key="test", **kwargs)
+    fetcher._convert_statviewfeed_game_summary = lambda raw, league, game_id: {"SiteKit": {"Gamesummary": raw}}
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params["view"])
+        if params["view"] == "schedule":
+            return _Response({"SiteKit": {"Schedule": [{
+                "id": "4820",
+                "date_played": "2026-01-10",
+                "home_team": "Amherst Ramblers",
+                "visiting_team": "Truro Bearcats",
+            }]}})
+        return _Response({"game_id": params["game_id"]})
+
+    fetcher.session.get = fake_get
+    return fetcher
+
+
+def test_box_score_lookups_are_cached_in_memory_and_on_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    calls = []
+    fetcher = _fetcher(tmp_path, calls)
+
+    for _ in range(2):
+        assert fetcher.find_game("MHL", "Amherst Ramblers", "Truro Bearcats", "2026-01-10") == "4820"
+        assert fetcher.fetch_box_score("MHL", "4820") == {"SiteKit": {"Gamesummary": {"game_id": "4820"}}}
+    assert calls == ["schedule", "gameSummary"]
+
+    # A new fetcher (next run) reads the on-disk cache without touching the API.
+    fresh_calls = []
+    fresh = _fetcher(tmp_path, fresh_calls)
+    assert fresh.find_game("MHL", "Amherst Ramblers", "Truro Bearcats", "2026-01-10") == "4820"
+    assert fresh.fetch_box_score("MHL", "4820") is not None
+    assert fresh_calls == []
+
+    fresh.refresh = True
+    fresh.fetch_box_score("MHL", "4820")
+    assert fresh_calls == ["gameSummary"]
+
+
+def test_box_score_cache_expires_after_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    _fetcher(tmp_path, []).fetch_box_score("MHL", "4820")
+    cache_file = tmp_path / "MHL_4820_boxscore.json"
+    old = time.time() - 3600
+    os.utime(cache_file, (old, old))
+
+    calls = []
+    _fetcher(tmp_path, calls, cache_ttl_seconds=60).fetch_box_score("MHL", "4820")
+    assert calls == ["gameSummary"]
+
+
+def test_transient_api_errors_are_retried_with_backoff(tmp_path, monkeypatch):
+    import requests
+
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    calls = []
+    fetcher = _fetcher(tmp_path, calls)
+    real_get = fetcher.session.get
+    failures = [requests.ConnectionError("reset"), requests.Timeout("slow")]
+
+    def flaky_get(url, params=None, timeout=None):
+        if failures:
+            raise failures.pop(0)
+        return real_get(url, params=params, timeout=timeout)
+
+    fetcher.session.get = flaky_get
+
+    assert fetcher.find_game("MHL", "Amherst Ramblers", "Truro Bearcats", "2026-01-10") == "4820"
+    assert sleeps == [1.0, 2.0]
+
+
+def test_non_transient_api_errors_are_not_retried(tmp_path, monkeypatch):
+    import requests
+
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    fetcher = _fetcher(tmp_path, [])
+    attempts = []
+
+    def not_found(url, params=None, timeout=None):
+        attempts.append(params["view"])
+        response = requests.Response()
+        response.status_code = 404
+        raise requests.HTTPError("404", response=response)
+
+    fetcher.session.get = not_found
+
+    assert fetcher.fetch_box_score("MHL", "9999") is None
+    assert attempts == ["gameSummary"]
+
+
+def test_http_status_retries_happen_in_one_layer(tmp_path, monkeypatch):
+    import requests
+
+    monkeypatch.setattr(time, "sleep", lambda _s: None)
+    fetcher = _fetcher(tmp_path, [])
+    adapter_retry = fetcher.session.get_adapter("https://").max_retries
+    assert not adapter_retry.status_forcelist
+
+    attempts = []
+
+    def unavailable(url, params=None, timeout=None):
+        attempts.append(params["view"])
+        response = requests.Response()
+        response.status_code = 503
+        raise requests.HTTPError("503", response=response)
+
+    fetcher.session.get = unavailable
+
+    assert fetcher.fetch_box_score("MHL", "9999") is None
+    assert attempts == ["gameSummary"] * fetcher.REQUEST_ATTEMPTS
@@ -144,3 +144,55 @@ def test_estimate_audio_delay_explicit_mode_does_not_probe():
     assert delay == 12.5
     assert auto_applied is False
     assert debug.get("mode") == "explicit"
+
+
+def test_refresh_flag_reaches_pipeline_execute(tmp_path, monkeypatch):
+    import runpy
+    from types import SimpleNamespace
+
+    process_one = runpy.run_path(str(Path(__file__).resolve().parents[1] / "scripts" / "drive_ingest.py"))["_process_one_video"]
+    module_globals = process_one.__globals__
+    executed = []
+
+    class FakePipeline:
+        def __init__(self, **kwargs):
+            pass
+
+        def execute(self, **kwargs):
+            executed.append(kwargs)
+            return SimpleNamespace(
+                success=True, events_found=0, events_matched=0, clips_created=0,
+                highlights_path=None, errors=[], warnings=[], total_duration_seconds=0.0,
+            )
+
+        def wait_for_cleanup(self):
+            pass
+
+    monkeypatch.setitem(module_globals, "HighlightPipeline", FakePipeline)
+    monkeypatch.setitem(
+        module_globals,
+        "_load_amherst_provider",
+        lambda: SimpleNamespace(create_fetcher=lambda game: object()),
+    )
+    monkeypatch.setattr(
+        module_globals["config"],
+        "resolve_highlight_execution_selection",
+        lambda *a, **k: {
+            "execution_profile": {"sample_interval": 5},
+            "execution_profile_name": "default",
+            "scorebug_profile": None,
+            "scorebug_context": None,
+        },
+    )
+
+    kwargs = dict(
+        game={"game_id": "4820"}, game_folders={"game_dir": tmp_path}, canonical_game_info={},
+        source_game_info=None, execution_profile_name="default", reel_mode="goals_only",
+        sample_interval=None, tolerance_seconds=None, before_seconds=None, after_seconds=None,
+        max_clips=None, broadcast_type=None, parallel_ocr=None, ocr_workers=None,
+    )
+    process_one(tmp_path / "game.mp4", **kwargs)
+    process_one(tmp_path / "game.mp4", refresh=True, **kwargs)
+
+    assert "refresh" not in executed[0]
+    assert executed[1]["refresh"] is True
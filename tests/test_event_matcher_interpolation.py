@@ -0,0 +1,33 @@
+import pytest
+
+from highlight_extractor.event_matcher import EventMatcher
+
+
+def test_estimate_missing_timestamps_fills_only_inside_observed_gaps():
+    def sample(video_time):
+        remaining = 1200 - int(video_time)
+        return {
+            "video_time": float(video_time),
+            "period": 1,
+            "game_time": f"{remaining // 60}:{remaining % 60:02d}",
+            "game_time_seconds": remaining,
+            "ocr_confidence": 95.0,
+        }
+
+    observed = (
+        [sample(t) for t in range(0, 101, 5)]
+        + [sample(t) for t in range(200, 301, 5)]
+        + [sample(t) for t in range(400, 501, 5)]
+    )
+
+    enhanced = EventMatcher().estimate_missing_timestamps(observed, video_duration=600.0)
+
+    synthetic = [ts["video_time"] for ts in enhanced if ts.get("interpolated")]
+    gaps = [(100.0, 200.0), (300.0, 400.0)]
+    assert synthetic
+    assert all(any(lo < t < hi for lo, hi in gaps) for t in synthetic)
+    # Each gap gets its own evenly spaced points and nothing else is created.
+    for lo, hi in gaps:
+        assert [t for t in synthetic if lo < t < hi] == pytest.approx([lo + k * (hi - lo) / 6 for k in range(1, 6)])
+    assert len(synthetic) == 10
+    assert [ts["video_time"] for ts in enhanced] == sorted(ts["video_time"] for ts in enhanced)
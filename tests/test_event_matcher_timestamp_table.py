@@ -0,0 +1,152 @@
+import random
+
+import pytest
+
+from highlight_extractor.event_matcher import EventMatcher, _TimestampTable
+from highlight_extractor.time_utils import period_time_to_absolute_seconds
+
+
+def _reference_interpolate(matcher, event, timestamps, minimum_video_time):
+    """Row-by-row interpolation as it was written before _TimestampTable."""
+    event_seconds = matcher._event_time_to_remaining_seconds(event["period"], event["time"])
+    event_abs = matcher._event_to_absolute_time(event["period"], event_seconds)
+    candidates = [
+        ts for ts in timestamps
+        if minimum_video_time is None or float(ts.get("video_time", -1.0) or -1.0) >= minimum_video_time
+    ]
+    before = after = None
+    for ts in candidates:
+        abs_time = period_time_to_absolute_seconds(int(ts["period"] or 1), ts["game_time_seconds"], matcher.clock_rules)
+        if abs_time <= event_abs and (before is None or abs_time > before[1]):
+            before = (ts["video_time"], abs_time)
+        if abs_time >= event_abs and (after is None or abs_time < after[1]):
+            after = (ts["video_time"], abs_time)
+    if before and after and after[1] - before[1] > 0:
+        ratio = (event_abs - before[1]) / (after[1] - before[1])
+        return before[0] + ratio * (after[0] - before[0])
+    if before:
+        return before[0]
+    if after:
+        return after[0]
+    return None
+
+
+def _reference_match(matcher, event, timestamps, tolerance, recording_game_start_time):
+    """Row-by-row closest-timestamp search as it was written before _TimestampTable."""
+    event_seconds = matcher._event_time_to_remaining_seconds(event["period"], event["time"])
+    minimum_video_time = matcher.minimum_video_time_for_event(
+        event, recording_game_start_time=recording_game_start_time
+    )
+    period_rows = [
+        ts for ts in timestamps
+        if ts.get("period") == event["period"]
+        and (minimum_video_time is None or float(ts.get("video_time", -1.0) or -1.0) >= minimum_video_time)
+    ]
+    if not period_rows:
+        video_time = _reference_interpolate(matcher, event, timestamps, minimum_video_time)
+        return None if video_time is None else (video_time, 0.5, tolerance / 2, "interpolation_no_period_match")
+
+    best, best_diff = None, float("inf")
+    for ts in period_rows:
+        diff = abs(event_seconds - ts["game_time_seconds"])
+        if diff < best_diff:
+            best, best_diff = ts, diff
+    if best_diff <= tolerance:
+        confidence = 1.0 if best_diff == 0 else max(0.0, 1.0 - best_diff / tolerance)
+        return (best["video_time"], confidence, best_diff, "exact_period")
+
+    video_time = _reference_interpolate(matcher, event, timestamps, minimum_video_time)
+    return None if video_time is None else (video_time, 0.3, tolerance, "interpolation_fallback")
+
+
+def _random_timestamps(rng):
+    timestamps = []
+    video_time = rng.uniform(0.0, 60.0)
+    for _ in range(rng.randint(0, 80)):
+        video_time += rng.choice([15.0, 60.0, 90.0, 150.0])
+        timestamps.append({
+            "video_time": video_time,
+            "period": rng.choice([1, 1, 2, 2, 3, 4, None]),
+            # A coarse clock grid makes ties between rows common.
+            "game_time_seconds": rng.choice(range(0, 1201, 30)),
+        })
+    return timestamps
+
+
+def test_table_matching_agrees_with_row_scan_on_random_games():
+    rng = random.Random(1234)
+    matcher = EventMatcher()
+    checked = 0
+    for _ in range(300):
+        timestamps = _random_timestamps(rng)
+        table = _TimestampTable(timestamps)
+        recording_game_start_time = rng.choice([None, 0.0, 600.0])
+        for _ in range(5):
+            event = {"period": rng.choice([1, 2, 3, 4, 5]), "time": f"{rng.randint(0, 19)}:{rng.randint(0, 59):02d}"}
+            expected = _reference_match(matcher, event, timestamps, 30, recording_game_start_time)
+            for shared_table in (table, None):
+                actual = matcher._find_closest_timestamp_with_confidence(
+                    event,
+                    timestamps,
+                    30,
+                    recording_game_start_time=recording_game_start_time,
+                    table=shared_table,
+                )
+                if expected is None:
+                    assert actual is None
+                else:
+                    assert actual == pytest.approx(expected)
+                    assert actual[3] == expected[3]
+            checked += 1
+    assert checked == 1500
+
+
+def test_ties_go_to_the_first_timestamp():
+    timestamps = [
+        {"video_time": 100.0, "period": 1, "game_time_seconds": 610},
+        {"video_time": 200.0, "period": 1, "game_time_seconds": 590},
+        {"video_time": 300.0, "period": 1, "game_time_seconds": 610},
+    ]
+    match = EventMatcher()._find_closest_timestamp_with_confidence(
+        {"period": 1, "time": "10:00"}, timestamps, 30
+    )
+    assert match[0] == 100.0
+    assert match[3] == "exact_period"
+
+
+def test_missing_period_interpolates_between_neighbouring_periods():
+    matcher = EventMatcher()
+    timestamps = [
+        {"video_time": 1000.0, "period": 1, "game_time_seconds": 0},
+        {"video_time": 3000.0, "period": 3, "game_time_seconds": 1200},
+    ]
+    video_time, confidence, _diff, method = matcher._find_closest_timestamp_with_confidence(
+        {"period": 2, "time": "10:00"}, timestamps, 30
+    )
+    assert method == "interpolation_no_period_match"
+    assert confidence == 0.5
+    assert video_time == pytest.approx(2000.0)
+
+
+def test_minimum_video_time_excludes_warmup_samples():
+    matcher = EventMatcher()
+    timestamps = [
+        # Warmup clock shows the same period/clock long before the goal is possible.
+        {"video_time": 50.0, "period": 1, "game_time_seconds": 600},
+        {"video_time": 1500.0, "period": 1, "game_time_seconds": 600},
+    ]
+    match = matcher._find_closest_timestamp_with_confidence(
+        {"period": 1, "time": "10:00"}, timestamps, 30, recording_game_start_time=900.0
+    )
+    assert match[0] == 1500.0
+
+
+def test_no_candidates_after_minimum_video_time_returns_none():
+    matcher = EventMatcher()
+    timestamps = [{"video_time": 50.0, "period": 1, "game_time_seconds": 600}]
+    assert matcher._find_closest_timestamp_with_confidence(
+        {"period": 1, "time": "10:00"}, timestamps, 30, recording_game_start_time=900.0
+    ) is None
+    assert matcher._interpolate_timestamp(
+        {"period": 2, "time": "10:00"}, [], recording_game_start_time=None
+    ) is None
@@ -0,0 +1,16 @@
+import pytest
+
+from highlight_extractor.goal import Goal
+from highlight_extractor.models import Event, VideoTimestamp
+
+
+def test_clock_strings_are_stored_stripped():
+    assert Goal(period=1, time=" 5:00 ", team="Amherst", scorer="X").time == "5:00"
+    assert Event(type="penalty", period=2, time="12:34\n", team="Amherst", player="X").time == "12:34"
+    stamp = VideoTimestamp(video_time=1.0, period=1, game_time=" 19:59", game_time_seconds=1199)
+    assert stamp.game_time == "19:59"
+
+
+def test_out_of_range_clock_is_rejected():
+    with pytest.raises(ValueError, match="Invalid seconds"):
+        Event(type="penalty", period=1, time="5:75", team="Amherst", player="X")
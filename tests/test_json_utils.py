@@ -0,0 +1,28 @@
+import json
+
+import numpy as np
+
+from highlight_extractor import json_utils
+
+
+def test_write_json_round_trips_timestamp_list(tmp_path):
+    data = [{"video_time": 1.5, "period": 1, "time": "19:58", "ocr_confidence": np.float64(91.0)}]
+    path = tmp_path / "video_timestamps.json"
+
+    json_utils.write_json(path, data)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [
+        {"video_time": 1.5, "period": 1, "time": "19:58", "ocr_confidence": 91.0}
+    ]
+
+
+def test_dumps_bytes_stdlib_fallback_matches(monkeypatch):
+    data = {"a": [1, 2], "b": "x"}
+    monkeypatch.setattr(json_utils, "orjson", None)
+
+    assert json.loads(json_utils.dumps_bytes(data, indent=True)) == data
+    assert json_utils.dumps_bytes(data) == b'{"a": [1, 2], "b": "x"}'
+
+
+def test_dumps_bytes_falls_back_for_values_orjson_rejects():
+    assert json.loads(json_utils.dumps_bytes({1: "a", "big": 2**70})) == {"1": "a", "big": 2**70}
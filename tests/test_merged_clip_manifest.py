@@ -0,0 +1,83 @@
+import json
+import runpy
+from pathlib import Path
+from types import SimpleNamespace
+
+
+def test_pipeline_manifest_lists_a_merged_clip_once(tmp_path: Path):
+    from highlight_extractor.pipeline import HighlightPipeline
+
+    class MergingVideoProcessor:
+        duration = 10_000.0
+
+        def create_highlight_clips(self, events, clips_dir: Path, before_seconds=8.0, after_seconds=6.0):
+            clips_dir.mkdir(parents=True, exist_ok=True)
+            shared = clips_dir / "01_goal.mp4"
+            shared.write_bytes(b"0")
+            return [(event, shared) for event in events]
+
+    pipeline = HighlightPipeline(
+        config=SimpleNamespace(DEFAULT_REEL_MODE="goals_only"),
+        video_path=tmp_path / "dummy.mp4",
+        video_processor=MergingVideoProcessor(),
+        ocr_engine=SimpleNamespace(),
+    )
+    game_dir = tmp_path / "game"
+    pipeline.game_folders = {
+        name: game_dir / sub
+        for name, sub in (("game_dir", ""), ("clips_dir", "clips"), ("data_dir", "data"), ("output_dir", "output"))
+    }
+    for folder in pipeline.game_folders.values():
+        folder.mkdir(parents=True, exist_ok=True)
+    pipeline.matched_events = [
+        {"type": "goal", "period": 1, "time": "5:00", "team": "A", "scorer": "X", "video_time": 300.0},
+        {"type": "goal", "period": 1, "time": "5:10", "team": "B", "scorer": "Y", "video_time": 310.0},
+    ]
+
+    pipeline._step6_create_clips(before_seconds=8.0, after_seconds=4.0)
+
+    clips = json.loads((game_dir / "data" / "clips_manifest.json").read_text(encoding="utf-8"))["clips"]
+    assert len(clips) == 1
+    assert clips[0]["scorer"] == "X"
+    assert [event["scorer"] for event in clips[0]["events"]] == ["X", "Y"]
+
+
+def test_production_builder_renders_a_merged_clip_once(tmp_path: Path):
+    mod = runpy.run_path(Path(__file__).resolve().parents[1] / "scripts" / "build_production_highlight_reel.py")
+    load_items = mod["_load_clip_items"]
+
+    game_dir = tmp_path / "game"
+    clips_dir = game_dir / "clips"
+    data_dir = game_dir / "data"
+    for p in (clips_dir, data_dir):
+        p.mkdir(parents=True, exist_ok=True)
+    for name in ("01_GOAL.mp4", "03_PENALTY.mp4", "04_GOAL.mp4"):
+        (clips_dir / name).write_bytes(b"0")
+
+    goals = [{"type": "goal", "video_time": 100.0}, {"type": "goal", "video_time": 105.0}]
+    clips_manifest = data_dir / "clips_manifest.json"
+    clips_manifest.write_text(
+        json.dumps(
+            {
+                "clips": [
+                    {**goals[0], "events": goals, "path": "clips/01_GOAL.mp4", "index": 1},
+                    # Older manifests repeated a shared clip for every event.
+                    {**goals[1], "path": "clips/01_GOAL.mp4", "index": 2},
+                    {"type": "penalty", "video_time": 900.0, "linked_to_goal": 2, "path": "clips/03_PENALTY.mp4", "index": 3},
+                    {"type": "goal", "video_time": 400.0, "path": "clips/04_GOAL.mp4", "index": 4},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    events_json = data_dir / "matched_events.json"
+    events_json.write_text("[]", encoding="utf-8")
+
+    items = load_items(
+        game_dir=game_dir,
+        clips_dir=clips_dir,
+        events_json=events_json,
+        clips_manifest=clips_manifest,
+    )
+
+    assert [it.clip_path.name for it in items] == ["01_GOAL.mp4", "03_PENALTY.mp4", "04_GOAL.mp4"]
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from highlight_extractor.ocr_engine import OCREngine
+
+ROI = (10, 10, 120, 40)
+
+
+def _engine():
+    engine = OCREngine.__new__(OCREngine)
+    engine.config = SimpleNamespace(OCR_CONTRAST_STRETCH_MIN_RANGE=60)
+    return engine
+
+
+def _crop(lo, hi):
+    return np.linspace(lo, hi, 40 * 120).reshape(40, 120).astype(np.uint8)
+
+
+def test_stretch_lut_is_calibrated_once_per_roi():
+    engine = _engine()
+    lut = engine._contrast_stretch_lut(_crop(40, 200), "standard", ROI)
+    assert lut is not None
+
+    assert engine._contrast_stretch_lut(_crop(0, 255), "standard", ROI) is lut
+    other = engine._contrast_stretch_lut(_crop(0, 255), "standard", (0, 0, 120, 40))
+    assert other is not None and other is not lut
+
+
+def test_low_range_crops_fall_back_to_clahe_even_after_calibration():
+    engine = _engine()
+    assert engine._contrast_stretch_lut(_crop(100, 130), "standard", ROI) is None
+
+    lut = engine._contrast_stretch_lut(_crop(40, 200), "standard", ROI)
+    assert lut is not None
+    # A replay wipe or intermission graphic later in the game still gets CLAHE.
+    assert engine._contrast_stretch_lut(_crop(100, 130), "standard", ROI) is None
+    assert engine._contrast_stretch_lut(_crop(40, 200), "standard", ROI) is lut
+
+
+def test_broadcast_override_drops_calibrated_luts():
+    engine = _engine()
+    lut = engine._contrast_stretch_lut(_crop(40, 200), "standard", ROI)
+
+    engine.set_broadcast_type("standard")
+
+    recalibrated = engine._contrast_stretch_lut(_crop(0, 255), "standard", ROI)
+    assert recalibrated is not None and recalibrated is not lut
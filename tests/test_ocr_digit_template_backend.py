@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+
+from highlight_extractor.ocr_backends import DigitTemplateBackend
+
+
+def _render(text):
+    image = np.full((80, 300), 255, dtype=np.uint8)
+    cv2.putText(image, text, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.8, 0, 4)
+    return image
+
+
+def test_digit_templates_read_clock_after_learning():
+    backend = DigitTemplateBackend()
+    assert backend.read_text(_render("1 12:34")).text == ""
+
+    for text in ["1 12:34", "2 05:67", "3 18:90"]:
+        assert backend.learn(_render(text), text)
+
+    result = backend.read_text(_render("2 17:48"))
+    assert result.text == "2 17:48"
+    assert result.confidence >= 90.0
+
+
+def test_digit_templates_skip_reads_that_do_not_segment_cleanly():
+    backend = DigitTemplateBackend()
+
+    assert not backend.learn(_render("12:34"), "1 12:34")
+    assert not backend.is_ready()
+
+
+def test_digit_templates_reject_reads_with_unlearned_glyphs():
+    backend = DigitTemplateBackend()
+    assert backend.learn(_render("1 12:34"), "1 12:34")
+
+    # '5'-'8' have no templates; nearest-template guesses must not be returned.
+    assert backend.read_text(_render("1 56:78")).text == ""
@@ -0,0 +1,48 @@
+import threading
+
+import pytest
+
+from highlight_extractor.ocr_engine import _iter_sample_frames, _prefetch
+
+
+def test_prefetch_keeps_order_and_reraises_errors():
+    def frames():
+        yield from ((t, t * 10) for t in range(6))
+        raise RuntimeError("decoder died")
+
+    seen = []
+    with pytest.raises(RuntimeError, match="decoder died"):
+        for item in _prefetch(frames(), 2):
+            seen.append(item)
+
+    assert seen == [(t, t * 10) for t in range(6)]
+
+
+def test_closing_prefetch_stops_the_producer():
+    produced = []
+
+    def frames():
+        for t in range(1000):
+            produced.append(t)
+            yield t, None
+
+    iterator = _prefetch(frames(), 4)
+    assert next(iterator) == (0, None)
+    iterator.close()
+
+    assert not any(t.name == "frame-prefetch" for t in threading.enumerate())
+    assert len(produced) < 1000
+
+
+def test_prefetched_sampling_sizes_the_buffer_pool_for_queued_frames():
+    calls = []
+
+    class Processor:
+        def iter_frames_at_times(self, times, **kwargs):
+            calls.append(kwargs)
+            return ((t, None) for t in times)
+
+    frames = list(_iter_sample_frames(Processor(), [1.0, 2.0], False, prefetch=4))
+
+    assert frames == [(1.0, None), (2.0, None)]
+    assert calls == [{"keyframe_aligned": False, "reuse_buffers": True, "min_pool_size": 6}]
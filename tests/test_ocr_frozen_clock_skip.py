@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from highlight_extractor.ocr_engine import OCREngine
+
+
+def _engine():
+    engine = object.__new__(OCREngine)
+    engine.config = SimpleNamespace(OCR_FROZEN_CLOCK_SKIP_SAMPLES=3)
+    engine.scoreboard_roi = (0, 0, 8, 8)
+    engine._consecutive_bad_samples = 0
+    return engine
+
+
+def test_sequential_sampling_skips_decode_while_clock_is_frozen():
+    decoded = []
+
+    class StubVideoProcessor:
+        duration = 100.0
+
+        @staticmethod
+        def get_frame_at_time(timestamp):
+            decoded.append(float(timestamp))
+            frame = np.zeros((32, 32, 3), dtype=np.uint8)
+            frame[:16] = 200
+            return frame
+
+    def fake_extract(frame, *args, **kwargs):
+        return (2, "20:00"), "2 20:00", 95.0, "tesseract", "standard", (0, 0, 8, 8), "standard"
+
+    engine = _engine()
+    engine._extract_time_from_frame_with_meta = fake_extract  # type: ignore[method-assign]
+
+    timestamps = engine.sample_video_times(StubVideoProcessor(), sample_interval=10, parallel=False)
+
+    assert decoded == [0.0, 10.0, 50.0, 90.0]
+    # Skipped samples are not recorded, so no stale clock values are fabricated.
+    assert [ts["video_time"] for ts in timestamps] == decoded
+    assert all(ts["game_time"] == "20:00" for ts in timestamps)
+
+
+def test_sequential_sampling_records_nothing_while_the_clock_restarts_in_the_skip_window():
+    decoded = []
+
+    class StubVideoProcessor:
+        duration = 70.0
+
+        @staticmethod
+        def get_frame_at_time(timestamp):
+            decoded.append(float(timestamp))
+            frame = np.zeros((32, 32, 3), dtype=np.uint8)
+            frame[:16] = 200
+            return frame
+
+    def clock_at(video_time):
+        # Stoppage until 20s, then the clock runs down from 20:00.
+        remaining = 1200 - max(0, int(video_time) - 20)
+        return f"{remaining // 60:02d}:{remaining % 60:02d}"
+
+    def fake_extract(frame, *args, **kwargs):
+        game_time = clock_at(decoded[-1])
+        return (2, game_time), f"2 {game_time}", 95.0, "tesseract", "standard", (0, 0, 8, 8), "standard"
+
+    engine = _engine()
+    engine._extract_time_from_frame_with_meta = fake_extract  # type: ignore[method-assign]
+
+    timestamps = engine.sample_video_times(StubVideoProcessor(), sample_interval=10, parallel=False)
+
+    # The clock restarts at 20s, inside the skip window; the skipped samples leave
+    # a gap instead of stale 20:00 readings.
+    assert decoded == [0.0, 10.0, 50.0, 60.0]
+    assert [(ts["video_time"], ts["game_time"]) for ts in timestamps] == [
+        (0.0, "20:00"),
+        (10.0, "20:00"),
+        (50.0, "19:30"),
+        (60.0, "19:20"),
+    ]
+
+
+def test_sequential_sampling_keeps_decoding_on_scene_change():
+    decoded = []
+
+    class StubVideoProcessor:
+        duration = 50.0
+
+        @staticmethod
+        def get_frame_at_time(timestamp):
+            decoded.append(float(timestamp))
+            rng = np.random.default_rng(int(timestamp))
+            return rng.integers(0, 255, size=(32, 32, 3), dtype=np.uint8)
+
+    def fake_extract(frame, *args, **kwargs):
+        return (2, "20:00"), "2 20:00", 95.0, "tesseract", "standard", (0, 0, 8, 8), "standard"
+
+    engine = _engine()
+    engine._extract_time_from_frame_with_meta = fake_extract  # type: ignore[method-assign]
+
+    timestamps = engine.sample_video_times(StubVideoProcessor(), sample_interval=10, parallel=False)
+
+    assert decoded == [0.0, 10.0, 20.0, 30.0, 40.0]
+    assert not any(ts.get("ocr_frozen_skip") for ts in timestamps)
@@ -0,0 +1,51 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+
+from highlight_extractor.ocr_engine import OCREngine
+
+
+def test_parallel_ocr_on_a_shared_pool_respects_worker_count():
+    engine = object.__new__(OCREngine)
+    engine.config = SimpleNamespace(OCR_FROZEN_CLOCK_SKIP_SAMPLES=0, OCR_PREFETCH_FRAMES=0)
+    engine.scoreboard_roi = (0, 0, 8, 8)
+    engine._consecutive_bad_samples = 0
+
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def fake_extract(frame, *args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return (1, "20:00"), "1 20:00", 95.0, "tesseract", "standard", (0, 0, 8, 8), "standard"
+
+    engine._extract_time_from_frame_with_meta = fake_extract  # type: ignore[method-assign]
+
+    class StubVideoProcessor:
+        duration = 60.0
+
+        @staticmethod
+        def get_frame_at_time(timestamp):
+            return np.full((16, 16, 3), int(timestamp) % 255, dtype=np.uint8)
+
+    with ThreadPoolExecutor(max_workers=6) as shared:
+        timestamps = engine.sample_video_times(
+            StubVideoProcessor(),
+            sample_interval=5,
+            parallel=True,
+            workers=2,
+            broadcast_type="standard",
+            executor=shared,
+        )
+
+    assert len(timestamps) == 12
+    assert peak <= 2
@@ -0,0 +1,35 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from highlight_extractor.pipeline import HighlightPipeline
+
+
+class SlowCleanupVideoProcessor:
+    duration = 100.0
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.closed = False
+
+    def cleanup(self):
+        self.release.wait(5)
+        self.closed = True
+
+
+def test_execute_returns_before_cleanup_and_result_can_wait(tmp_path: Path):
+    video_processor = SlowCleanupVideoProcessor()
+    pipeline = HighlightPipeline(
+        config=SimpleNamespace(DEFAULT_REEL_MODE="goals_only"),
+        video_path=tmp_path / "not_a_game_name.mp4",
+        video_processor=video_processor,
+        ocr_engine=SimpleNamespace(),
+    )
+
+    result = pipeline.execute()
+
+    assert result.success is False
+    assert result.wait_for_cleanup(timeout=0.01) is False
+    video_processor.release.set()
+    assert result.wait_for_cleanup(timeout=5) is True
+    assert video_processor.closed
@@ -0,0 +1,29 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+from highlight_extractor.models import GameInfo
+from highlight_extractor.pipeline import HighlightPipeline
+
+
+def test_game_context_keeps_playoff_flag_from_game_info(tmp_path: Path):
+    pipeline = HighlightPipeline(
+        config=SimpleNamespace(DEFAULT_REEL_MODE="goals_only"),
+        video_path=tmp_path / "not_a_game_name.mp4",
+        video_processor=SimpleNamespace(cleanup=lambda: None),
+        ocr_engine=SimpleNamespace(),
+    )
+    pipeline.game_info = GameInfo(
+        date="2025-03-14",
+        home_team="Amherst Ramblers",
+        away_team="Truro Bearcats",
+        league="MHL",
+        filename="game.ts",
+        playoff=True,
+        game_number=3,
+    )
+    pipeline.box_score = {}
+
+    pipeline._refresh_game_context()
+
+    assert pipeline._clock_rules.playoff is True
+    assert pipeline._game_context["game_number"] == 3
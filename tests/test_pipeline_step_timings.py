@@ -0,0 +1,42 @@
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from highlight_extractor.pipeline import HighlightPipeline
+
+
+def _pipeline(tmp_path: Path) -> HighlightPipeline:
+    return HighlightPipeline(
+        config=SimpleNamespace(DEFAULT_REEL_MODE="goals_only"),
+        video_path=tmp_path / "not_a_game_name.mp4",
+        video_processor=SimpleNamespace(cleanup=lambda: None),
+        ocr_engine=SimpleNamespace(),
+    )
+
+
+def test_timed_step_records_nested_scopes_and_failures(tmp_path: Path):
+    pipeline = _pipeline(tmp_path)
+
+    with pipeline._timed_step("fetch_box_score"):
+        with pipeline._timed_step("fetch_box_score.find_game"):
+            time.sleep(0.01)
+    with pytest.raises(ValueError):
+        with pipeline._timed_step("load_video"):
+            raise ValueError("boom")
+
+    timings = pipeline._step_timings
+    assert timings["fetch_box_score.find_game"] >= 0.01
+    assert timings["fetch_box_score"] >= timings["fetch_box_score.find_game"]
+    assert "load_video" in timings
+
+
+def test_execute_reports_step_timings_on_result(tmp_path: Path):
+    pipeline = _pipeline(tmp_path)
+
+    result = pipeline.execute()
+    result.wait_for_cleanup(timeout=5)
+
+    assert "parse_and_setup" in result.step_timings
+    assert result.to_dict()["performance"]["step_timings"] == result.step_timings
@@ -0,0 +1,32 @@
+import numpy as np
+
+from highlight_extractor.time_utils import (
+    GameClockRules,
+    absolute_seconds_to_period_time,
+    absolute_seconds_to_period_time_vec,
+    period_time_to_absolute_seconds,
+    period_time_to_absolute_seconds_vec,
+)
+
+
+def test_vectorized_period_time_matches_scalar_conversion():
+    rules = GameClockRules(playoff=True)
+    periods = np.array([0, 1, 2, 3, 4, 5, 6])
+    remaining = np.array([1200, 900, 0, 37, 600, 1200, 5])
+
+    absolute = period_time_to_absolute_seconds_vec(periods, remaining, rules)
+
+    assert absolute.tolist() == [
+        period_time_to_absolute_seconds(int(p), int(r), rules) for p, r in zip(periods, remaining)
+    ]
+
+
+def test_vectorized_absolute_seconds_round_trip_across_overtime():
+    absolute = np.array([-5, 0, 1199, 1200, 3599, 3600, 3899, 3900, 4199])
+
+    periods, remaining = absolute_seconds_to_period_time_vec(absolute)
+
+    assert list(zip(periods.tolist(), remaining.tolist())) == [
+        absolute_seconds_to_period_time(int(a)) for a in absolute
+    ]
+    assert periods.tolist()[5:] == [4, 4, 5, 5]
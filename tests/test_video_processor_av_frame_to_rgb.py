@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from highlight_extractor.video_processor import _FramePool, _av_frame_to_rgb
+
+av = pytest.importorskip("av")
+
+
+@pytest.mark.parametrize("height", [270, 272])
+def test_pooled_yuv420p_conversion_matches_pyav(height):
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 256, size=(height, 480, 3), dtype=np.uint8)
+    frame = av.VideoFrame.from_ndarray(rgb, format="rgb24").reformat(format="yuv420p")
+
+    pooled = _av_frame_to_rgb(frame, _FramePool(2))
+    reference = frame.to_ndarray(format="rgb24")
+
+    assert pooled.shape == (height, 480, 3)
+    # OpenCV and swscale round the YUV->RGB matrix slightly differently.
+    assert np.abs(pooled.astype(int) - reference.astype(int)).mean() < 3.0
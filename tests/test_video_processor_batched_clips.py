@@ -0,0 +1,148 @@
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
+
+from highlight_extractor import video_processor as vp_module
+from highlight_extractor.video_processor import VideoProcessor
+
+
+def _processor(tmp_path: Path, **config) -> VideoProcessor:
+    processor = VideoProcessor(tmp_path / "game.mp4", SimpleNamespace(OVERLAY_ENABLED=False, **config))
+    processor.video_clip = object()
+    processor.duration = 600.0
+    return processor
+
+
+def test_overlay_free_clips_share_one_ffmpeg_process(tmp_path: Path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(vp_module.subprocess, "run", fake_run)
+    processor = _processor(tmp_path, CLIP_EXTRACT_WORKERS=1, CLIP_BATCH_SIZE=8)
+    events = [{"type": "goal", "period": 1, "time": "10:00", "team": "A", "video_time": t} for t in (30, 90, 150)]
+
+    created = processor.create_highlight_clips(events, tmp_path / "clips", before_seconds=5, after_seconds=5)
+
+    assert len(calls) == 1
+    assert calls[0].count("-i") == 3
+    assert calls[0].count("1:v:0") == 1
+    assert [path.name for _event, path in created] == sorted(path.name for _event, path in created)
+    assert len(created) == 3
+
+
+def test_failed_batch_is_retried_clip_by_clip(tmp_path: Path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd.count("-i") > 1 or cmd[-1].startswith(str(tmp_path / "clips" / "02_")):
+            raise subprocess.CalledProcessError(1, cmd, stderr="bad cut")
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(vp_module.subprocess, "run", fake_run)
+    processor = _processor(tmp_path, CLIP_EXTRACT_WORKERS=1, CLIP_BATCH_SIZE=8)
+    events = [{"type": "goal", "period": 1, "time": "10:00", "team": "A", "video_time": t} for t in (30, 90, 150)]
+
+    created = processor.create_highlight_clips(events, tmp_path / "clips", before_seconds=5, after_seconds=5)
+
+    assert len(calls) == 4
+    assert [path.name[:2] for _event, path in created] == ["01", "03"]
+
+
+def test_clip_workers_leave_room_for_encoder_threads(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(vp_module.os, "cpu_count", lambda: 8)
+
+    assert _processor(tmp_path, CLIP_EXTRACT_WORKERS=8).clip_worker_count() == 8
+    assert _processor(tmp_path, CLIP_EXTRACT_WORKERS=8, OUTPUT_THREADS=4).clip_worker_count() == 2
+    assert _processor(tmp_path, CLIP_EXTRACT_WORKERS=8, OUTPUT_THREADS=16).clip_worker_count() == 1
+
+
+def test_hwaccel_decode_falls_back_to_software(tmp_path: Path, monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if "-hwaccel" in cmd:
+            raise subprocess.CalledProcessError(1, cmd, stderr="No device available for decoder")
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(vp_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(vp_module, "_ffmpeg_hwaccels", lambda: ("vdpau", "cuda", "vaapi"))
+    processor = _processor(tmp_path, VIDEO_HWACCEL="auto")
+
+    assert processor.hwaccel() == "cuda"
+    processor._write_source_segments([(10.0, 20.0, tmp_path / "a.mp4")], stream_copy=False)
+    processor._write_source_segments([(30.0, 40.0, tmp_path / "b.mp4")], stream_copy=False)
+
+    assert [cmd.count("-hwaccel") for cmd in calls] == [1, 0, 0]
+    assert processor.hwaccel() is None
+
+
+def test_clip_bounds_are_clamped_to_the_video(tmp_path: Path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(vp_module.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd))
+    processor = _processor(tmp_path, CLIP_EXTRACT_WORKERS=1)
+    events = [
+        {"type": "goal", "period": 1, "time": "19:58", "team": "A", "video_time": 2.0},
+        {"type": "goal", "period": 3, "time": "0:01", "team": "A", "video_time": 598.0, "after_seconds": 10},
+        {"type": "goal", "period": 2, "time": "5:00", "team": "A"},
+    ]
+
+    created = processor.create_highlight_clips(events, tmp_path / "clips", before_seconds=5, after_seconds=5)
+
+    inputs = [calls[0][i + 1:i + 4:2] for i, arg in enumerate(calls[0]) if arg == "-ss"]
+    assert inputs == [["0.000", "7.000"], ["593.000", "7.000"]]
+    assert len(created) == 2
+
+
+def test_overlapping_windows_share_one_clip(tmp_path: Path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(vp_module.subprocess, "run", lambda cmd, **kwargs: calls.append(cmd))
+    processor = _processor(tmp_path, CLIP_EXTRACT_WORKERS=1, CLIP_MERGE_GAP=2.0)
+    events = [{"type": "goal", "period": 1, "time": "10:00", "team": "A", "video_time": t} for t in (30, 41, 52, 90)]
+
+    created = processor.create_highlight_clips(events, tmp_path / "clips", before_seconds=5, after_seconds=5)
+
+    assert calls[0].count("-i") == 2
+    assert calls[0][calls[0].index("-ss") + 1:calls[0].index("-ss") + 4:2] == ["25.000", "32.000"]
+    assert [event["video_time"] for event, _path in created] == [30, 41, 52, 90]
+    assert len({path for _event, path in created}) == 2
+
+
+def test_reel_progress_never_runs_past_the_probed_total(monkeypatch):
+    bars = []
+
+    class RecordingBar:
+        def __init__(self, total=None, **kwargs):
+            self.total = total
+            self.n = 0.0
+            bars.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def update(self, amount):
+            self.n += amount
+
+    class FakeProcess:
+        stdout = iter(["out_time_us=17000000\n", "out_time_us=34067000\n", "progress=end\n"])
+
+        def __init__(self, cmd, **kwargs):
+            pass
+
+        def wait(self):
+            return 0
+
+    monkeypatch.setattr(vp_module, "tqdm", RecordingBar)
+    monkeypatch.setattr(vp_module.subprocess, "Popen", FakeProcess)
+
+    VideoProcessor._run_ffmpeg_with_progress(["ffmpeg", "-i", "x"], 34.04, "Joining Reel")
+
+    assert bars[0].total == 34.04
+    assert abs(bars[0].n - 34.04) < 1e-6
@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from highlight_extractor import video_processor as vp_module
+from highlight_extractor.video_processor import VideoProcessor
+
+
+def test_load_video_probes_once_and_opens_moviepy_lazily(tmp_path: Path, monkeypatch):
+    probes = []
+    opened = []
+    payload = {
+        "format": {"duration": "3602.1"},
+        "streams": [
+            {
+                "codec_name": "h264",
+                "width": 1920,
+                "height": 1080,
+                "avg_frame_rate": "30000/1001",
+                "r_frame_rate": "60000/1001",
+                "nb_frames": "107907",
+                "time_base": "1/90000",
+                "duration": "3600.5",
+            }
+        ],
+    }
+
+    def fake_check_output(cmd, **kwargs):
+        probes.append(cmd)
+        return json.dumps(payload)
+
+    def fake_clip(path, **kwargs):
+        opened.append(path)
+        return SimpleNamespace(duration=3600.5, fps=29.97, get_frame=lambda t: None, close=lambda: None)
+
+    monkeypatch.setattr(vp_module.subprocess, "check_output", fake_check_output)
+    monkeypatch.setattr(vp_module, "VideoFileClip", fake_clip)
+    monkeypatch.setattr(VideoProcessor, "_first_frame_decodes", lambda self: True)
+    processor = VideoProcessor(tmp_path / "game.ts", SimpleNamespace())
+
+    assert processor.load_video()
+    assert len(probes) == 1
+    assert opened == []
+    assert processor.duration == 3600.5
+    assert abs(processor.fps - 29.97) < 0.01
+    assert processor.metadata["nb_frames"] == 107907
+
+    assert processor.video_clip is processor.video_clip
+    assert opened == [str(tmp_path / "game.ts")]
+
+
+def test_keyframe_index_falls_back_to_ffprobe_packets(tmp_path: Path, monkeypatch):
+    packets = "1.400000,564,K__\n1.433333,9024,___\n3.400000,20116,K__\nN/A,N/A,K__\n5.400000,N/A,K_D\n"
+    monkeypatch.setattr(vp_module, "av", None)
+    monkeypatch.setattr(vp_module.subprocess, "check_output", lambda cmd, **kwargs: packets)
+    processor = VideoProcessor(tmp_path / "game.ts", SimpleNamespace())
+    processor.metadata = {"duration": 10.0, "fps": 30.0, "start_time": 1.4}
+
+    assert processor.keyframe_times() == [0.0, 2.0, 4.0]
+    assert processor._keyframe_positions == [564, 20116, None]
+    assert processor.snap_to_keyframe(3.9) == 2.0
+    assert processor.snap_to_keyframe(7.5) == 4.0
+
+
+def test_load_video_fails_when_no_frame_decodes(tmp_path: Path, monkeypatch):
+    payload = {"format": {"duration": "60.0"}, "streams": [{"avg_frame_rate": "30/1"}]}
+
+    def broken_open(path):
+        raise ValueError("Invalid data found when processing input")
+
+    monkeypatch.setattr(vp_module.subprocess, "check_output", lambda cmd, **kwargs: json.dumps(payload))
+    monkeypatch.setattr(vp_module, "av", SimpleNamespace(open=broken_open))
+    processor = VideoProcessor(tmp_path / "game.ts", SimpleNamespace())
+
+    assert not processor.load_video()
+    assert not processor.is_loaded